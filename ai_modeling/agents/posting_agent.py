@@ -2,10 +2,39 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
+import os
 import re
 import json
-from ai_modeling.services.html_parser import parse_html_to_structured
+import logging
+import time
+from ai_modeling.services.ocr_document import OcrDocument, structure_from_document
+from ai_modeling.services.post_validation import (
+    QUESTION_TEMPLATES,
+    REQUIRED_FIELDS,
+    validate_post,
+)
+from ai_modeling.services.prompt_budget import (
+    budget_for,
+    estimate_tokens,
+    fit_text,
+    log_call_sizes,
+    split_to_budget,
+    truncate_to_budget,
+)
 from ai_modeling.services.providers import AIProvider, get_ai_provider
+from ai_modeling.services.result_cache import (
+    content_hash as hash_bytes,
+    file_content_hash,
+    get_result_cache,
+    provider_namespace,
+)
+
+logger = logging.getLogger(__name__)
+
+# combined: 전사 교정 + 구조화 + 누락 필드 질문을 한 번의 LLM 호출로 처리 (실패 시 multi로 폴백)
+# multi: 교정 → 추출 → 검증을 각각 호출하던 기존 방식
+VOICE_EXTRACTION_MODE = os.getenv("VOICE_EXTRACTION_MODE", "combined").strip().lower()
+
 
 class PostingAutomationAgent:
     """
@@ -13,14 +42,74 @@ class PostingAutomationAgent:
     """
 
     RAW_TEXT_MAX_LEN = 2000
-    def __init__(self, provider: AIProvider | None = None):
+    # 추출 프롬프트/후처리를 바꾸면 올려서 캐시된 추출 결과를 무효화한다.
+    EXTRACTION_VERSION = "3"
+    # merge 프롬프트에 다시 보낼 필요가 없는 필드 (raw_text는 시스템이 채운다)
+    MERGE_OMIT_FIELDS = ("raw_text", "confidence")
+
+    REQUIRED_FIELDS = REQUIRED_FIELDS
+    MISSING_FIELD_QUESTIONS = QUESTION_TEMPLATES
+
+    def __init__(self, provider: AIProvider | None = None, voice_mode: Optional[str] = None):
         self.provider = provider or get_ai_provider()
         self.provider_name = getattr(self.provider, "name", "unknown")
+        self.result_cache = get_result_cache()
+        mode = (voice_mode or VOICE_EXTRACTION_MODE).strip().lower()
+        self.voice_mode = mode if mode in ("combined", "multi") else "combined"
+
+    def transcribe(self, file_path: str, lang: str = "Kor", content_hash: Optional[str] = None) -> Dict[str, Any]:
+        """Provider STT with results cached by audio content hash."""
+        digest = content_hash or file_content_hash(file_path)
+        return self.result_cache.get_or_compute(
+            "stt",
+            digest,
+            provider_namespace(self.provider, lang),
+            lambda: self.provider.transcribe_audio(file_path, lang=lang),
+            should_store=lambda stt: bool((stt or {}).get("text", "").strip()),
+        )
 
-    def extract_from_input(self, input_data: Any, input_type: str) -> Dict[str, Any]:
+    def ocr(self, image_bytes: bytes, content_hash: Optional[str] = None) -> OcrDocument:
+        """Provider OCR as a typed document, cached by image content hash."""
+        digest = content_hash or hash_bytes(image_bytes)
+        data = self.result_cache.get_or_compute(
+            "ocr-doc",
+            digest,
+            provider_namespace(self.provider, self._ocr_cache_tag()),
+            lambda: self.provider.ocr_document(image_bytes).to_dict(),
+        )
+        return OcrDocument.from_dict(data)
+
+    def _ocr_cache_tag(self) -> str:
+        """OCR 전처리 설정 지문. OCR 캐시와 이미지 추출 캐시가 같은 값을 쓴다."""
+        preprocess = getattr(self.provider, "ocr_preprocess", None)
+        return getattr(preprocess, "cache_tag", "")
+
+    def _complete(self, call_name: str, request: Dict[str, Any]) -> str:
+        """Provider completion with prompt/completion size logging per call."""
+        started = time.perf_counter()
+        response = self.provider.generate_completion(request)
+        log_call_sizes(call_name, request, response, time.perf_counter() - started)
+        return response
+
+    def _cached_extraction(self, kind: str, digest: str, compute, variant: str = "") -> Dict[str, Any]:
+        return self.result_cache.get_or_compute(
+            kind,
+            digest,
+            provider_namespace(self.provider, f"x{self.EXTRACTION_VERSION}{variant}"),
+            compute,
+            should_store=lambda result: bool(result.get("success")),
+        )
+
+    def extract_from_input(
+        self,
+        input_data: Any,
+        input_type: str,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Unified extraction method using LLM for all input types.
         input_type: 'voice' (file_path), 'image' (bytes), 'text' (str)
+        content_hash: optional SHA-256 of the media, used as the OCR/STT cache key
         """
         schema = {
             "title": "",
@@ -46,30 +135,33 @@ class PostingAutomationAgent:
 
         # Prepare input text based on type
         if input_type == "voice":
-            stt = self.provider.transcribe_audio(input_data, lang="Kor")
+            stt = self.transcribe(input_data, lang="Kor", content_hash=content_hash)
             text = stt.get("text", "").strip()
             if not text:
                 return {"success": False, "message": "음성 인식 실패", "post": {}}
+            if self.voice_mode == "combined":
+                combined = self._extract_voice_combined(text)
+                if combined is not None:
+                    return combined
             polished = self._polish_transcript_text(text)
             final_text = polished or text
-            input_description = f"음성 입력: {final_text}"
+            input_description = f"음성 입력: {truncate_to_budget(final_text, budget_for('extract'))}"
             transcript_text = final_text
             text = final_text
         elif input_type == "image":
-            html = self.provider.ocr_image(input_data)
-            parsed = parse_html_to_structured(html)
-            
-            # Let LLM handle all the parsing - pass raw HTML and structured data
-            text = f"""
-원본 HTML: {html}
-구조화된 데이터: {parsed}
-추출된 텍스트: {parsed.get('text', '') or parsed.get('raw_text', '')}
-테이블 데이터: {parsed.get('tables', [])}
-"""
-            input_description = f"이미지 OCR 결과: {text}"
+            document = self.ocr(input_data, content_hash=content_hash)
+            if document.is_empty():
+                return {"success": False, "message": "이미지에서 텍스트를 추출하지 못했습니다.", "post": {}}
+            # OCR 텍스트/표는 한 번만 넣고, 레이아웃 휴리스틱 결과는 참고값으로만 덧붙인다.
+            text = document.to_prompt_text()
+            hints = self._layout_hints(structure_from_document(document))
+            hints_text = f"\n\n레이아웃 기반 추정값(참고용): {json.dumps(hints, ensure_ascii=False)}" if hints else ""
+            # 긴 전단지는 중복 줄을 없애고, 예산을 넘으면 스키마 관련 줄(모집/시급/주소/근무...)을 우선 남긴다.
+            ocr_budget = max(budget_for("extract") - estimate_tokens(hints_text), 200)
+            input_description = f"이미지 OCR 결과:\n{fit_text(text, ocr_budget)}{hints_text}"
         elif input_type == "text":
             text = input_data
-            input_description = f"텍스트 입력: {text}"
+            input_description = f"텍스트 입력: {fit_text(text, budget_for('extract'))}"
         else:
             return {"success": False, "message": "지원하지 않는 입력 타입", "post": {}}
 
@@ -140,24 +232,36 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
                 result["transcript"] = transcript_text
             return result
 
-        response = self.provider.generate_completion(completion_request)
+        response = self._complete("extract", completion_request)
         response = self._normalize_llm_response(response)
 
-        # Parse the JSON response - should be pure JSON now. If parsing fails,
-        # try several progressively aggressive recovery strategies.
+        structured_data = self._parse_json_object(response, "title")
+        if structured_data is not None:
+            return attach_success(structured_data)
+
+        # 원본/정리본 응답은 개발 중 디버깅용이라 DEBUG에서만 만든다.
+        if logger.isEnabledFor(logging.DEBUG):
+            cleaned = re.sub(r'id:[0-9a-fA-F-]+event:\w+', '', response)
+            cleaned = re.sub(r'event:\w+', '', cleaned)
+            cleaned = re.sub(r'id:[0-9a-fA-F-]+', '', cleaned)
+            cleaned = re.sub(r'\s+', ' ', cleaned).strip()
+            logger.debug("Unparseable LLM response (raw): %r", response)
+            logger.debug("Unparseable LLM response (cleaned): %r", cleaned)
+        raise ValueError("LLM 응답이 유효한 JSON이 아닙니다. 디버그 로그를 확인하세요.")
+
+    @staticmethod
+    def _parse_json_object(response: str, required_key: str) -> Optional[Dict[str, Any]]:
+        """Parse an LLM JSON answer, trying progressively aggressive recovery strategies.
+
+        Only accepts a dict that contains ``required_key`` (i.e. looks like our schema).
+        """
         def try_load(s: str):
             return json.loads(s)
 
-        # 1) Direct parse - only accept if it looks like our schema (has 'title')
-        try:
-            structured_data = try_load(response.strip())
-            if isinstance(structured_data, dict) and 'title' in structured_data:
-                return attach_success(structured_data)
-        except Exception:
-            pass
-
-        # Debug print for the raw response (helpful during development)
-        print("LLM 응답 디버깅 (원본):", repr(response))
+        def accept(candidate: Any) -> Optional[Dict[str, Any]]:
+            if isinstance(candidate, dict) and required_key in candidate:
+                return candidate
+            return None
 
         def _cleanup_candidate(candidate: str) -> str:
             candidate = re.sub(r'id:[0-9a-fA-F-]+event:\w+', '', candidate)
@@ -165,6 +269,14 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
             candidate = re.sub(r'id:[0-9a-fA-F-]+', '', candidate)
             return candidate.strip()
 
+        # 1) Direct parse
+        try:
+            found = accept(try_load(response.strip()))
+            if found is not None:
+                return found
+        except Exception:
+            pass
+
         # 2) Extract fenced ```json ... ``` block (allow missing closing fence)
         for pattern in [
             r'```json\s*(\{.*?\})\s*```',
@@ -173,10 +285,9 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
             try:
                 m = re.search(pattern, response, re.DOTALL)
                 if m:
-                    candidate = _cleanup_candidate(m.group(1))
-                    structured_data = try_load(candidate)
-                    if isinstance(structured_data, dict) and 'title' in structured_data:
-                        return attach_success(structured_data)
+                    found = accept(try_load(_cleanup_candidate(m.group(1))))
+                    if found is not None:
+                        return found
             except Exception:
                 pass
 
@@ -184,55 +295,154 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
         try:
             m = re.search(r'event:result\s*(\{.*?\})\s*(?:event:signal|$)', response, re.DOTALL)
             if m:
-                candidate = _cleanup_candidate(m.group(1))
-                structured_data = try_load(candidate)
-                if isinstance(structured_data, dict) and 'title' in structured_data:
-                    return attach_success(structured_data)
+                found = accept(try_load(_cleanup_candidate(m.group(1))))
+                if found is not None:
+                    return found
         except Exception:
             pass
 
         # 4) Heuristic: take from first '{' to last '}' and try to parse
-        try:
-            first = response.find('{')
-            last = response.rfind('}')
-            if first != -1 and last != -1 and last > first:
-                candidate = _cleanup_candidate(response[first:last+1])
-                structured_data = try_load(candidate)
-                if isinstance(structured_data, dict) and 'title' in structured_data:
-                    return attach_success(structured_data)
-        except Exception:
-            pass
-
         # 5) Remove code fences entirely and retry once more
+        for source in (response, response.replace("```json", "").replace("```", "").strip()):
+            try:
+                first = source.find('{')
+                last = source.rfind('}')
+                if first != -1 and last != -1 and last > first:
+                    found = accept(try_load(_cleanup_candidate(source[first:last+1])))
+                    if found is not None:
+                        return found
+            except Exception:
+                pass
+        return None
+
+    def _extract_voice_combined(self, transcript: str) -> Optional[Dict[str, Any]]:
+        """Polish + extract + missing-field questions in one LLM round trip.
+
+        Returns None when the answer cannot be used, so the caller falls back to the
+        multi-call path. ``validation`` has the same shape as ``check_missing_fields``.
+        """
+        prompt = f"""
+아래는 음성 인식(STT) 결과입니다. 한 번에 다음 세 가지를 수행하세요.
+1) transcript: 뜻은 바꾸지 말고 맞춤법과 띄어쓰기만 교정한 문장
+2) post: 교정한 문장에서 구인 공고 정보를 구조화한 JSON
+3) missing_fields / questions: post에서 비어 있는 필수 필드와, 각 필드를 사용자에게 되물을 짧은 한국어 질문
+
+필수 필드: {", ".join(self.REQUIRED_FIELDS)}
+
+[중요] 반드시 아래 JSON 형식으로만 응답하세요. 다른 텍스트, 설명, 코드블록, 마크다운을 절대 추가하지 마세요.
+
+{{
+    "transcript": "교정된 문장",
+    "post": {{
+        "title": "공고 제목",
+        "category": "카테고리",
+        "region": "지역",
+        "address": "상세 주소",
+        "schedule_days": ["요일1", "요일2"],
+        "time_slots": ["시간대"],
+        "start_time": "시작시간",
+        "end_time": "종료시간",
+        "frequency": "빈도",
+        "participants": 숫자,
+        "wage_type": "hourly",
+        "hourly_wage": 숫자,
+        "wage_amount": "급여설명",
+        "qualifications": ["자격요건1"],
+        "description": "자세한 설명",
+        "raw_text": "",
+        "confidence": {{}}
+    }},
+    "missing_fields": ["필드명"],
+    "questions": {{"필드명": "질문"}}
+}}
+
+규칙:
+- 모든 값은 한국어로 작성
+- schedule_days: "월요일에서 금요일까지" → ["월요일", "화요일", "수요일", "목요일", "금요일"]
+- start_time/end_time: "14:00:00" 형식으로 변환
+- participants, hourly_wage: 계산된 숫자만 기재 (예: "한 명" → 1, "15000원" → 15000)
+- 빈 값은 빈 문자열 "" 또는 빈 배열 [] 사용, 추측하지 마세요
+- post.raw_text 값은 항상 빈 문자열 "" 로 두세요 (시스템이 자동으로 채웁니다)
+
+음성 인식 결과:
+{truncate_to_budget(transcript, budget_for("extract"))}
+"""
+        request = {
+            "messages": [
+                {"role": "system", "content": [{"type": "text", "text": (
+                    "You are a JSON-only extractor for Korean voice job posts.\n"
+                    "Return exactly one JSON object that matches the schema provided.\n"
+                    "Do NOT include any explanations, markdown, code fences, or extra text."
+                )}]},
+                {"role": "user", "content": [{"type": "text", "text": prompt}]}
+            ],
+            # 교정 문장 + 공고 JSON을 함께 돌려받으므로 단일 추출보다 여유 있게 잡는다.
+            "maxTokens": 1500,
+            "temperature": 0.0,
+            "stream": False
+        }
+
         try:
-            fence_stripped = response.replace("```json", "").replace("```", "").strip()
-            first = fence_stripped.find('{')
-            last = fence_stripped.rfind('}')
-            if first != -1 and last != -1 and last > first:
-                candidate = _cleanup_candidate(fence_stripped[first:last+1])
-                structured_data = try_load(candidate)
-                if isinstance(structured_data, dict) and 'title' in structured_data:
-                    return attach_success(structured_data)
-        except Exception:
-            pass
+            response = self._normalize_llm_response(self._complete("voice_combined", request))
+        except Exception as exc:
+            logger.warning("Combined voice extraction failed, falling back to multi-step: %s", exc)
+            return None
 
-        # If all recovery attempts fail, include the cleaned candidate snippets in the debug
-        cleaned = re.sub(r'id:[0-9a-fA-F-]+event:\w+', '', response)
-        cleaned = re.sub(r'event:\w+', '', cleaned)
-        cleaned = re.sub(r'id:[0-9a-fA-F-]+', '', cleaned)
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        print("LLM 응답 디버깅 (정리):", repr(cleaned))
-        raise ValueError("LLM 응답이 유효한 JSON이 아닙니다. 디버그 로그를 확인하세요.")
+        parsed = self._parse_json_object(response, "post")
+        post = parsed.get("post") if parsed else None
+        if not isinstance(post, dict) or "title" not in post:
+            logger.warning("Combined voice extraction response unparseable, falling back to multi-step")
+            return None
+
+        polished = str(parsed.get("transcript") or "").strip() or transcript
+        post["raw_text"] = polished[:self.RAW_TEXT_MAX_LEN]
+
+        # 누락 여부는 LLM 판단 대신 규칙 검증(정규화 포함)으로 다시 계산하고, 질문만 LLM 문구를 우선 쓴다.
+        llm_questions = parsed.get("questions") if isinstance(parsed.get("questions"), dict) else {}
+        missing = validate_post(post).unresolved
+        questions = [
+            str(llm_questions.get(f) or "").strip() or self.MISSING_FIELD_QUESTIONS[f]
+            for f in missing
+        ]
+        return {
+            "success": True,
+            "post": post,
+            "transcript": polished,
+            "validation": {
+                "needs_clarification": len(missing) > 0,
+                "missing_fields": missing,
+                "questions": questions,
+            },
+        }
 
-    def extract_from_voice(self, file_path: str) -> Dict[str, Any]:
-        return self.extract_from_input(file_path, "voice")
+    def extract_from_voice(self, file_path: str, content_hash: Optional[str] = None) -> Dict[str, Any]:
+        digest = content_hash or file_content_hash(file_path)
+        return self._cached_extraction(
+            "post-voice",
+            digest,
+            lambda: self.extract_from_input(file_path, "voice", content_hash=digest),
+            variant="c" if self.voice_mode == "combined" else "",
+        )
 
-    def extract_from_image_bytes(self, image_bytes: bytes) -> Dict[str, Any]:
-        return self.extract_from_input(image_bytes, "image")
+    def extract_from_image_bytes(self, image_bytes: bytes, content_hash: Optional[str] = None) -> Dict[str, Any]:
+        digest = content_hash or hash_bytes(image_bytes)
+        return self._cached_extraction(
+            "post-image",
+            digest,
+            lambda: self.extract_from_input(image_bytes, "image", content_hash=digest),
+            # 전처리 설정이 바뀌면 OCR 결과가 달라지므로 추출 결과도 따로 캐시한다.
+            variant=f"-{self._ocr_cache_tag()}",
+        )
 
     def extract_from_text(self, text: str) -> Dict[str, Any]:
         return self.extract_from_input(text, "text")
 
+    @staticmethod
+    def _layout_hints(parsed: Dict[str, Any]) -> Dict[str, Any]:
+        """Heuristic fields from the table layout, minus the raw text/table copies."""
+        keys = ("title", "participants", "hourly_wage", "monthly_wage", "address", "client", "description")
+        return {key: parsed[key] for key in keys if parsed.get(key) not in (None, "", 0, "미상")}
+
     def _append_raw_text(self, existing: str, addition: str) -> str:
         """Append text while keeping overall length bounded."""
         base = (existing or "").strip()
@@ -262,12 +472,27 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
     def _polish_transcript_text(self, text: str) -> str:
         """
         Clean up STT output to fix spacing and obvious typos using the provider LLM.
-        Returns the original text if polishing fails.
+        Long transcripts are polished in ``polish``-budget chunks; falls back to the original text per chunk.
         """
         cleaned = (text or "").strip()
         if not cleaned:
             return ""
 
+        # 교정 결과는 입력만큼 길어지므로 예산 단위로 나눠 교정한다. 추출 프롬프트에 들어갈
+        # 분량(extract 예산)을 넘는 뒷부분은 어차피 잘리므로 호출하지 않고 원문 그대로 붙인다.
+        remaining = budget_for("extract")
+        polished: list[str] = []
+        for chunk in split_to_budget(cleaned, budget_for("polish")):
+            cost = estimate_tokens(chunk)
+            if remaining <= 0 or cost > budget_for("polish"):
+                polished.append(chunk)
+                continue
+            remaining -= cost
+            polished.append(self._polish_chunk(chunk))
+        return " ".join(polished)
+
+    def _polish_chunk(self, cleaned: str) -> str:
+        """One polish call; returns ``cleaned`` unchanged if the call fails."""
         prompt = (
             "다음 음성 인식 결과 문장을 자연스러운 한국어로 맞춤법과 띄어쓰기를 교정해 주세요.\n"
             "뜻은 변경하지 말고, 결과만 한 문단의 텍스트로 출력하세요.\n\n"
@@ -288,7 +513,7 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
         }
 
         try:
-            response = self.provider.generate_completion(request)
+            response = self._complete("polish", request)
             normalized = (response or "").strip()
             normalized = re.sub(r"^교정된 문장[:：]\s*", "", normalized, flags=re.IGNORECASE)
             if normalized.startswith(("\"", "“")) and normalized.endswith(("\"", "”")) and len(normalized) > 1:
@@ -309,7 +534,7 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
                 value = context.get(key)
                 if value and isinstance(value, str):
                     context_lines.append(f"{key}: {value.strip()}")
-        context_snippet = "\n".join(context_lines[:4])
+        context_snippet = truncate_to_budget("\n".join(context_lines[:4]), budget_for("address"))
 
         prompt = f"""
 다음 위치 설명을 기반으로 구글 지도에서 검색 가능한 행정 주소(도로명 주소 또는 지번 주소)를 한 문장으로 작성해주세요.
@@ -336,7 +561,7 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
         }
 
         try:
-            response = self.provider.generate_completion(request)
+            response = self._complete("address", request)
             normalized = (response or "").strip()
             normalized = normalized.replace("주소:", "").replace("주소 :", "").strip()
             if normalized.startswith(("\"", "“")) and normalized.endswith(("\"", "”")) and len(normalized) > 1:
@@ -351,180 +576,88 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
         Check for missing or empty important fields and return a structure
         used by the router to decide whether clarification is needed.
 
+        Rule-based validation (post_validation) runs first and normalizes times,
+        wages and day lists in place; the LLM is asked only about fields that are
+        malformed or missing-with-hints in the raw text.
+
         Returns:
           { needs_clarification: bool,
             missing_fields: List[str],
             questions: List[str] }
         """
-        required = [
-            "title",
-            "region",
-            "schedule_days",
-            "start_time",
-            "participants",
-            "hourly_wage",
-            "description",
-        ]
-        
-        missing = []
-        questions = []
-        # simple emptiness checks
-        for f in required:
-            val = post.get(f)
-            empty = False
-            if val is None:
-                empty = True
-            elif isinstance(val, str) and val.strip() == "":
-                empty = True
-            elif isinstance(val, (list, dict)) and len(val) == 0:
-                empty = True
-            elif isinstance(val, (int, float)) and val == 0:
-                # wage or participants could be 0 meaning missing
-                if f in ("participants", "hourly_wage"):
-                    empty = True
-
-            if empty:
-                missing.append(f)
-                # generate a simple Korean question for each field
-                if f == "title":
-                    questions.append("공고 제목을 알려주시겠어요?")
-                elif f == "region":
-                    questions.append("어느 지역에서 근무하시나요? (예: 서울 송파구)")
-                elif f == "schedule_days":
-                    questions.append("근무 가능한 요일을 알려주세요. (예: 월~금 또는 월,수,금)")
-                elif f == "start_time":
-                    questions.append("근무 시작 시간을 알려주세요. (예: 오전 9시 -> 09:00)")
-                elif f == "participants":
-                    questions.append("몇 명을 모집하시나요?")
-                elif f == "hourly_wage":
-                    questions.append("희망 시급을 알려주세요. (예: 15000원)")
-                elif f == "description":
-                    questions.append("공고에 들어갈 자세한 설명을 추가로 해주세요.")
-
-        # confidence map to record any inferred values
-        confidence_map = post.get("confidence", {}) or {}
-
-        # If there are missing fields, attempt lightweight inference before asking the user.
-        # 1) Heuristic fills from raw_text/description
-        if len(missing) > 0:
-            rt = (post.get("raw_text") or "") + "\n" + (post.get("description") or "")
-            # title heuristics
-            if "title" in missing:
-                if "산책" in rt or "산책" in (post.get("description") or ""):
-                    post["title"] = "반려동물 산책 도우미"
-                    confidence_map["title"] = 0.6
-                    missing.remove("title")
-            # schedule_days heuristics: if text contains '하루' but no specific 요일, do not assume days
-            # start_time heuristics: look for time expressions like '오전 9시', '9시'
-            if "start_time" in missing:
-                m = re.search(r"(오전|오후)?\s*(\d{1,2})시", rt)
-                if m:
-                    meridiem = m.group(1) or ""
-                    hour = int(m.group(2))
-                    if meridiem == "오후" and hour < 12:
-                        hour += 12
-                    post["start_time"] = f"{hour:02d}:00:00"
-                    confidence_map["start_time"] = 0.7
-                    missing.remove("start_time")
-            # hourly_wage heuristics
-            if "hourly_wage" in missing:
-                m = re.search(r"(\d{3,6})\s*원", rt)
+        report = validate_post(post)
+        if report.llm_fields:
+            # LLM이 채운 값도 같은 규칙으로 다시 검증한다.
+            if self._infer_fields(post, report.llm_fields):
+                report = validate_post(post)
+        return report.to_result()
+
+    def _infer_fields(self, post: Dict[str, Any], fields: List[str]) -> bool:
+        """Ask the LLM to infer ``fields`` with confidence scores; returns True if any was filled."""
+        confidence_map = post.get("confidence") or {}
+        try:
+            to_infer = {k: post.get(k) for k in fields}
+            # 원문은 처음(원래 입력)과 끝(추가 답변)을 남기고, 설명과 합쳐 예산 안에 맞춘다.
+            infer_budget = budget_for("infer_missing")
+            description = truncate_to_budget(post.get("description") or "", infer_budget // 4)
+            raw_text = truncate_to_budget(
+                post.get("raw_text") or "",
+                max(infer_budget - estimate_tokens(description), 100),
+                keep="ends",
+            )
+            prompt = (
+                "다음은 이미 추출된 공고 데이터와 원문입니다. 누락되었거나 형식이 잘못된 필드에 대해 가능한 한 추론해 주십시오."
+                " 반드시 JSON 객체로만 응답하세요. 반환 형식은 {\"field\": {\"value\": ..., \"confidence\": 0.0}} 입니다."
+                " confidence는 0.0~1.0 사이 실수로, 0.6 이상이면 신뢰 가능한 값으로 간주합니다.\n\n"
+                f"원문:\n{raw_text}\n설명:\n{description}\n추론할 필드(현재 값):\n{json.dumps(to_infer, ensure_ascii=False)}"
+            )
+
+            request = {
+                "messages": [
+                    {"role": "system", "content": [{"type": "text", "text": (
+                        "You are an assistant that infers missing JSON fields from given text."
+                    )}]},
+                    {"role": "user", "content": [{"type": "text", "text": prompt}]}
+                ],
+                "maxTokens": 400,
+                "temperature": 0.0,
+                "stream": False
+            }
+
+            inferred_text = self._complete("infer_missing", request)
+            # parse LLM response
+            inferred = None
+            try:
+                inferred = json.loads(inferred_text)
+            except Exception:
+                # try fenced JSON
+                m = re.search(r'```json\s*(\{.*?\})\s*```', inferred_text, re.DOTALL)
                 if m:
                     try:
-                        post["hourly_wage"] = int(m.group(1))
-                        post["wage_amount"] = f"{m.group(1)}원"
-                        confidence_map["hourly_wage"] = 0.7
-                        missing.remove("hourly_wage")
+                        inferred = json.loads(m.group(1))
                     except Exception:
-                        pass
-
-        # 2) If still missing and LLM is available, ask LLM to infer values with confidence scores.
-        if len(missing) > 0:
-            try:
-                # Build a compact prompt instructing the LLM to infer only missing fields
-                to_infer = {k: post.get(k) for k in missing}
-                prompt = (
-                    "다음은 이미 추출된 공고 데이터와 원문입니다. 누락된 필드에 대해 가능한 한 추론해 주십시오."
-                    " 반드시 JSON 객체로만 응답하세요. 반환 형식은 {\"field\": {\"value\": ..., \"confidence\": 0.0}} 입니다."
-                    " confidence는 0.0~1.0 사이 실수로, 0.6 이상이면 신뢰 가능한 값으로 간주합니다.\n\n"
-                    f"원문:\n{(post.get('raw_text') or '')}\n설명:\n{(post.get('description') or '')}\n현재 누락 필드:\n{json.dumps(to_infer, ensure_ascii=False)}"
-                )
-
-                request = {
-                    "messages": [
-                        {"role": "system", "content": [{"type": "text", "text": (
-                            "You are an assistant that infers missing JSON fields from given text."
-                        )}]},
-                        {"role": "user", "content": [{"type": "text", "text": prompt}]}
-                    ],
-                    "maxTokens": 400,
-                    "temperature": 0.0,
-                    "stream": False
-                }
-
-                inferred_text = self.provider.generate_completion(request)
-                # parse LLM response
-                inferred = None
-                try:
-                    inferred = json.loads(inferred_text)
-                except Exception:
-                    # try fenced JSON
-                    m = re.search(r'```json\s*(\{.*?\})\s*```', inferred_text, re.DOTALL)
-                    if m:
-                        try:
-                            inferred = json.loads(m.group(1))
-                        except Exception:
-                            inferred = None
-
-                if isinstance(inferred, dict):
-                    for field, info in inferred.items():
-                        if field in missing and isinstance(info, dict):
-                            val = info.get("value")
-                            conf = info.get("confidence", 0)
-                            try:
-                                conf = float(conf)
-                            except Exception:
-                                conf = 0
-                            if conf >= 0.6 and val not in (None, "", [], {}):
-                                post[field] = val
-                                confidence_map[field] = conf
-                    # recompute missing/questions
-                    new_missing = []
-                    new_questions = []
-                    for f in ["title","region","schedule_days","start_time","participants","hourly_wage","description"]:
-                        v = post.get(f)
-                        is_empty = (v is None or (isinstance(v,str) and v.strip()=="") or (isinstance(v,(list,dict)) and len(v)==0) or (isinstance(v,(int,float)) and v==0 and f in ("participants","hourly_wage")))
-                        if is_empty:
-                            new_missing.append(f)
-                            # same question mapping as before
-                            if f == "title":
-                                new_questions.append("공고 제목을 알려주시겠어요?")
-                            elif f == "region":
-                                new_questions.append("어느 지역에서 근무하시나요? (예: 서울 송파구)")
-                            elif f == "schedule_days":
-                                new_questions.append("근무 가능한 요일을 알려주세요. (예: 월~금 또는 월,수,금)")
-                            elif f == "start_time":
-                                new_questions.append("근무 시작 시간을 알려주세요. (예: 오전 9시 -> 09:00)")
-                            elif f == "participants":
-                                new_questions.append("몇 명을 모집하시나요?")
-                            elif f == "hourly_wage":
-                                new_questions.append("희망 시급을 알려주세요. (예: 15000원)")
-                            elif f == "description":
-                                new_questions.append("공고에 들어갈 자세한 설명을 추가로 해주세요.")
-                    missing = new_missing
-                    questions = new_questions
-            except Exception:
-                # if LLM inference fails, silently continue and ask original questions
-                pass
-
+                        inferred = None
+        except Exception:
+            # if LLM inference fails, silently continue and ask the template questions
+            return False
+
+        filled = False
+        if isinstance(inferred, dict):
+            for field, info in inferred.items():
+                if field in fields and isinstance(info, dict):
+                    val = info.get("value")
+                    conf = info.get("confidence", 0)
+                    try:
+                        conf = float(conf)
+                    except Exception:
+                        conf = 0
+                    if conf >= 0.6 and val not in (None, "", [], {}):
+                        post[field] = val
+                        confidence_map[field] = conf
+                        filled = True
         # attach confidence map back to post for caller visibility
         post["confidence"] = confidence_map
-
-        return {
-            "needs_clarification": len(missing) > 0,
-            "missing_fields": missing,
-            "questions": questions,
-        }
+        return filled
 
     def merge_additional_input(self, post: Dict[str, Any], additional_text: str) -> Dict[str, Any]:
         """
@@ -533,7 +666,14 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
         Primary attempt: ask the LLM to merge and return a full JSON object matching
         the schema. If LLM fails, perform a lightweight heuristic merge.
         """
-        # Build a small prompt describing the current post and the new text
+        # Build a small prompt describing the current post and the new text.
+        # raw_text/confidence는 다시 보내지 않고, JSON도 공백 없이 직렬화해 토큰을 아낀다.
+        current = {k: v for k, v in post.items() if k not in self.MERGE_OMIT_FIELDS}
+        current_json = json.dumps(current, ensure_ascii=False, separators=(",", ":"))
+        extra_text = truncate_to_budget(
+            additional_text or "",
+            max(budget_for("merge") - estimate_tokens(current_json), 100),
+        )
         prompt = f"""
 아래는 이미 생성된 공고의 현재 상태입니다. 일부 필드가 비어있습니다.
 이제 추가 음성에서 추출한 텍스트를 사용해 누락된 필드를 채워주세요.
@@ -561,10 +701,10 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
 }}
 
 현재 공고:
-{json.dumps(post, ensure_ascii=False, indent=2)}
+{current_json}
 
 추가 텍스트:
-{additional_text}
+{extra_text}
 
 주의: 가능한 한 기존 값을 유지하고, 추가 텍스트에서 확실히 알 수 있는 값만 덮어쓰세요.
 """
@@ -582,9 +722,10 @@ JSON 시작과 끝 외에 어떤 문자도 출력하지 마세요.
         }
 
         try:
-            merged_text = self.provider.generate_completion(request)
+            merged_text = self._complete("merge", request)
             try:
                 merged = json.loads(merged_text)
+                merged.setdefault("confidence", post.get("confidence") or {})
                 # Ensure raw_text contains concatenated inputs for traceability
                 merged["raw_text"] = self._append_raw_text(post.get("raw_text", ""), additional_text)
                 return merged
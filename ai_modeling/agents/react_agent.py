@@ -5,13 +5,29 @@ Agent가 자율적으로 도구를 선택하고 실행하며,
 피드백을 받아 재시도 또는 다른 전략을 시도하는 진정한 Agent 구현
 """
 import json
+import logging
 import math
+import os
 import re
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from ai_modeling.agents.tools.toolkit import AgentToolkit, ToolResult
 from ai_modeling.services.providers import AIProvider, get_ai_provider
+from ai_modeling.services.resilience import get_guard
+from ai_modeling.utils.metrics import timed
 from ai_modeling.utils.rag_paths import resolve_rag_csv_path
+from ai_modeling.utils.trace_store import get_trace_store
+
+# 응답에 담는 추론 기록 수준
+# - none: 반복 횟수만
+# - summary: Thought/Action + Observation 요약 (결과 개수, job_id 일부)
+# - full: summary + Tool 결과 전체를 trace store에 저장하고 trace_id 반환
+TRACE_LEVELS = ("none", "summary", "full")
+REACT_TRACE_LEVEL = os.getenv("REACT_TRACE_LEVEL", "summary").strip().lower()
+TRACE_SAMPLE_IDS = 10
+
+logger = logging.getLogger(__name__)
 
 
 class ReActThought:
@@ -56,6 +72,55 @@ class ReActObservation:
             "analysis": self.analysis
         }
 
+    def to_summary_dict(self):
+        """Tool 결과 목록 대신 개수와 앞쪽 job_id만 남긴 요약"""
+        summary = {
+            "success": self.success,
+            "message": self.message,
+            "analysis": self.analysis
+        }
+        if isinstance(self.data, list):
+            summary["result_count"] = len(self.data)
+            summary["job_ids"] = [
+                item.get("job_id") for item in self.data[:TRACE_SAMPLE_IDS] if isinstance(item, dict)
+            ]
+        else:
+            summary["data"] = self.data
+        return summary
+
+
+@dataclass
+class ReActRunContext:
+    """한 번의 ``run`` 호출에만 속하는 추론 기록.
+
+    Agent 인스턴스는 오케스트레이터 캐시를 통해 여러 요청 스레드가 공유하므로, 반복 횟수와
+    Thought/Action/Observation 기록은 인스턴스가 아니라 실행마다 새로 만든 이 객체에 쌓는다.
+    """
+    iteration_count: int = 0
+    thoughts: List[ReActThought] = field(default_factory=list)
+    actions: List[ReActAction] = field(default_factory=list)
+    observations: List[ReActObservation] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "iterations": self.iteration_count,
+            "thoughts": [t.to_dict() for t in self.thoughts],
+            "actions": [a.to_dict() for a in self.actions],
+            "observations": [o.to_dict() for o in self.observations]
+        }
+
+    def to_summary_dict(self) -> Dict[str, Any]:
+        return {
+            "iterations": self.iteration_count,
+            "thoughts": [t.to_dict() for t in self.thoughts],
+            # user_profile은 매 Action마다 같은 값이라 요약에서는 뺀다.
+            "actions": [
+                {"tool": a.tool, "params": {k: v for k, v in a.params.items() if k != "user_profile"}}
+                for a in self.actions
+            ],
+            "observations": [o.to_summary_dict() for o in self.observations]
+        }
+
 
 class ReActAgent:
     """
@@ -74,25 +139,29 @@ class ReActAgent:
         max_per_title: int = 2,
         desired_k: int = 5,
         provider: Optional[AIProvider] = None,
+        trace_level: Optional[str] = None,
     ):
         self.provider = provider or get_ai_provider()
         self.provider_name = getattr(self.provider, "name", "unknown")
+        self.trace_level = self._resolve_trace_level(trace_level)
         self.csv_path = csv_path or str(resolve_rag_csv_path())
         self.toolkit = AgentToolkit(self.csv_path, provider=self.provider)
         self.max_iterations = 8  # diversity를 위해 더 많은 시도 허용
-        self.iteration_count = 0
         # diversity settings (configurable)
         # 최대 같은 title 허용 개수 (기본 2)
         self.max_per_title = max_per_title
         # 최종 추천 수
         self.desired_k = desired_k
-        
-        # 추론 과정 기록
-        self.thoughts: List[ReActThought] = []
-        self.actions: List[ReActAction] = []
-        self.observations: List[ReActObservation] = []
+        # 추론 과정 기록은 run마다 ReActRunContext에 남긴다 (인스턴스는 요청 간에 공유됨).
     
-    def run(self, user_profile: Dict[str, Any], intent: str = "", previous_recommendations: List[Dict] = None) -> Dict[str, Any]:
+    @timed("react", "run")
+    def run(
+        self,
+        user_profile: Dict[str, Any],
+        intent: str = "",
+        previous_recommendations: List[Dict] = None,
+        trace_level: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Agent 실행: ReAct 루프
         
@@ -100,94 +169,94 @@ class ReActAgent:
             user_profile: 사용자 정보 (지역, 경험, 선호도 등)
             intent: 사용자 의도 (음성 또는 추가 요청)
             previous_recommendations: 이전 추천 결과 (재추천 시 사용)
+            trace_level: 이번 실행의 추론 기록 수준 (none / summary / full, 기본은 인스턴스 설정)
         
         Returns:
             최종 추천 결과
         """
         if previous_recommendations is None:
             previous_recommendations = []
-        print(f"\n{'='*60}")
-        print(f"🤖 ReAct Agent 시작")
-        print(f"{'='*60}")
-        
-        self.iteration_count = 0
-        self.thoughts = []
-        self.actions = []
-        self.observations = []
+        logger.debug("ReAct run started (max_iterations=%d)", self.max_iterations)
         
+        ctx = ReActRunContext()
         final_recommendations = []
         
         # ReAct 루프 시작
         for iteration in range(self.max_iterations):
-            self.iteration_count = iteration + 1
-            print(f"\n[Iteration {self.iteration_count}/{self.max_iterations}]")
-            
-            # =========== 1️⃣ THOUGHT: 현재 상황 분석 ===========
-            thought = self._think(user_profile, intent, final_recommendations, self.observations, previous_recommendations)
-            self.thoughts.append(thought)
+            if not get_guard("llm").is_available():
+                # LLM circuit이 열려 있으면 루프를 돌지 않고 바로 latest_jobs 폴백으로 간다.
+                logger.info("LLM circuit open, skipping ReAct loop (fallback to latest_jobs)")
+                break
+            with timed("react", "iteration"):
+                ctx.iteration_count = iteration + 1
+                logger.debug("Iteration %d/%d", ctx.iteration_count, self.max_iterations)
             
-            print(f"💭 Thought: {thought.content}")
-            if thought.reasoning:
-                print(f"   Reasoning: {thought.reasoning}")
+                # =========== 1️⃣ THOUGHT: 현재 상황 분석 ===========
+                thought = self._think(user_profile, intent, final_recommendations, ctx.observations, previous_recommendations)
+                ctx.thoughts.append(thought)
             
-            # =========== 종료 조건 확인 ===========
-            if self._should_stop(thought, final_recommendations):
-                print(f"✅ 충분한 결과 얻음 - 루프 종료")
-                break
+                logger.debug("Thought: %s | reasoning: %s", thought.content, thought.reasoning)
             
-            # =========== 2️⃣ ACTION: Tool 선택 및 실행 ===========
-            action = self._choose_and_execute_action(thought, user_profile, intent)
-            self.actions.append(action)
+                # =========== 종료 조건 확인 ===========
+                if self._should_stop(thought, final_recommendations):
+                    logger.debug("Enough results, stopping loop")
+                    break
             
-            print(f"🔧 Action: {action.tool}")
-            print(f"   Params: {json.dumps(action.params, ensure_ascii=False, indent=2)}")
+                # =========== 2️⃣ ACTION: Tool 선택 및 실행 ===========
+                action = self._choose_and_execute_action(thought, user_profile, intent)
+                ctx.actions.append(action)
             
-            # =========== 3️⃣ OBSERVATION: 결과 평가 ===========
-            # Tool 실행 및 결과 기록
-            tool_result = self.toolkit.execute_tool(action.tool, **action.params)
+                # 파라미터 값(사용자 프로필 포함)은 로그에 남기지 않고 키만 남긴다.
+                logger.debug("Action: %s params=%s", action.tool, list(action.params))
             
-            # 결과 분석
-            observation = self._analyze_observation(
-                tool_result,
-                user_profile,
-                final_recommendations
-            )
-            self.observations.append(observation)
+                # =========== 3️⃣ OBSERVATION: 결과 평가 ===========
+                # Tool 실행 및 결과 기록
+                tool_result = self.toolkit.execute_tool(action.tool, **action.params)
             
-            print(f"📊 Observation: {observation.analysis}")
-            print(f"   Result count: {len(observation.data) if isinstance(observation.data, list) else 'N/A'}")
+                # 결과 분석
+                observation = self._analyze_observation(
+                    tool_result,
+                    user_profile,
+                    final_recommendations
+                )
+                ctx.observations.append(observation)
             
-            # 성공한 경우 최종 결과에 추가
-            if observation.success and isinstance(observation.data, list):
-                final_recommendations = self._merge_recommendations(
-                    final_recommendations,
-                    observation.data
+                logger.debug(
+                    "Observation: %s (results=%s)",
+                    observation.analysis,
+                    len(observation.data) if isinstance(observation.data, list) else "N/A",
                 )
-                print(f"   누적 결과: {len(final_recommendations)}개")
+            
+                # 성공한 경우 최종 결과에 추가
+                if observation.success and isinstance(observation.data, list):
+                    final_recommendations = self._merge_recommendations(
+                        final_recommendations,
+                        observation.data
+                    )
+                    logger.debug("Accumulated %d recommendations", len(final_recommendations))
         
         # 루프 종료 후: 만약 추천이 하나도 없다면 안전한 대체(fallback)로 최신 공고를 가져와 채웁니다.
         if not final_recommendations:
             try:
-                print("[FALLBACK] 루프 종료 후 추천 없음 -> latest_jobs로 대체 시도")
+                logger.info("No recommendations after ReAct loop, falling back to latest_jobs")
                 latest_res = self.toolkit.latest_jobs(user_profile=user_profile, top_k=self.desired_k)
                 if latest_res.success and isinstance(latest_res.data, list) and latest_res.data:
                     final_recommendations = latest_res.data
-                    print(f"[FALLBACK] latest_jobs에서 {len(final_recommendations)}개 가져옴")
+                    logger.debug("latest_jobs fallback returned %d jobs", len(final_recommendations))
                 else:
-                    print("[FALLBACK] latest_jobs에서도 결과를 얻지 못함")
+                    logger.warning("latest_jobs fallback returned no jobs")
             except Exception as e:
-                print(f"[FALLBACK] latest_jobs 호출 중 예외: {e}")
+                logger.warning("latest_jobs fallback failed: %s", e)
 
         # 최종 정리
         final_answer = self._compile_final_answer(
             user_profile,
             intent,
-            final_recommendations
+            final_recommendations,
+            ctx,
+            self._resolve_trace_level(trace_level) if trace_level else self.trace_level
         )
-        
-        print(f"\n{'='*60}")
-        print(f"🎯 ReAct Agent 완료")
-        print(f"{'='*60}\n")
+        logger.debug("ReAct run finished after %d iterations", ctx.iteration_count)
         
         return final_answer
     
@@ -295,7 +364,7 @@ class ReActAgent:
             )
         
         except Exception as e:
-            print(f"[ERROR] Thought 생성 실패: {e}")
+            logger.warning("Thought generation failed: %s", e)
             return ReActThought(
                 content="기본 검색 시도",
                 reasoning="Thought 생성 실패로 기본 동작"
@@ -468,7 +537,9 @@ class ReActAgent:
         self,
         user_profile: Dict[str, Any],
         intent: str,
-        recommendations: List[Dict]
+        recommendations: List[Dict],
+        ctx: ReActRunContext,
+        trace_level: str = "summary"
     ) -> Dict[str, Any]:
         """
         최종 답변 컴파일
@@ -480,20 +551,35 @@ class ReActAgent:
             reverse=True,
         )
         final_list = [self._sanitize_data(rec) for rec in sorted_recs[:desired_k]]
-        print(f"[DIVERSITY] 최종 선택: {len(final_list)}개")
-        for i, r in enumerate(final_list, 1):
-            print(f"  {i}. {r.get('title')} (job_id={r.get('job_id')}, score={r.get('match_score', 0):.2f})")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Final selection: %s",
+                [(r.get("job_id"), round(r.get("match_score", 0), 2)) for r in final_list],
+            )
         
         return {
             "success": True,
             "recommendations": final_list,
-            "reason": self._sanitize_data({
-                "iterations": self.iteration_count,
-                "thoughts": [t.to_dict() for t in self.thoughts],
-                "actions": [a.to_dict() for a in self.actions],
-                "observations": [o.to_dict() for o in self.observations]
-            })
+            "reason": self._build_reason(ctx, trace_level)
         }
+
+    def _build_reason(self, ctx: ReActRunContext, trace_level: str) -> Dict[str, Any]:
+        """
+        응답용 추론 기록. Tool 결과 전체(최대 50건 × 반복 수)는 full일 때만 trace store에 저장한다.
+        """
+        if trace_level == "none":
+            return {"iterations": ctx.iteration_count, "trace_level": trace_level}
+
+        reason = self._sanitize_data(ctx.to_summary_dict())
+        reason["trace_level"] = trace_level
+        if trace_level == "full":
+            reason["trace_id"] = get_trace_store().put(self._sanitize_data(ctx.to_dict()))
+        return reason
+
+    @staticmethod
+    def _resolve_trace_level(trace_level: Optional[str]) -> str:
+        level = (trace_level or REACT_TRACE_LEVEL or "summary").strip().lower()
+        return level if level in TRACE_LEVELS else "summary"
     
     # ================ Helper Methods ================
     
@@ -1,32 +1,49 @@
 # agents/tools/csv_rag_tool.py
 import json
+import logging
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics.pairwise import cosine_similarity
 
+from ai_modeling.utils.metrics import timed
 from ai_modeling.utils.rag_paths import resolve_rag_csv_path
 
+logger = logging.getLogger(__name__)
+
 EMBEDDING_COLUMN_CANDIDATES = ("embedding", "embeddings", "vector", "embedding_vector")
+SIDECAR_SUFFIX = ".embeddings.npy"
 
 
-class CSVRAGTool:
-    def __init__(
-        self,
-        csv_path: Optional[str] = None,
-        embedder: Optional[Callable[[str], List[float]]] = None,
-    ):
-        self._embedder = embedder
-        self.csv_path = Path(csv_path) if csv_path else resolve_rag_csv_path()
-        if self.csv_path.suffix.lower() != ".csv":
-            raise ValueError(f"RAG input must be CSV (+embedding). Got: {self.csv_path}")
+def _mmap_enabled() -> bool:
+    return (os.getenv("RAG_EMBEDDING_MMAP") or "").strip().lower() in ("1", "true", "yes")
+
+
+class RAGCorpus:
+    """CSV 한 개에서 읽은 공고 메타데이터 + 정규화 임베딩 행렬 (읽기 전용).
 
+    같은 CSV는 ``load_corpus``로 프로세스당 한 번만 만든다. provider별 orchestrator의
+    CSVRAGTool/AgentToolkit이 같은 프레임과 행렬을 공유하고, gunicorn ``preload_app``에서는
+    마스터가 fork 전에 만들어 두므로 워커들이 페이지를 copy-on-write로 공유한다.
+
+    ``RAG_EMBEDDING_MMAP=true``면 행렬을 CSV 옆 ``<stem>.embeddings.npy``로 저장해 두고
+    ``np.load(mmap_mode="r")``로 연다. 파일 페이지 캐시를 쓰므로 preload 없이 띄운 프로세스끼리도
+    행렬 메모리를 공유하고, 재시작 때 임베딩 문자열 파싱을 건너뛴다.
+    """
+
+    def __init__(self, csv_path: Path):
+        self.csv_path = csv_path
         self.df = pd.read_csv(self.csv_path, dtype={"job_id": int})
         self.embedding_column = self._find_embedding_column()
-        self.embedding_dim = None
-        self._prepare_embeddings()
+        self.embedding_dim: Optional[int] = None
+        self.matrix = self._load_or_prepare_matrix()
+        # 임베딩 컬럼은 행렬로 옮겼으니 메타데이터 프레임에서는 뺀다 (다른 Tool들이 공유해서 읽음).
+        self.df = self.df.drop(columns=[self.embedding_column])
+        self.records: List[Dict[str, Any]] = self.df.to_dict(orient="records")
 
     def _find_embedding_column(self) -> str:
         columns = list(self.df.columns)
@@ -38,7 +55,56 @@ class CSVRAGTool:
                 return col
         raise ValueError(f"Embedding column not found in CSV: {self.csv_path}")
 
-    def _prepare_embeddings(self) -> None:
+    @property
+    def sidecar_path(self) -> Path:
+        return self.csv_path.with_name(self.csv_path.stem + SIDECAR_SUFFIX)
+
+    def _load_or_prepare_matrix(self) -> np.ndarray:
+        if not _mmap_enabled():
+            return self._prepare_embeddings()
+
+        sidecar = self.sidecar_path
+        try:
+            fresh = sidecar.stat().st_mtime >= self.csv_path.stat().st_mtime
+        except OSError:
+            fresh = False
+        if fresh:
+            matrix = self._map_sidecar(sidecar)
+            if matrix is not None:
+                logger.info("Mapped embedding sidecar %s %s", sidecar, matrix.shape)
+                return matrix
+            logger.warning("Embedding sidecar %s does not match the CSV, rebuilding", sidecar)
+
+        matrix = self._prepare_embeddings()
+        # 워커들이 동시에 만들 수 있으므로 임시 파일은 프로세스마다 따로 쓰고 os.replace로 원자적으로 바꾼다.
+        tmp = sidecar.with_name(f"{sidecar.name}.{uuid4().hex}.tmp")
+        try:
+            with tmp.open("wb") as fp:
+                np.save(fp, matrix)
+            os.replace(tmp, sidecar)
+        except OSError as exc:
+            logger.warning("Could not write embedding sidecar %s: %s", sidecar, exc)
+            tmp.unlink(missing_ok=True)
+            return matrix
+        mapped = self._map_sidecar(sidecar)
+        return mapped if mapped is not None else matrix
+
+    def _map_sidecar(self, sidecar: Path) -> Optional[np.ndarray]:
+        """Open the sidecar read-only via mmap; ``None`` when unreadable or not matching the CSV."""
+        try:
+            matrix = np.load(sidecar, mmap_mode="r")
+        except (OSError, ValueError) as exc:
+            logger.warning("Could not map embedding sidecar %s: %s", sidecar, exc)
+            return None
+        if matrix.ndim != 2 or matrix.shape[0] != len(self.df):
+            return None
+        if self.embedding_dim is not None and matrix.shape[1] != self.embedding_dim:
+            return None
+        self.embedding_dim = int(matrix.shape[1])
+        return matrix
+
+    def _prepare_embeddings(self) -> np.ndarray:
+        """Parse the embedding column into an (n, dim) float32 matrix of unit-norm rows."""
         def _to_np(x):
             if pd.isna(x):
                 return None
@@ -53,81 +119,125 @@ class CSVRAGTool:
                 arr_np = np.array(arr, dtype=float)
                 if self.embedding_dim is None:
                     self.embedding_dim = len(arr_np)
-                    print(f"[INFO] CSV Embedding 차원: {self.embedding_dim}")
+                    logger.info("CSV embedding dimension: %d", self.embedding_dim)
                 return arr_np
             if isinstance(x, (list, tuple, np.ndarray)):
                 arr_np = np.array(x, dtype=float)
                 if self.embedding_dim is None:
                     self.embedding_dim = len(arr_np)
-                    print(f"[INFO] CSV Embedding 차원: {self.embedding_dim}")
+                    logger.info("CSV embedding dimension: %d", self.embedding_dim)
                 return arr_np
             return None
 
-        self.df[self.embedding_column] = self.df[self.embedding_column].apply(_to_np)
+        vectors = [_to_np(x) for x in self.df[self.embedding_column]]
 
         if self.embedding_dim is None:
             self.embedding_dim = 1024
-            print(f"[WARN] Embedding 차원을 결정할 수 없어 기본값 {self.embedding_dim} 사용")
+            logger.warning("Could not infer embedding dimension, defaulting to %d", self.embedding_dim)
+
+        matrix = np.zeros((len(vectors), self.embedding_dim), dtype=np.float32)
+        for i, vec in enumerate(vectors):
+            # 파싱 실패/차원이 다른 행은 0 벡터로 남겨 점수 0이 되게 한다 (기존 cosine_similarity와 동일).
+            if vec is not None and vec.shape == (self.embedding_dim,):
+                matrix[i] = vec
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        matrix.setflags(write=False)
+        return matrix
 
-        self.df[self.embedding_column] = self.df[self.embedding_column].apply(
-            lambda x: np.zeros(self.embedding_dim) if x is None else x
-        )
 
+@lru_cache(maxsize=None)
+def _load_corpus(resolved_path: str) -> RAGCorpus:
+    return RAGCorpus(Path(resolved_path))
+
+
+def load_corpus(csv_path: Optional[str] = None) -> RAGCorpus:
+    """Shared read-only corpus for ``csv_path`` (default: ``resolve_rag_csv_path()``), built once per process."""
+    path = Path(csv_path) if csv_path else resolve_rag_csv_path()
+    if path.suffix.lower() != ".csv":
+        raise ValueError(f"RAG input must be CSV (+embedding). Got: {path}")
+    return _load_corpus(str(path.resolve()))
+
+
+class CSVRAGTool:
+    """Embedding 검색용 CSV 인덱스.
+
+    데이터는 ``load_corpus``가 만든 공유 ``RAGCorpus``(정규화된 float32 행렬 + record 목록)를
+    읽기만 한다. ``query``는 공유 상태를 바꾸지 않으므로 여러 요청 스레드가 락 없이
+    같은 인스턴스를 동시에 써도 된다.
+    """
+
+    def __init__(
+        self,
+        csv_path: Optional[str] = None,
+        embedder: Optional[Callable[[str], List[float]]] = None,
+    ):
+        self._embedder = embedder
+        self.csv_path = Path(csv_path) if csv_path else resolve_rag_csv_path()
+        if self.csv_path.suffix.lower() != ".csv":
+            raise ValueError(f"RAG input must be CSV (+embedding). Got: {self.csv_path}")
+
+        corpus = load_corpus(str(self.csv_path))
+        self.df = corpus.df
+        self.embedding_column = corpus.embedding_column
+        self.embedding_dim = corpus.embedding_dim
+        self._matrix = corpus.matrix
+        self._records = corpus.records
+
+    @timed("csv_rag", "query")
     def query(self, user_query, top_k=5):
         """
         사용자 쿼리로 유사도 검색
         """
         if not user_query or str(user_query).strip() == "":
-            print("[WARN] 빈 쿼리")
+            logger.debug("Empty query")
             return []
 
-        print(f"[INFO] 검색 쿼리: {user_query}")
+        logger.debug("Search query: %s", user_query)
 
         try:
             if not self._embedder:
                 raise RuntimeError("Embedding 함수가 설정되지 않았습니다.")
             query_emb = self._embedder(user_query)
             if not query_emb:
-                print("[ERROR] Query embedding 생성 실패 (빈 결과)")
+                logger.error("Query embedding came back empty")
                 return []
 
             query_emb = np.array(query_emb, dtype=float)
-            print(f"[INFO] Query embedding 차원: {len(query_emb)}")
 
             if len(query_emb) != self.embedding_dim:
-                print(f"[ERROR] 차원 불일치! Query: {len(query_emb)}, CSV: {self.embedding_dim}")
+                logger.error("Embedding dimension mismatch: query=%d csv=%d", len(query_emb), self.embedding_dim)
                 return []
 
         except Exception as e:
-            print(f"[ERROR] Embedding 생성 실패: {e}")
+            logger.error("Query embedding failed: %s", e)
+            return []
+
+        query_norm = float(np.linalg.norm(query_emb))
+        if query_norm == 0.0 or not len(self._records):
+            return []
+
+        # 정규화된 행렬과의 내적 = cosine similarity. 결과는 지역 변수에만 담는다.
+        scores = self._matrix @ (query_emb / query_norm).astype(np.float32)
+
+        # 통계 계산은 행렬 전체를 세 번 훑으므로 DEBUG일 때만 한다.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Score stats: min=%.4f max=%.4f mean=%.4f",
+                scores.min(), scores.max(), scores.mean(),
+            )
+
+        k = min(int(top_k), len(scores))
+        if k <= 0:
             return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for idx in top:
+            item = dict(self._records[idx])
+            item["score"] = float(scores[idx])
+            results.append(item)
 
-        def score_fn(x):
-            try:
-                sim = float(cosine_similarity([query_emb], [x])[0][0])
-                return sim
-            except Exception as e:
-                print(f"[ERROR] Similarity 계산 실패: {e}")
-                return 0.0
-
-        self.df["score"] = self.df[self.embedding_column].apply(score_fn)
-
-        print(
-            f"[INFO] Score 통계: min={self.df['score'].min():.4f}, "
-            f"max={self.df['score'].max():.4f}, mean={self.df['score'].mean():.4f}"
-        )
-
-        top = self.df.sort_values("score", ascending=False).head(top_k)
-        results = top.to_dict(orient="records")
-
-        cleaned_results = []
-        for r in results:
-            if isinstance(r, dict):
-                item = dict(r)
-                item.pop(self.embedding_column, None)
-                cleaned_results.append(item)
-            else:
-                cleaned_results.append(r)
-
-        print(f"[INFO] 추천 결과 {len(cleaned_results)}개 반환")
-        return cleaned_results
+        logger.debug("Returning %d results", len(results))
+        return results
@@ -6,14 +6,17 @@ Tool Registry and Toolkit for ReAct Agent
 다양한 추천 전략을 Tool로 구현하여 Agent가 상황에 따라 선택 가능하게 함
 """
 import json
+import logging
 import math
 from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 from ai_modeling.agents.tools.csv_rag_tool import CSVRAGTool
 from ai_modeling.services.providers import AIProvider, get_ai_provider
+from ai_modeling.utils.metrics import timed
+
+logger = logging.getLogger(__name__)
 
 
 class ToolResult:
@@ -44,6 +47,11 @@ class AgentToolkit:
         self.provider = provider or get_ai_provider()
         self.csv_tool = CSVRAGTool(csv_path, embedder=self.provider.embed_text)
         self.csv_path = str(self.csv_tool.csv_path)
+        # 공고 메타데이터는 CSVRAGTool이 로드한 프레임을 읽기 전용으로 공유한다.
+        # Tool들은 이 프레임에서 필터/슬라이스만 하고 to_dict로 새 dict를 만들어 반환하므로
+        # 요청마다 CSV를 다시 읽지 않고, 동시 요청끼리 상태를 공유하지도 않는다.
+        self._jobs_df = self.csv_tool.df
+        self._latest_df = self._jobs_df.sort_values('job_id', ascending=False)
         
         # Tool Registry
         self.tools: Dict[str, Callable] = {
@@ -72,7 +80,7 @@ class AgentToolkit:
             if not query or not query.strip():
                 return ToolResult(False, [], "빈 쿼리")
             
-            print(f"[TOOL] RAG Search: {query}")
+            logger.debug("RAG search: %s", query)
             
             # 프로필 정보 통합
             full_query = query
@@ -87,20 +95,20 @@ class AgentToolkit:
             results = self._add_recommendation_reason(results, user_profile)
             
             message = f"RAG 검색: {len(results)}개 결과"
-            print(f"[TOOL] {message}")
+            logger.debug("%s", message)
             # If no results found, attempt safe fallbacks to guarantee some recommendations:
             # 1) Try region_specific_search if user regions are available
             # 2) Fall back to latest_jobs to return recent postings
             if len(results) == 0:
                 fallback_results = []
                 if user_profile and user_profile.get("regions"):
-                    print("[TOOL] RAG 검색 결과 없음 -> 지역 기반 대체 검색 시도")
+                    logger.debug("RAG search empty, trying region_specific_search")
                     region_res = self.region_specific_search(user_profile.get("regions"), user_profile=user_profile, top_k=top_k)
                     if region_res.success and region_res.data:
                         fallback_results = region_res.data
 
                 if not fallback_results:
-                    print("[TOOL] 지역 기반 대체 결과 없음 -> 최신 공고로 대체")
+                    logger.debug("Region fallback empty, using latest_jobs")
                     latest_res = self.latest_jobs(user_profile=user_profile, top_k=top_k)
                     if latest_res.success and latest_res.data:
                         fallback_results = latest_res.data
@@ -108,13 +116,13 @@ class AgentToolkit:
                 if fallback_results:
                     results = fallback_results
                     message = f"RAG 검색 결과 없음 — 대체 검색으로 {len(results)}개 반환"
-                    print(f"[TOOL] {message}")
+                    logger.debug("%s", message)
 
             return ToolResult(True, results, message)
         
         except Exception as e:
             error_msg = f"RAG 검색 실패: {str(e)}"
-            print(f"[TOOL] {error_msg}")
+            logger.warning("%s", error_msg)
             return ToolResult(False, [], error_msg)
     
     # ==================== Tool 2: Latest Jobs ====================
@@ -128,31 +136,22 @@ class AgentToolkit:
         최신순 공고들 (job_id 역순 = 최신순)
         """
         try:
-            print(f"[TOOL] Latest Jobs")
-            
-            import pandas as pd
-            df = pd.read_csv(self.csv_path)
-            
-            # 최신순 정렬
-            df = df.sort_values('job_id', ascending=False).head(top_k)
-            results = df.to_dict(orient='records')
+            logger.debug("Latest jobs")
             
-            # embedding 제거
-            for r in results:
-                if 'embedding' in r:
-                    del r['embedding']
+            # 최신순 정렬 (초기화 시 한 번 정렬해 둔 프레임)
+            results = self._latest_df.head(top_k).to_dict(orient='records')
             
             # 프로필 매칭 추가
             results = self._add_recommendation_reason(results, user_profile)
             
             message = f"최신 공고: {len(results)}개"
-            print(f"[TOOL] {message}")
+            logger.debug("%s", message)
             
             return ToolResult(True, results, message)
         
         except Exception as e:
             error_msg = f"최신 공고 조회 실패: {str(e)}"
-            print(f"[TOOL] {error_msg}")
+            logger.warning("%s", error_msg)
             return ToolResult(False, [], error_msg)
     
     # ==================== Tool 3: Profile Match Filter ====================
@@ -167,7 +166,7 @@ class AgentToolkit:
         기존 추천 결과를 프로필과 일치도 기준으로 필터링
         """
         try:
-            print(f"[TOOL] Profile Match Filter (threshold: {min_score})")
+            logger.debug("Profile match filter (threshold=%s)", min_score)
             
             if not recommendations:
                 return ToolResult(False, [], "필터링할 추천 결과가 없음")
@@ -180,13 +179,13 @@ class AgentToolkit:
                     filtered.append(rec)
             
             message = f"필터링 후: {len(filtered)}/{len(recommendations)}개 남음"
-            print(f"[TOOL] {message}")
+            logger.debug("%s", message)
             
             return ToolResult(True, filtered, message)
         
         except Exception as e:
             error_msg = f"프로필 필터링 실패: {str(e)}"
-            print(f"[TOOL] {error_msg}")
+            logger.warning("%s", error_msg)
             return ToolResult(False, recommendations, error_msg)
     
     # ==================== Tool 4: Hybrid Search ====================
@@ -201,7 +200,7 @@ class AgentToolkit:
         RAG + 프로필 필터링 결합 (하이브리드)
         """
         try:
-            print(f"[TOOL] Hybrid Search")
+            logger.debug("Hybrid search")
             
             # 1단계: RAG 검색
             rag_result = self.rag_search(query, user_profile, top_k=top_k*2)
@@ -224,13 +223,13 @@ class AgentToolkit:
             )
             
             message = f"하이브리드 검색: {len(results)}개 결과"
-            print(f"[TOOL] {message}")
+            logger.debug("%s", message)
             
             return ToolResult(True, results, message)
         
         except Exception as e:
             error_msg = f"하이브리드 검색 실패: {str(e)}"
-            print(f"[TOOL] {error_msg}")
+            logger.warning("%s", error_msg)
             return ToolResult(False, [], error_msg)
     
     # ==================== Tool 5: Region-Specific Search ====================
@@ -245,30 +244,26 @@ class AgentToolkit:
         특정 지역 기반 검색 (정확한 필터링)
         """
         try:
-            print(f"[TOOL] Region-Specific Search: {regions}")
+            logger.debug("Region-specific search: %s", regions)
             
-            import pandas as pd
-            df = pd.read_csv(self.csv_path)
+            df = self._jobs_df
             
             # 지역 필터링
             region_mask = df['place'].isin(regions) | df['address'].str.contains('|'.join(regions), case=False, na=False)
             filtered_df = df[region_mask].head(top_k)
             
             results = filtered_df.to_dict(orient='records')
-            for r in results:
-                if 'embedding' in r:
-                    del r['embedding']
             
             results = self._add_recommendation_reason(results, user_profile)
             
             message = f"지역 검색: {len(results)}개 결과"
-            print(f"[TOOL] {message}")
+            logger.debug("%s", message)
             
             return ToolResult(True, results, message)
         
         except Exception as e:
             error_msg = f"지역 검색 실패: {str(e)}"
-            print(f"[TOOL] {error_msg}")
+            logger.warning("%s", error_msg)
             return ToolResult(False, [], error_msg)
     
     # ==================== Tool 6: Experience-Based Search ====================
@@ -283,10 +278,9 @@ class AgentToolkit:
         경험 키워드 기반 검색
         """
         try:
-            print(f"[TOOL] Experience-Based Search: {experiences}")
+            logger.debug("Experience-based search: %s", experiences)
             
-            import pandas as pd
-            df = pd.read_csv(self.csv_path)
+            df = self._jobs_df
             
             # 경험 키워드 필터링
             exp_pattern = '|'.join(experiences)
@@ -294,20 +288,17 @@ class AgentToolkit:
             filtered_df = df[exp_mask].head(top_k)
             
             results = filtered_df.to_dict(orient='records')
-            for r in results:
-                if 'embedding' in r:
-                    del r['embedding']
             
             results = self._add_recommendation_reason(results, user_profile)
             
             message = f"경험 검색: {len(results)}개 결과"
-            print(f"[TOOL] {message}")
+            logger.debug("%s", message)
             
             return ToolResult(True, results, message)
         
         except Exception as e:
             error_msg = f"경험 검색 실패: {str(e)}"
-            print(f"[TOOL] {error_msg}")
+            logger.warning("%s", error_msg)
             return ToolResult(False, [], error_msg)
     
     # ==================== Tool 7: Price-Filtered Search ====================
@@ -324,10 +315,9 @@ class AgentToolkit:
         시급 범위 필터링을 포함한 검색
         """
         try:
-            print(f"[TOOL] Price-Filtered Search: {min_wage}~{max_wage}원")
+            logger.debug("Price-filtered search: %s~%s", min_wage, max_wage)
             
-            import pandas as pd
-            df = pd.read_csv(self.csv_path)
+            df = self._jobs_df
             
             # 시급 필터링
             wage_mask = (df['hourly_wage'] >= min_wage) & (df['hourly_wage'] <= max_wage)
@@ -343,20 +333,17 @@ class AgentToolkit:
                 filtered_df = filtered_df[query_mask]
             
             results = filtered_df.head(top_k).to_dict(orient='records')
-            for r in results:
-                if 'embedding' in r:
-                    del r['embedding']
             
             results = self._add_recommendation_reason(results, user_profile)
             
             message = f"시급 필터링: {len(results)}개 결과"
-            print(f"[TOOL] {message}")
+            logger.debug("%s", message)
             
             return ToolResult(True, results, message)
         
         except Exception as e:
             error_msg = f"시급 필터링 실패: {str(e)}"
-            print(f"[TOOL] {error_msg}")
+            logger.warning("%s", error_msg)
             return ToolResult(False, [], error_msg)
     
     # ==================== Tool 8: Validate Recommendations ====================
@@ -371,7 +358,7 @@ class AgentToolkit:
         추천 결과의 품질 검증
         """
         try:
-            print(f"[TOOL] Validate Recommendations")
+            logger.debug("Validate recommendations")
             
             if not recommendations:
                 return ToolResult(False, [], "추천 결과가 없음")
@@ -393,13 +380,13 @@ class AgentToolkit:
             }
             
             message = f"검증: {'통과' if validation_report['is_valid'] else '불통과'}"
-            print(f"[TOOL] {message} - {len(recommendations)}개, 평균점수 {avg_score:.2f}")
+            logger.debug("%s - %d items, avg score %.2f", message, len(recommendations), avg_score)
             
             return ToolResult(True, validation_report, message)
         
         except Exception as e:
             error_msg = f"검증 실패: {str(e)}"
-            print(f"[TOOL] {error_msg}")
+            logger.warning("%s", error_msg)
             return ToolResult(False, {}, error_msg)
     
     # ==================== Helper Methods ====================
@@ -414,11 +401,12 @@ class AgentToolkit:
         """
         if tool_name not in self.tools:
             error_msg = f"알 수 없는 Tool: {tool_name}"
-            print(f"[TOOL] {error_msg}")
+            logger.warning("%s", error_msg)
             return ToolResult(False, [], error_msg)
         
         tool_func = self.tools[tool_name]
-        return tool_func(**kwargs)
+        with timed("tool", tool_name):
+            return tool_func(**kwargs)
     
     def get_available_tools(self) -> Dict[str, str]:
         """
@@ -8,6 +8,8 @@ from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from fastapi import FastAPI, File, HTTPException, Query, UploadFile
+from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
 import uvicorn
 
 #from routers.post_automation import router as post_router
@@ -18,7 +20,12 @@ from routers.orchestrator import router as orchestrator_router
 from agents.react_agent import ReActAgent
 from schemas.recommendation import RecommendationRequest
 from services.providers import get_ai_provider
-from orchestration.pipeline import DEFAULT_CSV_PATH as ORCHESTRATOR_CSV_PATH
+from ai_modeling.utils.logging_setup import configure_logging
+from ai_modeling.utils.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from ai_modeling.utils.trace_store import get_trace_store
+from orchestration.pipeline import default_csv_path
+
+configure_logging()
 
 app = FastAPI(title="🤖 ReAct 기반 지능형 소일거리 추천 시스템")
 #app.include_router(post_router, prefix="/post")
@@ -29,8 +36,6 @@ app.include_router(orchestrator_router)
 # LangGraph 컴파일
 #graph = build_graph()
 
-DEFAULT_CSV_PATH = ORCHESTRATOR_CSV_PATH
-
 
 def _normalize_provider_name(name: Optional[str]) -> str:
     value = name or os.getenv("AI_PROVIDER") or "naver"
@@ -40,7 +45,7 @@ def _normalize_provider_name(name: Optional[str]) -> str:
 @lru_cache(maxsize=4)
 def _react_agent_factory(provider_name: str) -> ReActAgent:
     provider = get_ai_provider(provider_name)
-    return ReActAgent(DEFAULT_CSV_PATH, provider=provider)
+    return ReActAgent(default_csv_path(), provider=provider)
 
 
 def _get_react_agent(provider_name: Optional[str] = None) -> tuple[ReActAgent, str]:
@@ -55,7 +60,8 @@ sessions: Dict[str, Dict[str, Any]] = {}
 @app.post("/recommend")
 def initial_recommend(
     request: RecommendationRequest,
-    provider: Optional[str] = Query(default=None, description="사용할 AI Provider (예: naver, local)")
+    provider: Optional[str] = Query(default=None, description="사용할 AI Provider (예: naver, local)"),
+    trace: Optional[str] = Query(default=None, description="추론 기록 수준 (none, summary, full)")
 ):
     """
     1차 추천: 사용자 프로필 기반 자동 추천
@@ -77,7 +83,8 @@ def initial_recommend(
         # ReAct Agent 직접 실행
         result = react_agent.run(
             user_profile=user_profile,
-            intent=request.intent or ""
+            intent=request.intent or "",
+            trace_level=trace
         )
         
         # 세션 저장
@@ -142,7 +149,8 @@ async def voice_recommend(
         try:
             # STT: 음성 → 텍스트
             provider = get_ai_provider(provider_name)
-            stt_result = provider.transcribe_audio(tmp_path, lang="Kor")
+            # STT와 ReAct 루프는 동기 호출이므로 이벤트 루프를 막지 않게 threadpool에서 실행
+            stt_result = await run_in_threadpool(provider.transcribe_audio, tmp_path, lang="Kor")
             voice_text = stt_result.get("text", "")
             
             if not voice_text:
@@ -154,7 +162,8 @@ async def voice_recommend(
             # 이전 추천 결과를 전달하여 Agent가 맥락을 이해하도록 함
             previous_recs = session.get("recommendations", [])
             
-            result = react_agent.run(
+            result = await run_in_threadpool(
+                react_agent.run,
                 user_profile=session["user_profile"],
                 intent=voice_text,
                 previous_recommendations=previous_recs  # 이전 추천 전달
@@ -226,6 +235,10 @@ def get_reasoning(session_id: str):
     
     session = sessions[session_id]
     reasoning = session.get("reasoning", {})
+    # full 수준이면 Tool 결과 전체는 trace store에 있다 (만료됐으면 요약만 돌려준다).
+    trace_id = reasoning.get("trace_id")
+    if trace_id:
+        reasoning = get_trace_store().get(trace_id) or reasoning
     
     return {
         "session_id": session_id,
@@ -233,9 +246,17 @@ def get_reasoning(session_id: str):
         "thoughts": reasoning.get("thoughts", []),
         "actions": reasoning.get("actions", []),
         "observations": reasoning.get("observations", []),
+        "trace_id": trace_id,
         "provider": session.get("provider_name")
     }
 
 
+# ==================== 메트릭 ====================
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """ReAct/Tool/provider 단계별 지연 히스토그램과 캐시 적중 (Prometheus text format)"""
+    return Response(content=render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
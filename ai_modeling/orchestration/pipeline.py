@@ -13,6 +13,7 @@ logger = logging.getLogger(__name__)
 from ai_modeling.agents.posting_agent import PostingAutomationAgent
 from ai_modeling.agents.react_agent import ReActAgent
 from ai_modeling.services.providers import get_ai_provider
+from ai_modeling.utils.metrics import timed
 from ai_modeling.utils.rag_paths import resolve_rag_csv_path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -44,15 +45,17 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 #         return str(resolved)
 #     return str(BASE_DIR / "data" / "new_work_with_embeddings.csv")
 
-def _resolve_default_csv_path() -> str:
-    """Pick the CSV path for RAG (CSV + embedding)."""
+@lru_cache(maxsize=1)
+def default_csv_path() -> str:
+    """Pick the CSV path for RAG (CSV + embedding).
+
+    import 시점이 아니라 처음 orchestrator를 만들 때 해석한다 (env/.env 로드 이후, 워밍업 스레드에서).
+    """
 
     resolved = resolve_rag_csv_path()
-    print(f"[AI] Using recommender CSV: {resolved}")
+    logger.info("Using recommender CSV: %s", resolved)
     return str(resolved)
 
-DEFAULT_CSV_PATH = _resolve_default_csv_path()
-
 
 def _normalize_provider_name(name: Optional[str]) -> str:
     value = name or os.getenv("AI_PROVIDER") or "naver"
@@ -67,8 +70,9 @@ class AIModelingOrchestrator:
     move to a fine-tuned open model tomorrow without changing call sites.
     """
 
-    def __init__(self, provider_name: Optional[str] = None, csv_path: str = DEFAULT_CSV_PATH):
+    def __init__(self, provider_name: Optional[str] = None, csv_path: Optional[str] = None):
         normalized = _normalize_provider_name(provider_name)
+        csv_path = csv_path or default_csv_path()
         self._provider = get_ai_provider(normalized)
         self.provider_name = getattr(self._provider, "name", normalized)
         self.csv_path = csv_path
@@ -80,32 +84,59 @@ class AIModelingOrchestrator:
         user_profile: Dict[str, Any],
         intent: str = "",
         previous_recommendations: Optional[List[Dict[str, Any]]] = None,
+        trace_level: Optional[str] = None,
     ) -> Dict[str, Any]:
-        result = self._react_agent.run(
-            user_profile=user_profile,
-            intent=intent,
-            previous_recommendations=previous_recommendations or [],
-        )
+        with timed("pipeline", "recommend"):
+            result = self._react_agent.run(
+                user_profile=user_profile,
+                intent=intent,
+                previous_recommendations=previous_recommendations or [],
+                trace_level=trace_level,
+            )
         result["provider"] = self.provider_name
         return result
 
-    def _run_voice_pipeline(self, audio_bytes: bytes, lang: str = "Kor") -> Dict[str, Any]:
+    def _run_voice_pipeline(
+        self,
+        audio_bytes: bytes,
+        lang: str = "Kor",
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
         with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp:
             tmp.write(audio_bytes)
             tmp_path = tmp.name
         try:
-            return self._posting_agent.extract_from_voice(tmp_path)
+            return self._posting_agent.extract_from_voice(tmp_path, content_hash=content_hash)
         finally:
             if os.path.exists(tmp_path):
                 os.remove(tmp_path)
 
-    def create_post_from_voice_bytes(self, audio_bytes: bytes, lang: str = "Kor") -> Dict[str, Any]:
-        result = self._run_voice_pipeline(audio_bytes, lang=lang)
+    def create_post_from_voice_bytes(
+        self,
+        audio_bytes: bytes,
+        lang: str = "Kor",
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        result = self._run_voice_pipeline(audio_bytes, lang=lang, content_hash=content_hash)
+        result["provider"] = self.provider_name
+        return result
+
+    def create_post_from_voice_file(
+        self,
+        file_path: str,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Voice pipeline for audio already on disk (no temp copy)."""
+        result = self._posting_agent.extract_from_voice(file_path, content_hash=content_hash)
         result["provider"] = self.provider_name
         return result
 
-    def create_post_from_image_bytes(self, image_bytes: bytes) -> Dict[str, Any]:
-        result = self._posting_agent.extract_from_image_bytes(image_bytes)
+    def create_post_from_image_bytes(
+        self,
+        image_bytes: bytes,
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        result = self._posting_agent.extract_from_image_bytes(image_bytes, content_hash=content_hash)
         result["provider"] = self.provider_name
         return result
 
@@ -118,9 +149,14 @@ class AIModelingOrchestrator:
         """Validate a structured post and surface missing fields/questions."""
         return self._posting_agent.check_missing_fields(post)
 
-    def transcribe_audio_file(self, file_path: str, lang: str = "Kor") -> Dict[str, Any]:
+    def transcribe_audio_file(
+        self,
+        file_path: str,
+        lang: str = "Kor",
+        content_hash: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """Use the underlying provider STT directly (for media already on disk)."""
-        return self._provider.transcribe_audio(file_path, lang=lang)
+        return self._posting_agent.transcribe(file_path, lang=lang, content_hash=content_hash)
 
     def describe(self) -> Dict[str, Any]:
         return {
@@ -31,7 +31,7 @@ class EmbeddingExecutor:
         payload = {"text": text}
 
         try:
-            conn = http.client.HTTPSConnection(self._host)
+            conn = http.client.HTTPSConnection(self._host, timeout=float(os.getenv("AI_EMBEDDING_TIMEOUT", "10")))
             conn.request('POST', REQUEST_PATH, json.dumps(payload), headers)
             res = conn.getresponse()
             data = json.loads(res.read().decode("utf-8"))
@@ -118,9 +118,12 @@ def classify_stamina_with_llm(text: str) -> Optional[str]:
         # Try relative import first, then absolute
         try:
             from services.clova_llm import CompletionExecutor
+            from services.llm_cache import CachedCompletionExecutor
         except ImportError:
             from ai_modeling.services.clova_llm import CompletionExecutor
-        execr = CompletionExecutor()
+            from ai_modeling.services.llm_cache import CachedCompletionExecutor
+        # 같은 공고 텍스트는 재실행 시 LLM_CACHE_DIR 캐시에서 바로 분류 결과를 얻는다.
+        execr = CachedCompletionExecutor(CompletionExecutor())
         prompt = (
             "아래 공고의 제목/설명/장소/클라이언트를 읽고, 이 업무의 체력 요구도를 '상'/'중'/'하' 중 하나로만 출력하세요.\n\n공고:\n" + text + "\n\n(출력은 반드시 '상' 또는 '중' 또는 '하' 한 글자만)"
         )
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, File, HTTPException, Query, UploadFile
+from fastapi.concurrency import run_in_threadpool
 
 from ai_modeling.orchestration import get_orchestrator
 from ai_modeling.schemas.job_post_schema import JobPost, JobPostResponse
@@ -18,13 +19,15 @@ class RecommendationPipelineRequest(RecommendationRequest):
 @router.post("/recommend")
 def pipeline_recommend(
     payload: RecommendationPipelineRequest,
-    provider: Optional[str] = Query(default=None, description="사용할 AI Provider (naver/local)")
+    provider: Optional[str] = Query(default=None, description="사용할 AI Provider (naver/local)"),
+    trace: Optional[str] = Query(default=None, description="추론 기록 수준 (none/summary/full)")
 ):
     orchestrator = get_orchestrator(provider)
     result = orchestrator.recommend(
         user_profile=payload.user_profile.dict(),
         intent=payload.intent or "",
         previous_recommendations=payload.previous_recommendations or [],
+        trace_level=trace,
     )
     return result
 
@@ -36,7 +39,7 @@ async def pipeline_post_from_voice(
 ):
     orchestrator = get_orchestrator(provider)
     audio_bytes = await audio.read()
-    result = orchestrator.create_post_from_voice_bytes(audio_bytes)
+    result = await run_in_threadpool(orchestrator.create_post_from_voice_bytes, audio_bytes)
     if not result.get("success"):
         raise HTTPException(status_code=400, detail=result.get("message", "추출 실패"))
     return JobPostResponse(
@@ -58,7 +61,7 @@ async def pipeline_post_from_image(
 ):
     orchestrator = get_orchestrator(provider)
     image_bytes = await file.read()
-    result = orchestrator.create_post_from_image_bytes(image_bytes)
+    result = await run_in_threadpool(orchestrator.create_post_from_image_bytes, image_bytes)
     if not result.get("success"):
         raise HTTPException(status_code=400, detail=result.get("message", "추출 실패"))
     return JobPostResponse(
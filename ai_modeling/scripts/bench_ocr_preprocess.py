@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Benchmark OCR preprocessing: upload size, OCR latency and field accuracy.
+
+Fixture layout (default: ai_modeling/sample):
+    <dir>/*.png|*.jpg|*.jpeg        images to OCR
+    <dir>/ocr_expected.json          optional {"<file name>": {"<field>": "<expected text>", ...}}
+
+Field accuracy is the share of expected values that appear in the OCR text
+(whitespace-insensitive). Without --call-ocr only payload size/preprocess time is measured.
+
+    python ai_modeling/scripts/bench_ocr_preprocess.py --call-ocr --max-side 1600
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ai_modeling.services.ocr_preprocess import (  # noqa: E402
+    OcrPreprocessConfig,
+    detect_image_format,
+    preprocess_for_ocr,
+)
+
+DEFAULT_FIXTURES = ROOT / "ai_modeling" / "sample"
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".tif", ".tiff"}
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark OCR image preprocessing")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES), help="Fixture directory")
+    parser.add_argument("--max-side", type=int, default=OcrPreprocessConfig.max_side)
+    parser.add_argument("--format", default=OcrPreprocessConfig.output_format, choices=["jpg", "png"])
+    parser.add_argument("--quality", type=int, default=OcrPreprocessConfig.jpeg_quality)
+    parser.add_argument("--no-grayscale", action="store_true")
+    parser.add_argument("--no-autocontrast", action="store_true")
+    parser.add_argument("--call-ocr", action="store_true", help="Also call Clova OCR for raw vs preprocessed")
+    return parser.parse_args()
+
+
+def _squash(text: str) -> str:
+    return re.sub(r"\s+", "", text or "")
+
+
+def _field_accuracy(ocr_html: str, expected: Dict[str, str]) -> Optional[float]:
+    if not expected:
+        return None
+    haystack = _squash(re.sub(r"<[^>]+>", " ", ocr_html))
+    hits = sum(1 for value in expected.values() if _squash(str(value)) in haystack)
+    return hits / len(expected)
+
+
+def _timed_ocr(data: bytes, fmt: str) -> tuple[str, float]:
+    from ai_modeling.services.clova_ocr import run_clova_ocr
+
+    started = time.perf_counter()
+    html = run_clova_ocr(data, image_format=fmt)
+    return html, time.perf_counter() - started
+
+
+def main() -> int:
+    args = _parse_args()
+    fixtures = Path(args.fixtures)
+    images = sorted(p for p in fixtures.iterdir() if p.suffix.lower() in IMAGE_SUFFIXES)
+    if not images:
+        print(f"[bench_ocr_preprocess] no images under {fixtures}")
+        return 1
+
+    expected_path = fixtures / "ocr_expected.json"
+    expected_map = json.loads(expected_path.read_text(encoding="utf-8")) if expected_path.exists() else {}
+    config = OcrPreprocessConfig(
+        max_side=args.max_side,
+        grayscale=not args.no_grayscale,
+        autocontrast=not args.no_autocontrast,
+        output_format=args.format,
+        jpeg_quality=args.quality,
+    )
+
+    rows: List[Dict[str, object]] = []
+    for path in images:
+        raw = path.read_bytes()
+        started = time.perf_counter()
+        prepared = preprocess_for_ocr(raw, config)
+        prep_ms = (time.perf_counter() - started) * 1000
+        row: Dict[str, object] = {
+            "file": path.name,
+            "raw_b64_kb": len(base64.b64encode(raw)) / 1024,
+            "prep_b64_kb": len(base64.b64encode(prepared.data)) / 1024,
+            "prep_ms": prep_ms,
+            "applied": prepared.applied,
+        }
+        if args.call_ocr:
+            expected = expected_map.get(path.name) or {}
+            raw_html, raw_s = _timed_ocr(raw, detect_image_format(raw))
+            prep_html, prep_s = _timed_ocr(prepared.data, prepared.format)
+            row.update(
+                raw_ocr_s=raw_s,
+                prep_ocr_s=prep_s,
+                raw_acc=_field_accuracy(raw_html, expected),
+                prep_acc=_field_accuracy(prep_html, expected),
+            )
+        rows.append(row)
+
+    print(f"[bench_ocr_preprocess] config={config}")
+    for row in rows:
+        line = (
+            f"{row['file']:<28} payload {row['raw_b64_kb']:>9.1f}KB -> {row['prep_b64_kb']:>8.1f}KB"
+            f"  prep {row['prep_ms']:>6.1f}ms  applied={row['applied']}"
+        )
+        if args.call_ocr:
+            line += f"  ocr {row['raw_ocr_s']:.2f}s -> {row['prep_ocr_s']:.2f}s"
+            if row["raw_acc"] is not None:
+                line += f"  acc {row['raw_acc']:.0%} -> {row['prep_acc']:.0%}"
+        print(line)
+
+    ratio = statistics.mean(float(r["prep_b64_kb"]) / max(float(r["raw_b64_kb"]), 1e-9) for r in rows)
+    print(f"[bench_ocr_preprocess] mean payload ratio: {ratio:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
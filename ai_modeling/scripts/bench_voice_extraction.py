@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Compare voice post extraction modes: combined (1 LLM call) vs multi (polish → extract → validate).
+
+Fixture layout (default: ai_modeling/sample):
+    <dir>/*.mp3|*.wav|*.m4a          recorded voice posts
+    <dir>/voice_transcripts.json      optional {"<file name>": "<recorded STT text>", ...}
+
+With --use-transcripts the recorded STT text replaces the STT call, so both modes see the
+same input and only LLM latency is compared. The result cache is bypassed for every run.
+
+    python ai_modeling/scripts/bench_voice_extraction.py --use-transcripts --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from ai_modeling.agents.posting_agent import PostingAutomationAgent  # noqa: E402
+from ai_modeling.services.providers import get_ai_provider  # noqa: E402
+from ai_modeling.services.result_cache import ContentResultCache  # noqa: E402
+
+DEFAULT_FIXTURES = ROOT / "ai_modeling" / "sample"
+AUDIO_SUFFIXES = {".mp3", ".wav", ".m4a"}
+MODES = ("multi", "combined")
+
+
+class _RecordingProvider:
+    """Delegates to the real provider, counting LLM calls and optionally replaying STT text."""
+
+    def __init__(self, inner: Any, transcripts: Optional[Dict[str, str]] = None) -> None:
+        self._inner = inner
+        self._transcripts = transcripts
+        self.llm_calls = 0
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+    def generate_completion(self, completion_request: Dict[str, Any]) -> str:
+        self.llm_calls += 1
+        return self._inner.generate_completion(completion_request)
+
+    def transcribe_audio(self, file_path: str, lang: str = "Kor") -> Dict[str, Any]:
+        if self._transcripts is not None:
+            return {"text": self._transcripts.get(Path(file_path).name, "")}
+        return self._inner.transcribe_audio(file_path, lang=lang)
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark combined vs multi-call voice extraction")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURES), help="Fixture directory")
+    parser.add_argument("--provider", default=None, help="AI provider (default: AI_PROVIDER)")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--use-transcripts", action="store_true", help="Replay voice_transcripts.json instead of STT")
+    return parser.parse_args()
+
+
+def _run_once(agent: PostingAutomationAgent, recorder: _RecordingProvider, path: Path) -> Dict[str, Any]:
+    recorder.llm_calls = 0
+    started = time.perf_counter()
+    result = agent.extract_from_input(str(path), "voice")
+    validation = result.get("validation")
+    if result.get("success") and validation is None:
+        # multi 경로는 라우터가 validate_post(check_missing_fields)를 따로 호출한다.
+        validation = agent.check_missing_fields(dict(result.get("post") or {}))
+    return {
+        "seconds": time.perf_counter() - started,
+        "llm_calls": recorder.llm_calls,
+        "success": bool(result.get("success")),
+        "fallback": agent.voice_mode == "combined" and "validation" not in result,
+        "missing": (validation or {}).get("missing_fields", []),
+    }
+
+
+def main() -> int:
+    args = _parse_args()
+    fixtures = Path(args.fixtures)
+    audio_files = sorted(p for p in fixtures.iterdir() if p.suffix.lower() in AUDIO_SUFFIXES)
+    transcripts: Optional[Dict[str, str]] = None
+    if args.use_transcripts:
+        transcripts_path = fixtures / "voice_transcripts.json"
+        if not transcripts_path.exists():
+            print(f"[bench_voice_extraction] {transcripts_path} not found")
+            return 1
+        transcripts = json.loads(transcripts_path.read_text(encoding="utf-8"))
+        audio_files = [p for p in audio_files if p.name in transcripts]
+    if not audio_files:
+        print(f"[bench_voice_extraction] no audio fixtures under {fixtures}")
+        return 1
+
+    recorder = _RecordingProvider(get_ai_provider(args.provider), transcripts)
+    agents = {mode: PostingAutomationAgent(provider=recorder, voice_mode=mode) for mode in MODES}
+    for agent in agents.values():
+        agent.result_cache = ContentResultCache(Path("."), enabled=False)
+
+    totals: Dict[str, List[float]] = {mode: [] for mode in MODES}
+    for path in audio_files:
+        for mode in MODES:
+            runs = [_run_once(agents[mode], recorder, path) for _ in range(max(1, args.repeat))]
+            mean_s = statistics.mean(r["seconds"] for r in runs)
+            totals[mode].append(mean_s)
+            last = runs[-1]
+            print(
+                f"{path.name:<28} {mode:<8} {mean_s:>6.2f}s  llm_calls={last['llm_calls']}"
+                f"  success={last['success']}  fallback={last['fallback']}  missing={last['missing']}"
+            )
+
+    multi = statistics.mean(totals["multi"])
+    combined = statistics.mean(totals["combined"])
+    print(f"[bench_voice_extraction] mean multi {multi:.2f}s, combined {combined:.2f}s "
+          f"({combined / max(multi, 1e-9):.0%} of multi)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
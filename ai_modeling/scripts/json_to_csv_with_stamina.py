@@ -169,7 +169,7 @@ def main():
                 payload = {"text": text}
 
                 try:
-                    conn = http.client.HTTPSConnection(self._host)
+                    conn = http.client.HTTPSConnection(self._host, timeout=float(os.getenv("AI_EMBEDDING_TIMEOUT", "10")))
                     conn.request('POST', REQUEST_PATH, json.dumps(payload), headers)
                     res = conn.getresponse()
                     data = json.loads(res.read().decode("utf-8"))
@@ -203,7 +203,8 @@ def main():
                 sys.exit(1)
             try:
                 from ai_modeling.services.clova_llm import CompletionExecutor
-                execr = CompletionExecutor()
+                from ai_modeling.services.llm_cache import CachedCompletionExecutor
+                execr = CachedCompletionExecutor(CompletionExecutor())
                 prompt = (
                     "아래 공고의 제목/설명/장소/클라이언트를 읽고, 이 업무의 체력 요구도를 '상'/'중'/'하' 중 하나로만 출력하세요.\n\n공고:\n" + text + "\n\n(출력은 반드시 '상' 또는 '중' 또는 '하' 한 글자만)"
                 )
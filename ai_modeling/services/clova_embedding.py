@@ -3,9 +3,11 @@ import os
 import json
 import uuid
 import http.client
-from dotenv import load_dotenv
 
-load_dotenv()
+from ai_modeling.services.resilience import capability_timeout
+from ai_modeling.utils.env import load_env_once
+
+load_env_once()
 
 # NCP 가이드에 따라 환경변수에서 불러오기
 CLOVA_LLM_API_KEY = os.getenv("CLOVA_LLM_API_KEY")
@@ -31,11 +33,13 @@ class EmbeddingExecutor:
         }
         payload = {"text": text}
 
-        conn = http.client.HTTPSConnection(self._host)
-        conn.request('POST', REQUEST_PATH, json.dumps(payload), headers)
-        res = conn.getresponse()
-        data = json.loads(res.read().decode("utf-8"))
-        conn.close()
+        conn = http.client.HTTPSConnection(self._host, timeout=capability_timeout("embedding"))
+        try:
+            conn.request('POST', REQUEST_PATH, json.dumps(payload), headers)
+            res = conn.getresponse()
+            data = json.loads(res.read().decode("utf-8"))
+        finally:
+            conn.close()
 
         if data.get("status", {}).get("code") == "20000":
             return data["result"].get("embedding", [])
@@ -5,14 +5,18 @@ import json
 import re
 import uuid
 import requests
-from dotenv import load_dotenv
 
-load_dotenv()
+from ai_modeling.services.resilience import capability_timeout, get_guard
+from ai_modeling.utils.env import load_env_once
+
+load_env_once()
 
 CLOVA_LLM_API_KEY = os.getenv("CLOVA_LLM_API_KEY")
 CLOVA_LLM_URL = os.getenv("CLOVA_LLM_URL")  # https://clovastudio.stream.ntruss.com
 
 class CompletionExecutor:
+    model = "HCX-005"
+
     def __init__(self):
         self._host = CLOVA_LLM_URL
         self._api_key = f"Bearer {CLOVA_LLM_API_KEY}"
@@ -41,8 +45,9 @@ class CompletionExecutor:
         if stream_enabled:
             # Streaming mode
             with requests.post(
-                self._host + '/v3/chat-completions/HCX-005',
-                headers=headers, json=request_data, stream=True
+                self._host + f'/v3/chat-completions/{self.model}',
+                headers=headers, json=request_data, stream=True,
+                timeout=capability_timeout("llm"),
             ) as r:
                 # The endpoint streams SSE-like lines. Each meaningful payload is usually
                 # sent as a `data: ...` line containing a JSON object. Naively concatenating
@@ -177,16 +182,18 @@ class CompletionExecutor:
             # and use the streaming assembler logic so clients remain robust.
             try:
                 response = requests.post(
-                    self._host + '/v3/chat-completions/HCX-005',
-                    headers=headers, json=request_data
+                    self._host + f'/v3/chat-completions/{self.model}',
+                    headers=headers, json=request_data,
+                    timeout=capability_timeout("llm"),
                 )
                 response.raise_for_status()
                 result = response.json()
             except Exception as e:
                 # Fallback: try streaming POST and reuse the streaming assembly
                 with requests.post(
-                    self._host + '/v3/chat-completions/HCX-005',
-                    headers={**headers, 'Accept': 'text/event-stream'}, json=request_data, stream=True
+                    self._host + f'/v3/chat-completions/{self.model}',
+                    headers={**headers, 'Accept': 'text/event-stream'}, json=request_data, stream=True,
+                    timeout=capability_timeout("llm"),
                 ) as r:
                     pieces = []
                     for raw_line in r.iter_lines():
@@ -374,7 +381,8 @@ def refine_with_clova_llm(parsed: dict) -> dict:
     }
 
     try:
-        response_text = executor.execute(request_data)
+        # circuit이 열려 있으면 바로 ProviderUnavailableError → 아래 휴리스틱 폴백
+        response_text = get_guard("llm").call(executor.execute, request_data)
     except Exception as exc:
         # Network / request failure (DNS, timeout, etc.) -> fallback to local heuristic
         # Avoid bubbling up to FastAPI as 500 so the API remains testable offline/dev.
@@ -4,26 +4,27 @@ import json
 import uuid
 import time
 import base64
+from typing import Optional
+
 import requests
-from dotenv import load_dotenv
 
-load_dotenv()
+from ai_modeling.services.ocr_document import OcrDocument
+from ai_modeling.services.ocr_preprocess import detect_image_format
+from ai_modeling.services.resilience import capability_timeout
+from ai_modeling.utils.env import load_env_once
+
+load_env_once()
 
 CLOVA_OCR_URL = os.getenv("CLOVA_OCR_URL")
 CLOVA_OCR_SECRET = os.getenv("CLOVA_OCR_SECRET")
 
-def clova_ocr_bytes_to_html(image_bytes: bytes):
+def clova_ocr_image_data(image_bytes: bytes, image_format: Optional[str] = None) -> Optional[dict]:
     """
-    CLOVA OCR 호출 후 image_data(dict)와 generated HTML(str)를 반환.
-    환경변수가 없으면 간단한 mock을 반환 (개발용).
+    CLOVA OCR 호출 후 첫 번째 이미지 결과(fields/tables JSON)를 반환.
+    환경변수가 없으면 None (개발용 mock은 호출자가 만든다).
     """
     if not CLOVA_OCR_URL or not CLOVA_OCR_SECRET:
-        # DEV fallback: return very small mock structure
-        mock = {
-            "image_data": {"fields": [], "tables": []},
-            "html": "<html><body><p>OCR_KEY_NOT_SET</p></body></html>"
-        }
-        return mock
+        return None
 
     img_base64 = base64.b64encode(image_bytes).decode("utf-8")
     payload = {
@@ -33,7 +34,7 @@ def clova_ocr_bytes_to_html(image_bytes: bytes):
         "images": [
             {
                 "name": "upload_image",
-                "format": "png",
+                "format": image_format or detect_image_format(image_bytes),
                 "data": img_base64
             }
         ],
@@ -43,53 +44,43 @@ def clova_ocr_bytes_to_html(image_bytes: bytes):
         "Content-Type": "application/json",
         "X-OCR-SECRET": CLOVA_OCR_SECRET
     }
-    resp = requests.post(CLOVA_OCR_URL, data=json.dumps(payload), headers=headers, timeout=30)
+    resp = requests.post(CLOVA_OCR_URL, data=json.dumps(payload), headers=headers, timeout=capability_timeout("ocr"))
     resp.raise_for_status()
     result = resp.json()
-    image_data = result.get("images", [])[0] if result.get("images") else {"fields": [], "tables": []}
+    return result.get("images", [])[0] if result.get("images") else {"fields": [], "tables": []}
+
 
-    # Build HTML from fields + tables (similar to your earlier script)
-    html_output = "<html><body>"
-    html_output += "<div class='text-blocks'>"
-    for field in image_data.get("fields", []):
-        text = field.get("inferText", "")
-        html_output += f"<p>{text}</p>"
-    html_output += "</div>"
+def run_clova_ocr_document(image_bytes: bytes, image_format: Optional[str] = None) -> OcrDocument:
+    """CLOVA OCR 결과를 HTML을 거치지 않고 OcrDocument로 바로 변환."""
+    image_data = clova_ocr_image_data(image_bytes, image_format=image_format)
+    if image_data is None:
+        # DEV fallback: OCR 키가 없을 때
+        return OcrDocument(texts=["OCR_KEY_NOT_SET"])
+    return OcrDocument.from_clova(image_data)
 
-    tables = image_data.get("tables", [])
-    for idx, table in enumerate(tables):
-        html_output += f"<h3>Table {idx+1}</h3>"
-        html_output += "<table border='1'>"
-        if not table.get("cells"):
-            continue
-        max_row = max([c["rowIndex"] for c in table["cells"]]) + 1
-        max_col = max([c["columnIndex"] for c in table["cells"]]) + 1
-        grid = [["" for _ in range(max_col)] for _ in range(max_row)]
-        for cell in table["cells"]:
-            r = cell["rowIndex"]
-            c = cell["columnIndex"]
-            words = []
-            for line in cell.get("cellTextLines", []):
-                for w in line.get("cellWords", []):
-                    words.append(w.get("inferText", ""))
-            grid[r][c] = " ".join(words)
-        for r in range(max_row):
-            html_output += "<tr>"
-            for c in range(max_col):
-                html_output += f"<td>{grid[r][c]}</td>"
-            html_output += "</tr>"
-        html_output += "</table><br>"
-    html_output += "</body></html>"
 
-    return {"image_data": image_data, "html": html_output}
+def clova_ocr_bytes_to_html(image_bytes: bytes, image_format: Optional[str] = None):
+    """
+    CLOVA OCR 호출 후 image_data(dict)와 generated HTML(str)를 반환.
+    image_format을 주지 않으면 파일 시그니처로 판별한다 (jpg/png/pdf/tiff).
+    환경변수가 없으면 간단한 mock을 반환 (개발용).
+    """
+    image_data = clova_ocr_image_data(image_bytes, image_format=image_format)
+    if image_data is None:
+        # DEV fallback: return very small mock structure
+        return {
+            "image_data": {"fields": [], "tables": []},
+            "html": "<html><body><p>OCR_KEY_NOT_SET</p></body></html>"
+        }
+    return {"image_data": image_data, "html": OcrDocument.from_clova(image_data).to_html()}
 
 
-def run_clova_ocr(image_bytes: bytes):
+def run_clova_ocr(image_bytes: bytes, image_format: Optional[str] = None):
     """
     Backwards-compatible wrapper used by routers that expects a simple
     function named `run_clova_ocr` which returns the generated HTML string.
     """
-    result = clova_ocr_bytes_to_html(image_bytes)
+    result = clova_ocr_bytes_to_html(image_bytes, image_format=image_format)
     # If the underlying function returns our dict with 'html', return that.
     if isinstance(result, dict):
         return result.get("html", "")
@@ -1,8 +1,10 @@
 import os
 import requests
-from dotenv import load_dotenv
 
-load_dotenv()
+from ai_modeling.services.resilience import capability_timeout
+from ai_modeling.utils.env import load_env_once
+
+load_env_once()
 
 CLOVA_STT_URL = os.getenv("CLOVA_STT_URL", "clovastturl")
 CLOVA_STT_SECRET = os.getenv("CLOVA_STT_SECRET")
@@ -34,16 +36,15 @@ def clova_stt_from_file(file_path: str, lang: str = "Kor"):
         "lang": lang
     }
 
+    # 파일 핸들을 그대로 넘겨 requests가 청크 단위로 스트리밍하도록 한다 (전체 read 없음)
     with open(file_path, "rb") as f:
-        audio_data = f.read()
-
-    resp = requests.post(
-        CLOVA_STT_URL,
-        headers=headers,
-        params=params,
-        data=audio_data,
-        timeout=60
-    )
+        resp = requests.post(
+            CLOVA_STT_URL,
+            headers=headers,
+            params=params,
+            data=f,
+            timeout=capability_timeout("stt"),
+        )
 
     try:
         resp.raise_for_status()
@@ -0,0 +1,155 @@
+"""Response cache for deterministic (temperature 0) LLM completions.
+
+같은 요청(messages/모델/파라미터)을 temperature 0으로 보내면 같은 답이 나오므로, 요청을
+정규화한 JSON의 SHA-256을 키로 응답을 재사용한다. 메모리 LRU가 기본이고,
+``LLM_CACHE_DIR``을 주면 디스크에도 남겨 시드/크롤링 파이프라인을 다시 돌려도 LLM을
+다시 호출하지 않는다. temperature가 0이 아니거나 빠진 요청은 캐시하지 않는다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from ai_modeling.services.result_cache import ContentResultCache
+from ai_modeling.utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+_TRUE_VALUES = ("1", "true", "t", "yes", "y", "on")
+_DISK_KIND = "llm"
+
+
+def completion_cache_key(completion_request: Dict[str, Any], model: str) -> Optional[str]:
+    """Canonical hash of the request, or None when the call is not deterministic."""
+    temperature = completion_request.get("temperature")
+    try:
+        if temperature is None or float(temperature) != 0.0:
+            return None
+    except (TypeError, ValueError):
+        return None
+    try:
+        canonical = json.dumps(
+            {"model": model, "request": completion_request},
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """Thread-safe bounded LRU of completion texts with an optional JSON disk store."""
+
+    def __init__(self, max_entries: int = 512, disk: Optional[ContentResultCache] = None) -> None:
+        self.max_entries = max(0, max_entries)
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if value is not None:
+            record_cache("llm_completion", True)
+            return value
+        if self.disk is not None:
+            stored = self.disk.get(_DISK_KIND, key, "completion")
+            if isinstance(stored, dict) and isinstance(stored.get("response"), str):
+                self._remember(key, stored["response"])
+                with self._lock:
+                    self.hits += 1
+                record_cache("llm_completion", True)
+                return stored["response"]
+        with self._lock:
+            self.misses += 1
+        record_cache("llm_completion", False)
+        return None
+
+    def put(self, key: str, response: str) -> None:
+        self._remember(key, response)
+        if self.disk is not None:
+            self.disk.put(_DISK_KIND, key, "completion", {"response": response})
+
+    def _remember(self, key: str, response: str) -> None:
+        if not self.max_entries:
+            return
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "disk": str(self.disk.root) if self.disk is not None else None,
+            }
+
+    def complete(
+        self,
+        completion_request: Dict[str, Any],
+        model: str,
+        execute: Callable[[Dict[str, Any]], str],
+    ) -> str:
+        """Return a cached response for deterministic requests, otherwise call ``execute``."""
+        key = completion_cache_key(completion_request, model)
+        if key is None:
+            return execute(completion_request)
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        response = execute(completion_request)
+        # 빈 응답(오류/타임아웃)은 다음 호출에서 다시 시도하도록 저장하지 않는다.
+        if isinstance(response, str) and response.strip():
+            self.put(key, response)
+        return response
+
+
+def llm_cache_enabled() -> bool:
+    return os.getenv("LLM_CACHE_ENABLED", "true").strip().lower() in _TRUE_VALUES
+
+
+@lru_cache(maxsize=1)
+def get_completion_cache() -> CompletionCache:
+    size = int(os.getenv("LLM_CACHE_SIZE", "512"))
+    cache_dir = os.getenv("LLM_CACHE_DIR", "").strip()
+    disk = ContentResultCache(Path(cache_dir)) if cache_dir else None
+    return CompletionCache(max_entries=size, disk=disk)
+
+
+class CachedCompletionExecutor:
+    """Drop-in wrapper for scripts that call ``CompletionExecutor.execute`` directly."""
+
+    def __init__(self, executor: Any, cache: Optional[CompletionCache] = None) -> None:
+        self._executor = executor
+        self._cache = cache or get_completion_cache()
+        self.model = getattr(executor, "model", type(executor).__name__)
+
+    def execute(self, completion_request: Dict[str, Any]) -> str:
+        if not llm_cache_enabled():
+            return self._executor.execute(completion_request)
+        return self._cache.complete(completion_request, self.model, self._executor.execute)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_executor":
+            raise AttributeError(name)
+        return getattr(self._executor, name)
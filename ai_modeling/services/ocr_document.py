@@ -0,0 +1,162 @@
+"""Typed intermediate representation of an OCR result.
+
+Clova OCR는 이미 필드/테이블 셀(rowIndex, columnIndex)로 구조화된 JSON을 준다.
+이를 HTML로 만들었다가 다시 BeautifulSoup로 파싱하지 않고, 이 모델을 휴리스틱 파서와
+프롬프트 빌더가 그대로 공유한다.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from html import escape
+from typing import Any, Dict, List
+
+Table = List[List[str]]
+
+
+def clean_text(text: str) -> str:
+    if not text:
+        return ""
+    return " ".join(text.replace("\n", " ").replace("\t", " ").split())
+
+
+@dataclass
+class OcrDocument:
+    texts: List[str] = field(default_factory=list)
+    tables: List[Table] = field(default_factory=list)
+
+    @classmethod
+    def from_clova(cls, image_data: Dict[str, Any]) -> "OcrDocument":
+        """Build from one entry of the Clova OCR ``images`` array."""
+        texts = [
+            cleaned
+            for f in image_data.get("fields", []) or []
+            if (cleaned := clean_text(f.get("inferText", "")))
+        ]
+
+        tables: List[Table] = []
+        for table in image_data.get("tables", []) or []:
+            cells = table.get("cells") or []
+            if not cells:
+                continue
+            max_row = max(c["rowIndex"] for c in cells) + 1
+            max_col = max(c["columnIndex"] for c in cells) + 1
+            grid = [["" for _ in range(max_col)] for _ in range(max_row)]
+            for cell in cells:
+                words = [
+                    w.get("inferText", "")
+                    for line in cell.get("cellTextLines", []) or []
+                    for w in line.get("cellWords", []) or []
+                ]
+                grid[cell["rowIndex"]][cell["columnIndex"]] = clean_text(" ".join(words))
+            tables.append(grid)
+        return cls(texts=texts, tables=tables)
+
+    @classmethod
+    def from_html(cls, html: str) -> "OcrDocument":
+        """Fallback for providers that only return the legacy HTML layout (needs bs4)."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(html or "", "html.parser")
+        texts = [t for p in soup.find_all("p") if (t := clean_text(p.text))]
+        tables: List[Table] = []
+        for table in soup.find_all("table"):
+            rows = []
+            for tr in table.find_all("tr"):
+                cols = [clean_text(td.text) for td in tr.find_all("td")]
+                if cols:
+                    rows.append(cols)
+            tables.append(rows)
+        return cls(texts=texts, tables=tables)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OcrDocument":
+        return cls(texts=list(data.get("texts") or []), tables=list(data.get("tables") or []))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"texts": self.texts, "tables": self.tables}
+
+    @property
+    def raw_text(self) -> str:
+        lines = list(self.texts)
+        for table in self.tables:
+            for row in table:
+                lines.extend(cell for cell in row if cell)
+        return "\n".join(lines)
+
+    def is_empty(self) -> bool:
+        return not self.texts and not any(any(any(c for c in row) for row in t) for t in self.tables)
+
+    def table_lines(self) -> List[str]:
+        """Each non-empty table row as ``a | b | c`` (tables separated by a header line)."""
+        lines: List[str] = []
+        for idx, table in enumerate(self.tables, start=1):
+            rows = [" | ".join(cell for cell in row) for row in table if any(row)]
+            if not rows:
+                continue
+            lines.append(f"[표 {idx}]")
+            lines.extend(rows)
+        return lines
+
+    def to_prompt_text(self) -> str:
+        """Compact text view for LLM prompts: free text lines, then table rows."""
+        parts: List[str] = []
+        if self.texts:
+            parts.append("\n".join(self.texts))
+        table_text = "\n".join(self.table_lines())
+        if table_text:
+            parts.append(table_text)
+        return "\n\n".join(parts)
+
+    def to_html(self) -> str:
+        """Legacy HTML layout (kept for callers that still expect ``ocr_image`` HTML)."""
+        html = "<html><body><div class='text-blocks'>"
+        html += "".join(f"<p>{escape(text)}</p>" for text in self.texts)
+        html += "</div>"
+        for idx, table in enumerate(self.tables, start=1):
+            html += f"<h3>Table {idx}</h3><table border='1'>"
+            for row in table:
+                html += "<tr>" + "".join(f"<td>{escape(cell)}</td>" for cell in row) + "</tr>"
+            html += "</table><br>"
+        return html + "</body></html>"
+
+
+_NUMBER = re.compile(r"(\d+)")
+
+
+def structure_from_document(doc: OcrDocument) -> Dict[str, Any]:
+    """Layout heuristics for the two-table flyer format (title/participants/wage/address/client)."""
+    result: Dict[str, Any] = {"raw_text": doc.raw_text, "texts": doc.texts, "tables": doc.tables}
+    tables = doc.tables
+    try:
+        if len(tables) >= 1:
+            t1 = tables[0]
+            if len(t1) > 0 and len(t1[0]) > 1:
+                result["title"] = clean_text(t1[0][1])
+            if len(t1) > 1 and len(t1[1]) > 1:
+                m = _NUMBER.search(t1[1][1])
+                result["participants"] = int(m.group(1)) if m else 0
+            if len(t1) > 1 and len(t1[1]) > 4:
+                digits = re.sub(r"[^0-9]", "", t1[1][4])
+                monthly = int(digits) if digits else 0
+                result["monthly_wage"] = monthly
+                result["hourly_wage"] = round(monthly / 60) if monthly else 0
+            if len(t1) > 4 and len(t1[4]) > 1:
+                result["address"] = clean_text(t1[4][1])
+            client = ""
+            for row in t1:
+                for i, cell in enumerate(row):
+                    if "모집기관" in cell:
+                        if i + 1 < len(row):
+                            client = row[i + 1]
+                        break
+                if client:
+                    break
+            result["client"] = client or "미상"
+        if len(tables) > 1:
+            desc_lines = [row[-1] for row in tables[1][3:] if row]
+            result["description"] = ", ".join([d for d in desc_lines if d])
+    except Exception:
+        pass
+    return result
@@ -0,0 +1,131 @@
+"""Image preprocessing in front of provider OCR calls.
+
+휴대폰 사진(12MP, 수 MB)을 그대로 base64로 보내면 요청 본문이 수십 MB가 된다.
+OCR에 필요한 해상도로 줄이고(EXIF 회전 보정 포함), 흑백/대비 정규화 후 JPEG로
+다시 인코딩해 업로드 크기와 OCR 지연을 줄인다. Pillow가 없으면 원본을 그대로 쓴다.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+try:  # Optional: preprocessing is skipped without Pillow
+    from PIL import Image, ImageOps  # type: ignore
+except Exception:  # pragma: no cover
+    Image = None
+    ImageOps = None
+
+
+_TRUE_VALUES = ("1", "true", "t", "yes", "y", "on")
+
+
+def detect_image_format(data: bytes) -> str:
+    """Best-effort format label (as Clova OCR expects) from magic bytes."""
+    head = bytes(data[:12])
+    if head.startswith(b"\x89PNG"):
+        return "png"
+    if head.startswith(b"\xff\xd8"):
+        return "jpg"
+    if head.startswith(b"%PDF"):
+        return "pdf"
+    if head[:4] in (b"II*\x00", b"MM\x00*"):
+        return "tiff"
+    return "png"
+
+
+@dataclass(frozen=True)
+class OcrPreprocessConfig:
+    enabled: bool = True
+    max_side: int = 2000
+    grayscale: bool = True
+    autocontrast: bool = True
+    output_format: str = "jpg"  # jpg | png
+    jpeg_quality: int = 85
+
+    @classmethod
+    def from_env(cls, prefix: str) -> "OcrPreprocessConfig":
+        """Read ``<prefix>_PREPROCESS``, ``<prefix>_MAX_SIDE`` ... so each provider can tune its own."""
+
+        def env(name: str, default: str) -> str:
+            return os.getenv(f"{prefix}_{name}", default).strip()
+
+        defaults = cls()
+        return cls(
+            enabled=env("PREPROCESS", "true").lower() in _TRUE_VALUES,
+            max_side=int(env("MAX_SIDE", str(defaults.max_side))),
+            grayscale=env("GRAYSCALE", "true").lower() in _TRUE_VALUES,
+            autocontrast=env("AUTOCONTRAST", "true").lower() in _TRUE_VALUES,
+            output_format=env("FORMAT", defaults.output_format).lower(),
+            jpeg_quality=int(env("JPEG_QUALITY", str(defaults.jpeg_quality))),
+        )
+
+    @property
+    def cache_tag(self) -> str:
+        """Short fingerprint for result-cache namespaces (different settings → different OCR output)."""
+        if not self.enabled or Image is None:
+            return "raw"
+        flags = ("g" if self.grayscale else "") + ("c" if self.autocontrast else "")
+        return f"pp{self.max_side}{flags}{self.output_format}{self.jpeg_quality}"
+
+
+@dataclass
+class PreprocessedImage:
+    data: bytes
+    format: str
+    original_bytes: int
+    width: Optional[int] = None
+    height: Optional[int] = None
+    applied: bool = False
+
+
+def preprocess_for_ocr(image_bytes: bytes, config: OcrPreprocessConfig) -> PreprocessedImage:
+    """Normalize an image for OCR; falls back to the original bytes when not applicable."""
+    original_size = len(image_bytes)
+    source_format = detect_image_format(image_bytes)
+    passthrough = PreprocessedImage(data=image_bytes, format=source_format, original_bytes=original_size)
+
+    if not config.enabled or Image is None or source_format == "pdf":
+        return passthrough
+
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as opened:
+            img = ImageOps.exif_transpose(opened)
+            img.load()
+    except Exception:
+        return passthrough
+
+    resized = bool(config.max_side) and max(img.size) > config.max_side
+    if resized:
+        img.thumbnail((config.max_side, config.max_side), Image.LANCZOS)
+
+    if config.grayscale:
+        img = img.convert("L")
+    elif img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+
+    if config.autocontrast:
+        img = ImageOps.autocontrast(img, cutoff=1)
+
+    buffer = io.BytesIO()
+    if config.output_format == "png":
+        img.save(buffer, format="PNG", optimize=True)
+        fmt = "png"
+    else:
+        img.save(buffer, format="JPEG", quality=config.jpeg_quality, optimize=True)
+        fmt = "jpg"
+
+    data = buffer.getvalue()
+    if not resized and len(data) >= original_size:
+        # 줄일 것이 없었다면 원본이 더 낫다 (재인코딩 손실만 생김)
+        return passthrough
+    return PreprocessedImage(
+        data=data,
+        format=fmt,
+        original_bytes=original_size,
+        width=img.width,
+        height=img.height,
+        applied=True,
+    )
@@ -0,0 +1,239 @@
+"""Deterministic validation of extracted job posts.
+
+필수 필드 누락, 시간 형식, 시급/인원 숫자, 요일 목록을 로컬 규칙으로 검사·정규화하고
+되물을 질문은 템플릿으로 만든다. LLM 추론이 필요한 필드(값은 있지만 해석이 안 되거나,
+비어 있지만 원문에 단서가 있는 경우)만 ``llm_fields``로 돌려준다.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+REQUIRED_FIELDS = (
+    "title",
+    "region",
+    "schedule_days",
+    "start_time",
+    "participants",
+    "hourly_wage",
+    "description",
+)
+
+QUESTION_TEMPLATES = {
+    "title": "공고 제목을 알려주시겠어요?",
+    "region": "어느 지역에서 근무하시나요? (예: 서울 송파구)",
+    "schedule_days": "근무 가능한 요일을 알려주세요. (예: 월~금 또는 월,수,금)",
+    "start_time": "근무 시작 시간을 알려주세요. (예: 오전 9시 -> 09:00)",
+    "participants": "몇 명을 모집하시나요?",
+    "hourly_wage": "희망 시급을 알려주세요. (예: 15000원)",
+    "description": "공고에 들어갈 자세한 설명을 추가로 해주세요.",
+}
+
+# 비어 있는 필드라도 원문에 이런 단서가 있으면 LLM 추론을 시도할 가치가 있다.
+FIELD_HINTS = {
+    "title": re.compile(r"모집|구인|도우미|봉사|알바|일자리"),
+    "region": re.compile(r"[가-힣]{1,6}(?:시|구|군|동|읍|면)(?=\s|,|$)|서울|경기|부산|인천|대구|대전|광주|울산"),
+    "schedule_days": re.compile(r"요일|평일|주말|매일|[월화수목금토일]\s*[~,]"),
+    "start_time": re.compile(r"\d{1,2}\s*시(?!간)|\d{1,2}:\d{2}|오전|오후"),
+    "participants": re.compile(r"\d+\s*명|인원"),
+    "hourly_wage": re.compile(r"\d[\d,]*\s*원|시급|일당|급여"),
+}
+# 설명은 원문이 이 정도 이상 있으면 요약으로 채울 수 있다고 본다.
+DESCRIPTION_MIN_SOURCE_CHARS = 20
+
+WEEKDAYS = ("월요일", "화요일", "수요일", "목요일", "금요일", "토요일", "일요일")
+_SHORT_DAYS = {day[0]: day for day in WEEKDAYS}
+_NUMERIC_FIELDS = ("participants", "hourly_wage")
+
+
+def is_missing(field_name: str, value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.strip() == ""
+    if isinstance(value, (list, dict)):
+        return len(value) == 0
+    if isinstance(value, (int, float)) and value == 0:
+        # wage or participants could be 0 meaning missing
+        return field_name in _NUMERIC_FIELDS
+    return False
+
+
+_CLOCK = re.compile(r"^\s*(\d{1,2}):(\d{2})(?::(\d{2}))?\s*$")
+_KOREAN_TIME = re.compile(r"(오전|오후|아침|저녁|밤)?\s*(\d{1,2})\s*시\s*(?:(\d{1,2})\s*분|(반))?")
+
+
+def normalize_time(value: Any) -> Optional[str]:
+    """"09:00", "9:00:00", "오후 2시 30분", "14시" → "HH:MM:SS"; None if not a time."""
+    text = str(value or "").strip()
+    if not text:
+        return None
+    m = _CLOCK.match(text)
+    if m:
+        hour, minute, second = int(m.group(1)), int(m.group(2)), int(m.group(3) or 0)
+    else:
+        m = _KOREAN_TIME.search(text)
+        if not m:
+            return None
+        meridiem = m.group(1) or ""
+        hour = int(m.group(2))
+        minute = 30 if m.group(4) else int(m.group(3) or 0)
+        second = 0
+        if meridiem in ("오후", "저녁", "밤") and hour < 12:
+            hour += 12
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    return f"{hour:02d}:{minute:02d}:{second:02d}"
+
+
+_MAN = re.compile(r"(\d+)\s*만\s*(?:(\d+)\s*천)?")
+_CHEON = re.compile(r"(\d+)\s*천")
+
+
+def normalize_amount(value: Any) -> Optional[int]:
+    """15000, "15,000원", "1만5천원", "9천 원" → int; None if no amount can be read."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value >= 0 else None
+    text = str(value or "").replace(",", "").strip()
+    if not text:
+        return None
+    m = _MAN.search(text)
+    if m:
+        return int(m.group(1)) * 10000 + int(m.group(2) or 0) * 1000
+    m = _CHEON.search(text)
+    if m:
+        return int(m.group(1)) * 1000
+    m = re.search(r"\d+", text)
+    return int(m.group(0)) if m else None
+
+
+def normalize_days(value: Any) -> Optional[List[str]]:
+    """["월","수"], "월~금", "월,수,금", "평일", "주말" → full day names; None if unreadable."""
+    if isinstance(value, (list, tuple)):
+        text = ",".join(str(v) for v in value)
+    else:
+        text = str(value or "")
+    text = text.strip()
+    if not text:
+        return None
+    if "매일" in text:
+        return list(WEEKDAYS)
+    days: List[str] = []
+    if "평일" in text:
+        days.extend(WEEKDAYS[:5])
+    if "주말" in text:
+        days.extend(WEEKDAYS[5:])
+    for start, end in re.findall(r"([월화수목금토일])(?:요일)?\s*[~\-–]\s*([월화수목금토일])", text):
+        si, ei = WEEKDAYS.index(_SHORT_DAYS[start]), WEEKDAYS.index(_SHORT_DAYS[end])
+        if si <= ei:
+            days.extend(WEEKDAYS[si : ei + 1])
+    for token in re.split(r"[,\s/·및]+", text):
+        token = token.strip()
+        if token in WEEKDAYS:
+            days.append(token)
+        elif len(token) == 1 and token in _SHORT_DAYS:
+            days.append(_SHORT_DAYS[token])
+    if not days:
+        return None
+    return [day for day in WEEKDAYS if day in set(days)]
+
+
+@dataclass
+class ValidationReport:
+    missing: List[str] = field(default_factory=list)
+    # 값은 있지만 규칙으로 해석하지 못한 필드
+    malformed: List[str] = field(default_factory=list)
+    # LLM 추론을 시도할 필드 (malformed + 원문에 단서가 있는 missing)
+    llm_fields: List[str] = field(default_factory=list)
+    normalized: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def unresolved(self) -> List[str]:
+        return [f for f in REQUIRED_FIELDS if f in self.missing or f in self.malformed]
+
+    def to_result(self) -> Dict[str, Any]:
+        unresolved = self.unresolved
+        return {
+            "needs_clarification": len(unresolved) > 0,
+            "missing_fields": unresolved,
+            "questions": [QUESTION_TEMPLATES[f] for f in unresolved],
+        }
+
+
+def _normalize_field(field_name: str, value: Any) -> tuple[bool, Any]:
+    """Return (ok, normalized value) for fields with a strict format."""
+    if field_name in ("start_time", "end_time"):
+        normalized = normalize_time(value)
+    elif field_name in _NUMERIC_FIELDS:
+        normalized = normalize_amount(value)
+        if normalized == 0:
+            normalized = None
+    elif field_name == "schedule_days":
+        normalized = normalize_days(value)
+    else:
+        return True, value
+    return normalized is not None, normalized
+
+
+def _fill_from_text(post: Dict[str, Any], fields: List[str], confidence: Dict[str, Any]) -> List[str]:
+    """Cheap regex fills from raw_text/description; returns the fields that were filled."""
+    text = f"{post.get('raw_text') or ''}\n{post.get('description') or ''}"
+    filled: List[str] = []
+    if "title" in fields and "산책" in text:
+        post["title"] = "반려동물 산책 도우미"
+        confidence["title"] = 0.6
+        filled.append("title")
+    if "start_time" in fields:
+        m = re.search(r"(오전|오후)?\s*(\d{1,2})시", text)
+        normalized = normalize_time(m.group(0)) if m else None
+        if normalized:
+            post["start_time"] = normalized
+            confidence["start_time"] = 0.7
+            filled.append("start_time")
+    if "hourly_wage" in fields:
+        m = re.search(r"(\d{3,6})\s*원", text)
+        if m:
+            post["hourly_wage"] = int(m.group(1))
+            post["wage_amount"] = f"{m.group(1)}원"
+            confidence["hourly_wage"] = 0.7
+            filled.append("hourly_wage")
+    return filled
+
+
+def validate_post(post: Dict[str, Any]) -> ValidationReport:
+    """Normalize ``post`` in place and report what still needs clarification."""
+    report = ValidationReport()
+    confidence = post.get("confidence") or {}
+    if not isinstance(confidence, dict):
+        confidence = {}
+
+    for name in (*REQUIRED_FIELDS, "end_time"):
+        value = post.get(name)
+        if is_missing(name, value):
+            if name in REQUIRED_FIELDS:
+                report.missing.append(name)
+            continue
+        ok, normalized = _normalize_field(name, value)
+        if not ok:
+            if name in REQUIRED_FIELDS:
+                report.malformed.append(name)
+        elif normalized != value:
+            post[name] = normalized
+            report.normalized[name] = normalized
+
+    for name in _fill_from_text(post, report.missing, confidence):
+        report.missing.remove(name)
+
+    text = f"{post.get('raw_text') or ''}\n{post.get('description') or ''}"
+    hinted = [
+        name for name in report.missing
+        if (name in FIELD_HINTS and FIELD_HINTS[name].search(text))
+        or (name == "description" and len(text.strip()) >= DESCRIPTION_MIN_SOURCE_CHARS)
+    ]
+    report.llm_fields = [f for f in REQUIRED_FIELDS if f in report.malformed or f in hinted]
+    post["confidence"] = confidence
+    return report
@@ -0,0 +1,187 @@
+"""Prompt token budgeting for LLM calls (mostly Korean text).
+
+HCX 계열 토크나이저는 한글 음절을 대략 1토큰 안팎으로 쪼개고, 영문/숫자는 4자 남짓이
+1토큰이다. 정확한 토크나이저 없이도 호출별 예산을 지키고 크기를 기록할 수 있도록
+보수적인 추정치를 쓴다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from typing import Iterable, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+HANGUL_TOKENS_PER_CHAR = 1.0
+OTHER_CHARS_PER_TOKEN = 4.0
+
+# 공고 스키마와 관련된 표 행/문장을 우선 남기기 위한 키워드
+SCHEMA_KEYWORDS: Sequence[str] = (
+    "모집", "인원", "시급", "급여", "임금", "보수", "주소", "장소", "위치",
+    "근무", "요일", "시간", "기간", "기관", "자격", "연령", "나이", "문의", "내용", "활동",
+)
+# "원"/"명" 한 음절은 지원·설명 같은 거의 모든 줄에 걸리므로 숫자가 붙은 금액/인원만 본다.
+SCHEMA_PATTERNS: Sequence["re.Pattern[str]"] = (
+    re.compile(r"\d[\d,]*\s*(?:만\s*)?원"),
+    re.compile(r"\d+\s*명"),
+)
+
+# 호출 이름별 기본 입력 예산(추정 토큰). PROMPT_BUDGET_<NAME> 환경변수로 덮어쓴다.
+DEFAULT_BUDGETS = {
+    "extract": 2500,
+    "polish": 350,
+    "address": 400,
+    "infer_missing": 1200,
+    "merge": 1500,
+}
+
+_HANGUL = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣一-鿿]")
+_SPACES = re.compile(r"\s+")
+
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    hangul = len(_HANGUL.findall(text))
+    other = len(text) - hangul
+    return int(hangul * HANGUL_TOKENS_PER_CHAR + other / OTHER_CHARS_PER_TOKEN + 0.5)
+
+
+def budget_for(name: str) -> int:
+    raw = os.getenv(f"PROMPT_BUDGET_{name.upper()}")
+    if raw:
+        try:
+            return int(raw)
+        except ValueError:
+            logger.warning("Invalid PROMPT_BUDGET_%s=%r ignored", name.upper(), raw)
+    return DEFAULT_BUDGETS.get(name, 2000)
+
+
+def dedupe_lines(lines: Iterable[str]) -> List[str]:
+    """Drop blank and repeated lines (whitespace-insensitive), keeping first occurrences."""
+    seen: set[str] = set()
+    out: List[str] = []
+    for line in lines:
+        key = _SPACES.sub("", line or "")
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        out.append(line.strip())
+    return out
+
+
+def truncate_to_budget(text: str, max_tokens: int, keep: str = "head") -> str:
+    """Cut text to roughly ``max_tokens``. keep: head | tail | ends (head + tail)."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    # 문자당 평균 토큰으로 잘라낼 글자 수를 잡고, 넘치면 조금씩 줄인다.
+    ratio = max(estimate_tokens(text) / max(len(text), 1), 1e-6)
+    limit = max(int(max_tokens / ratio), 1)
+    while True:
+        if keep == "tail":
+            cut = text[-limit:]
+        elif keep == "ends":
+            half = limit // 2
+            cut = f"{text[:half]}\n…\n{text[-half:]}" if half else text[:limit]
+        else:
+            cut = text[:limit]
+        if estimate_tokens(cut) <= max_tokens or limit <= 1:
+            return cut
+        limit = int(limit * 0.9)
+
+
+def select_lines(
+    lines: Sequence[str],
+    max_tokens: int,
+    keywords: Sequence[str] = SCHEMA_KEYWORDS,
+) -> List[str]:
+    """Keep lines within budget, preferring those that mention schema keywords.
+
+    Section headers like ``[표 1]`` are always kept; the original order is preserved.
+    """
+    lines = dedupe_lines(lines)
+    costs = [estimate_tokens(line) + 1 for line in lines]
+    if sum(costs) <= max_tokens:
+        return lines
+
+    def priority(idx: int) -> tuple[int, int]:
+        line = lines[idx]
+        if line.startswith("[표"):
+            return (0, idx)
+        hit = any(kw in line for kw in keywords) or any(pattern.search(line) for pattern in SCHEMA_PATTERNS)
+        return (1 if hit else 2, idx)
+
+    chosen: set[int] = set()
+    used = 0
+    for idx in sorted(range(len(lines)), key=priority):
+        if used + costs[idx] > max_tokens:
+            continue
+        chosen.add(idx)
+        used += costs[idx]
+    return [lines[idx] for idx in sorted(chosen)]
+
+
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
+
+
+def split_to_budget(text: str, max_tokens: int) -> List[str]:
+    """Split text into chunks of at most ``max_tokens``, breaking at sentence ends, then at spaces."""
+    pieces: List[str] = []
+    for sentence in _SENTENCE_END.split((text or "").strip()):
+        if estimate_tokens(sentence) <= max_tokens:
+            pieces.append(sentence)
+        else:
+            pieces.extend(sentence.split())
+
+    chunks: List[str] = []
+    current = ""
+    for piece in pieces:
+        if not piece:
+            continue
+        candidate = f"{current} {piece}" if current else piece
+        if current and estimate_tokens(candidate) > max_tokens:
+            chunks.append(current)
+            current = piece
+        else:
+            current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def fit_text(text: str, max_tokens: int, keep: str = "head") -> str:
+    """Dedupe lines, then line-select (keyword-aware) and finally hard-truncate if needed."""
+    lines = dedupe_lines((text or "").splitlines())
+    compact = "\n".join(lines)
+    if estimate_tokens(compact) <= max_tokens:
+        return compact
+    if keep == "head":
+        compact = "\n".join(select_lines(lines, max_tokens))
+    return truncate_to_budget(compact, max_tokens, keep=keep)
+
+
+def request_prompt_text(completion_request: dict) -> str:
+    """Concatenate every text part of a Clova-style messages request."""
+    parts: List[str] = []
+    for message in completion_request.get("messages", []) or []:
+        content = message.get("content")
+        if isinstance(content, str):
+            parts.append(content)
+        elif isinstance(content, list):
+            parts.extend(str(item.get("text", "")) for item in content if isinstance(item, dict))
+    return "\n".join(parts)
+
+
+def log_call_sizes(name: str, completion_request: dict, completion: str, elapsed: float) -> None:
+    prompt_text = request_prompt_text(completion_request)
+    logger.info(
+        "LLM call %s: prompt≈%d tok (%d chars), completion≈%d tok (%d chars), %.2fs",
+        name,
+        estimate_tokens(prompt_text),
+        len(prompt_text),
+        estimate_tokens(completion or ""),
+        len(completion or ""),
+        elapsed,
+    )
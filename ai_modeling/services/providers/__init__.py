@@ -4,9 +4,14 @@ import os
 from functools import lru_cache
 from typing import Dict, Optional, Type
 
+from ai_modeling.services.llm_cache import llm_cache_enabled
+
 from .base import AIProvider
+from .caching import CachingProvider
+from .coalescing import CoalescingProvider
 from .local_stub import LocalFinetunedProvider
 from .naver import NaverCloudProvider
+from .resilience import ResilientProvider
 
 _PROVIDER_REGISTRY: Dict[str, Type[AIProvider]] = {
     "naver": NaverCloudProvider,
@@ -28,7 +33,12 @@ def _build_provider(name: str) -> AIProvider:
     if name not in _PROVIDER_REGISTRY:
         raise ValueError(f"지원하지 않는 AI Provider: {name}")
     provider_cls = _PROVIDER_REGISTRY[name]
-    return provider_cls()
+    # cache → single-flight → resilience(bulkhead/circuit breaker) → 실제 provider 순서로 감싼다.
+    provider: AIProvider = CoalescingProvider(ResilientProvider(provider_cls()))
+    if llm_cache_enabled():
+        # temperature 0 요청은 LLM_CACHE_SIZE/LLM_CACHE_DIR 캐시에서 재사용
+        provider = CachingProvider(provider)
+    return provider
 
 
 def get_ai_provider(name: Optional[str] = None) -> AIProvider:
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ai_modeling.services.ocr_document import OcrDocument
 
 
 class AIProvider(ABC):
     """Abstract base class describing the capabilities an AI provider must expose."""
 
     name: str = "base"
+    # 모델/프롬프트가 바뀌어 출력이 달라지면 올려서 결과 캐시를 무효화한다.
+    version: str = "1"
 
     @abstractmethod
     def generate_completion(self, completion_request: Dict[str, Any]) -> str:
@@ -23,4 +28,17 @@ class AIProvider(ABC):
 
     @abstractmethod
     def ocr_image(self, image_bytes: bytes) -> str:
-        """Perform OCR on the supplied bytes and return HTML/text suitable for parsing."""
+        """Perform OCR on the supplied bytes and return HTML/text suitable for parsing.
+
+        Any bytes-like object is accepted (e.g. a read-only mmap of the stored upload).
+        """
+
+    def ocr_document(self, image_bytes: bytes) -> "OcrDocument":
+        """Return the OCR result as a typed document (texts + table grids).
+
+        Default implementation re-parses the ``ocr_image`` HTML; providers with a
+        structured OCR response should override this to skip the HTML round-trip.
+        """
+        from ai_modeling.services.ocr_document import OcrDocument
+
+        return OcrDocument.from_html(self.ocr_image(image_bytes))
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from ai_modeling.services.llm_cache import CompletionCache, get_completion_cache
+from ai_modeling.services.ocr_document import OcrDocument
+from ai_modeling.services.result_cache import provider_namespace
+
+from .base import AIProvider
+
+
+class CachingProvider(AIProvider):
+    """Decorates a provider so deterministic ``generate_completion`` calls are served from cache.
+
+    Other capabilities are delegated unchanged (OCR/STT have their own content-hash cache).
+    """
+
+    def __init__(self, inner: AIProvider, cache: Optional[CompletionCache] = None):
+        self._inner = inner
+        self._cache = cache or get_completion_cache()
+        # 결과 캐시 namespace 등에서 쓰이므로 원래 provider의 이름/버전을 그대로 노출한다.
+        self.name = inner.name
+        self.version = inner.version
+
+    @property
+    def inner(self) -> AIProvider:
+        return self._inner
+
+    def generate_completion(self, completion_request: Dict[str, Any]) -> str:
+        return self._cache.complete(
+            completion_request,
+            provider_namespace(self._inner),
+            self._inner.generate_completion,
+        )
+
+    def embed_text(self, text: str) -> List[float]:
+        return self._inner.embed_text(text)
+
+    def transcribe_audio(self, file_path: str, lang: str = "Kor") -> Dict[str, Any]:
+        return self._inner.transcribe_audio(file_path, lang=lang)
+
+    def ocr_image(self, image_bytes: bytes) -> str:
+        return self._inner.ocr_image(image_bytes)
+
+    def ocr_document(self, image_bytes: bytes) -> OcrDocument:
+        return self._inner.ocr_document(image_bytes)
+
+    def __getattr__(self, name: str) -> Any:
+        # provider 고유 속성(ocr_preprocess 등)은 원본에서 찾는다.
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
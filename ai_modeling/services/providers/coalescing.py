@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from ai_modeling.services.llm_cache import completion_cache_key
+from ai_modeling.services.ocr_document import OcrDocument
+from ai_modeling.services.result_cache import provider_namespace
+from ai_modeling.utils.singleflight import get_single_flight
+
+from .base import AIProvider
+
+
+class CoalescingProvider(AIProvider):
+    """Shares one in-flight call among concurrent identical embedding / deterministic LLM requests.
+
+    Non-deterministic completions (temperature != 0) are never coalesced.
+    """
+
+    def __init__(self, inner: AIProvider):
+        self._inner = inner
+        self.name = inner.name
+        self.version = inner.version
+        self._embeddings = get_single_flight("provider.embed_text")
+        self._completions = get_single_flight("provider.generate_completion")
+
+    @property
+    def inner(self) -> AIProvider:
+        return self._inner
+
+    def generate_completion(self, completion_request: Dict[str, Any]) -> str:
+        key = completion_cache_key(completion_request, provider_namespace(self._inner))
+        if key is None:
+            return self._inner.generate_completion(completion_request)
+        return self._completions.do(key, lambda: self._inner.generate_completion(completion_request))
+
+    def embed_text(self, text: str) -> List[float]:
+        key = (provider_namespace(self._inner), text)
+        # 여러 호출자가 같은 리스트를 받으므로 각자 복사본을 돌려준다.
+        return list(self._embeddings.do(key, lambda: self._inner.embed_text(text)))
+
+    def transcribe_audio(self, file_path: str, lang: str = "Kor") -> Dict[str, Any]:
+        return self._inner.transcribe_audio(file_path, lang=lang)
+
+    def ocr_image(self, image_bytes: bytes) -> str:
+        return self._inner.ocr_image(image_bytes)
+
+    def ocr_document(self, image_bytes: bytes) -> OcrDocument:
+        return self._inner.ocr_document(image_bytes)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
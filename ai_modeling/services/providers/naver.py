@@ -4,8 +4,10 @@ from typing import Any, Dict, List
 
 from ai_modeling.services.clova_embedding import get_clova_embedding
 from ai_modeling.services.clova_llm import CompletionExecutor
-from ai_modeling.services.clova_ocr import run_clova_ocr
+from ai_modeling.services.clova_ocr import run_clova_ocr, run_clova_ocr_document
 from ai_modeling.services.clova_stt import clova_stt_from_file
+from ai_modeling.services.ocr_document import OcrDocument
+from ai_modeling.services.ocr_preprocess import OcrPreprocessConfig, preprocess_for_ocr
 
 from .base import AIProvider
 
@@ -14,9 +16,12 @@ class NaverCloudProvider(AIProvider):
     """Concrete provider that routes every capability to Naver Cloud (Clova) APIs."""
 
     name = "naver"
+    version = "hcx-005"
 
     def __init__(self):
         self._llm = CompletionExecutor()
+        # NAVER_OCR_PREPROCESS / NAVER_OCR_MAX_SIDE / NAVER_OCR_FORMAT ... 로 조정
+        self.ocr_preprocess = OcrPreprocessConfig.from_env("NAVER_OCR")
 
     def generate_completion(self, completion_request: Dict[str, Any]) -> str:
         return self._llm.execute(completion_request)
@@ -28,4 +33,9 @@ class NaverCloudProvider(AIProvider):
         return clova_stt_from_file(file_path, lang=lang)
 
     def ocr_image(self, image_bytes: bytes) -> str:
-        return run_clova_ocr(image_bytes)
+        prepared = preprocess_for_ocr(image_bytes, self.ocr_preprocess)
+        return run_clova_ocr(prepared.data, image_format=prepared.format)
+
+    def ocr_document(self, image_bytes: bytes) -> OcrDocument:
+        prepared = preprocess_for_ocr(image_bytes, self.ocr_preprocess)
+        return run_clova_ocr_document(prepared.data, image_format=prepared.format)
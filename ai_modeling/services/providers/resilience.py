@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+from ai_modeling.services.ocr_document import OcrDocument
+from ai_modeling.services.resilience import get_guard
+from ai_modeling.utils.metrics import timed
+
+from .base import AIProvider
+
+
+class ResilientProvider(AIProvider):
+    """Routes every capability through its bulkhead + circuit breaker (see services.resilience).
+
+    Calls that are rejected raise ``ProviderUnavailableError`` immediately so callers can
+    fall back (latest_jobs, heuristic parsing) instead of waiting on a degraded API.
+    Each call is timed as ``stage="provider", name=<capability>`` (rejections included).
+    """
+
+    def __init__(self, inner: AIProvider):
+        self._inner = inner
+        self.name = inner.name
+        self.version = inner.version
+
+    @property
+    def inner(self) -> AIProvider:
+        return self._inner
+
+    def generate_completion(self, completion_request: Dict[str, Any]) -> str:
+        with timed("provider", "llm"):
+            return get_guard("llm").call(self._inner.generate_completion, completion_request)
+
+    def embed_text(self, text: str) -> List[float]:
+        with timed("provider", "embedding"):
+            return get_guard("embedding").call(self._inner.embed_text, text)
+
+    def transcribe_audio(self, file_path: str, lang: str = "Kor") -> Dict[str, Any]:
+        with timed("provider", "stt"):
+            return get_guard("stt").call(self._inner.transcribe_audio, file_path, lang=lang)
+
+    def ocr_image(self, image_bytes: bytes) -> str:
+        with timed("provider", "ocr"):
+            return get_guard("ocr").call(self._inner.ocr_image, image_bytes)
+
+    def ocr_document(self, image_bytes: bytes) -> OcrDocument:
+        with timed("provider", "ocr"):
+            return get_guard("ocr").call(self._inner.ocr_document, image_bytes)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
@@ -0,0 +1,208 @@
+"""Timeouts, circuit breakers and bulkheads for external AI calls.
+
+Clova가 느려지면 타임아웃 없는 호출이 스레드풀을 모두 잡고 있어 AI와 무관한 엔드포인트까지
+멈춘다. 기능(capability: llm / embedding / ocr / stt)마다
+
+- 호출 타임아웃 (``AI_<CAP>_TIMEOUT`` 초)
+- 동시 호출 상한 bulkhead (``AI_<CAP>_CONCURRENCY``, 자리가 없으면 ``AI_BULKHEAD_WAIT`` 초만 대기)
+- 연속 실패 시 열리는 circuit breaker (``AI_CIRCUIT_FAILURES`` 회, ``AI_CIRCUIT_RESET_SECONDS`` 후 1회 시험)
+
+를 두고, 막힌 호출은 ``ProviderUnavailableError``로 즉시 실패시켜 호출부가 폴백을 쓰게 한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, TypeVar
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+CAPABILITIES = ("llm", "embedding", "ocr", "stt")
+
+_DEFAULT_TIMEOUTS = {"llm": 30.0, "embedding": 10.0, "ocr": 30.0, "stt": 60.0}
+_DEFAULT_CONCURRENCY = {"llm": 8, "embedding": 16, "ocr": 4, "stt": 4}
+
+
+class ProviderUnavailableError(RuntimeError):
+    """Raised instead of calling a provider whose circuit is open or bulkhead is full."""
+
+    def __init__(self, capability: str, reason: str, retry_after: float = 0.0) -> None:
+        super().__init__(f"AI {capability} unavailable: {reason}")
+        self.capability = capability
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+def capability_timeout(capability: str) -> float:
+    """Per-call timeout in seconds for HTTP clients of the given capability."""
+    return _env_float(f"AI_{capability.upper()}_TIMEOUT", _DEFAULT_TIMEOUTS.get(capability, 30.0))
+
+
+class CircuitBreaker:
+    """closed → (N consecutive failures) → open → (reset timeout) → half-open → closed/open."""
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state_locked()
+
+    def _state_locked(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self._state_locked()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._probing:
+                # 시험 호출은 한 번에 하나만 보낸다.
+                self._probing = True
+                return True
+            return False
+
+    def release_probe(self) -> None:
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("Circuit %s closed", self.name)
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                if self._opened_at is None or self._probing:
+                    logger.warning("Circuit %s opened after %d failure(s)", self.name, self._failures)
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class Bulkhead:
+    """Caps concurrent calls for one capability so a burst cannot starve the others."""
+
+    def __init__(self, name: str, max_concurrent: int, max_wait: float = 0.5) -> None:
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_wait = max_wait
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrent)
+        self._in_flight = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        if not self._semaphore.acquire(timeout=self.max_wait):
+            with self._lock:
+                self._rejected += 1
+            return False
+        with self._lock:
+            self._in_flight += 1
+        return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        self._semaphore.release()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "in_flight": self._in_flight,
+                "rejected": self._rejected,
+            }
+
+
+class CapabilityGuard:
+    """Bulkhead + circuit breaker in front of one provider capability."""
+
+    def __init__(self, capability: str, breaker: CircuitBreaker, bulkhead: Bulkhead) -> None:
+        self.capability = capability
+        self.breaker = breaker
+        self.bulkhead = bulkhead
+
+    def is_available(self) -> bool:
+        return self.breaker.state != "open"
+
+    def call(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        if not self.breaker.allow():
+            raise ProviderUnavailableError(self.capability, "circuit open", self.breaker.retry_after())
+        if not self.bulkhead.acquire():
+            # 자리가 없어서 못 보낸 것은 provider 장애가 아니므로 breaker에는 기록하지 않고,
+            # half-open 시험 권한만 돌려준다.
+            self.breaker.release_probe()
+            raise ProviderUnavailableError(self.capability, "too many concurrent calls", self.bulkhead.max_wait)
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        finally:
+            self.bulkhead.release()
+        self.breaker.record_success()
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.breaker.state,
+            "retry_after": round(self.breaker.retry_after(), 1),
+            "timeout": capability_timeout(self.capability),
+            **self.bulkhead.stats(),
+        }
+
+
+@lru_cache(maxsize=None)
+def get_guard(capability: str) -> CapabilityGuard:
+    """Process-wide guard per capability (shared by providers and direct executor callers)."""
+    cap = capability.upper()
+    breaker = CircuitBreaker(
+        capability,
+        failure_threshold=int(_env_float("AI_CIRCUIT_FAILURES", 5)),
+        reset_timeout=_env_float("AI_CIRCUIT_RESET_SECONDS", 30.0),
+    )
+    bulkhead = Bulkhead(
+        capability,
+        max_concurrent=int(_env_float(f"AI_{cap}_CONCURRENCY", _DEFAULT_CONCURRENCY.get(capability, 4))),
+        max_wait=_env_float("AI_BULKHEAD_WAIT", 0.5),
+    )
+    return CapabilityGuard(capability, breaker, bulkhead)
+
+
+def guard_status() -> Dict[str, Dict[str, Any]]:
+    return {capability: get_guard(capability).stats() for capability in CAPABILITIES}
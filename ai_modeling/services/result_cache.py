@@ -0,0 +1,109 @@
+"""Content-addressed cache for provider outputs (OCR HTML, STT transcripts, extracted posts).
+
+Entries are keyed by the SHA-256 of the input media plus a namespace that carries the
+provider name/version, so the same flyer photo is only sent to OCR/LLM once per provider.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ai_modeling.utils.metrics import record_cache
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1024 * 1024
+_UNSAFE_CHARS = re.compile(r"[^0-9A-Za-z._-]+")
+
+
+def content_hash(data: bytes) -> str:
+    """Return the hex SHA-256 digest of in-memory content."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_content_hash(path: str | os.PathLike[str]) -> str:
+    """Return the hex SHA-256 digest of a file without loading it at once."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def provider_namespace(provider: Any, *parts: str) -> str:
+    """Build a filesystem-safe namespace from the provider name/version and extra parts."""
+    name = getattr(provider, "name", "unknown")
+    version = getattr(provider, "version", "1")
+    raw = "-".join([str(name), str(version), *[str(p) for p in parts if p]])
+    return _UNSAFE_CHARS.sub("_", raw)
+
+
+class ContentResultCache:
+    """JSON-on-disk cache: ``<root>/<kind>/<content_hash>.<namespace>.json``."""
+
+    def __init__(self, root: Path, enabled: bool = True) -> None:
+        self.root = root
+        self.enabled = enabled
+
+    def _path(self, kind: str, digest: str, namespace: str) -> Path:
+        return self.root / kind / f"{digest}.{namespace}.json"
+
+    def get(self, kind: str, digest: Optional[str], namespace: str) -> Optional[Any]:
+        if not self.enabled or not digest:
+            return None
+        path = self._path(kind, digest, namespace)
+        try:
+            with path.open("r", encoding="utf-8") as fp:
+                value = json.load(fp)
+        except FileNotFoundError:
+            value = None
+        except Exception as exc:
+            logger.warning("Ignoring unreadable result cache entry %s: %s", path, exc)
+            value = None
+        record_cache(f"result.{kind}", value is not None)
+        return value
+
+    def put(self, kind: str, digest: Optional[str], namespace: str, value: Any) -> None:
+        if not self.enabled or not digest:
+            return
+        path = self._path(kind, digest, namespace)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 동시에 같은 항목을 쓰더라도 반쯤 쓰인 파일을 읽지 않도록 임시 파일 후 교체
+            fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fp:
+                json.dump(value, fp, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except Exception as exc:
+            logger.warning("Failed to write result cache entry %s: %s", path, exc)
+
+    def get_or_compute(
+        self,
+        kind: str,
+        digest: Optional[str],
+        namespace: str,
+        compute: Callable[[], Any],
+        should_store: Callable[[Any], bool] = lambda value: bool(value),
+    ) -> Any:
+        cached = self.get(kind, digest, namespace)
+        if cached is not None:
+            return cached
+        value = compute()
+        if should_store(value):
+            self.put(kind, digest, namespace, value)
+        return value
+
+
+@lru_cache(maxsize=1)
+def get_result_cache() -> ContentResultCache:
+    root = Path(os.getenv("AI_RESULT_CACHE_DIR", ".ai_result_cache"))
+    enabled = os.getenv("AI_RESULT_CACHE_ENABLED", "true").strip().lower() not in ("0", "false", "no", "off")
+    return ContentResultCache(root, enabled=enabled)
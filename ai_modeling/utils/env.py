@@ -0,0 +1,20 @@
+"""Load ``.env`` once per process.
+
+Clova 모듈마다 ``load_dotenv()``를 부르면 import할 때마다 .env를 다시 읽는다. 모듈 상단에서
+``load_env_once()``를 부르면 처음 한 번만 읽고, python-dotenv가 없으면(컨테이너처럼 env가
+이미 주입된 경우) 조용히 건너뛴다. 이미 설정된 환경 변수는 덮어쓰지 않는다.
+백엔드는 ``backend_api/app/main.py``/``core/config.py`` 맨 앞에서 불러 기동 시 바로 .env를 반영한다.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def load_env_once() -> bool:
+    try:
+        from dotenv import load_dotenv
+    except ImportError:  # pragma: no cover - optional dependency
+        return False
+    return bool(load_dotenv())
@@ -0,0 +1,126 @@
+"""Process-wide logging: leveled, optionally JSON, written off the request thread.
+
+핫 패스(ReAct 루프, Tool, CSV RAG, 게시글 자동화)는 ``print`` 대신 모듈 로거에
+``logger.debug("... %s", value)``처럼 인자를 넘긴다. 기본 레벨(INFO)에서는 DEBUG 레코드가
+만들어지지도 않으므로 포맷팅 비용이 없다.
+
+``configure_logging()``은 루트 로거에 ``QueueHandler``만 달고, 실제 포맷/stdout 쓰기는
+``QueueListener`` 스레드가 한다. 환경 변수:
+
+- ``LOG_LEVEL``: 루트 레벨 (기본 INFO)
+- ``LOG_FORMAT``: ``text`` (기본) 또는 ``json`` (한 줄에 JSON 객체 하나)
+- ``LOG_SAMPLE_RATE``: INFO 이하 레코드를 이 비율만 남긴다 (기본 1.0). WARNING 이상은 항상 남긴다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+_LOCK = threading.Lock()
+_listener: Optional[QueueListener] = None
+_handler: Optional[QueueHandler] = None
+
+# LogRecord 기본 속성: 이 외의 속성(extra=...)만 JSON 필드로 내보낸다.
+_RESERVED = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, message, extra fields, exc_info."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a random ``rate`` fraction of records below WARNING."""
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.rate = min(1.0, max(0.0, rate))
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or self.rate >= 1.0:
+            return True
+        return random.random() < self.rate
+
+
+class _EnqueueHandler(QueueHandler):
+    # 기본 QueueHandler.prepare는 호출 스레드에서 메시지를 포맷한다. 레코드를 그대로 넘기고
+    # 포맷은 listener 스레드에 맡긴다 (args는 그 사이에 바뀌지 않는 값만 넘길 것).
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(level: Optional[str] = None, fmt: Optional[str] = None) -> None:
+    """Install the queue handler on the root logger once per process."""
+    global _listener, _handler
+    with _LOCK:
+        if _listener is not None:
+            return
+        level_name = (level or os.getenv("LOG_LEVEL") or "INFO").upper()
+        fmt_name = (fmt or os.getenv("LOG_FORMAT") or "text").lower()
+        sample_rate = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+
+        stream = logging.StreamHandler()
+        if fmt_name == "json":
+            stream.setFormatter(JsonFormatter())
+        else:
+            stream.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        handler = _handler = _EnqueueHandler(log_queue)
+        if sample_rate < 1.0:
+            handler.addFilter(SamplingFilter(sample_rate))
+
+        root = logging.getLogger()
+        root.setLevel(level_name)
+        root.addHandler(handler)
+
+        _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+
+def _restart_after_fork() -> None:
+    # fork된 자식(gunicorn preload 워커)에는 부모의 listener 스레드가 따라오지 않는다.
+    # 새 큐와 새 스레드를 붙인다 (부모 큐에 남은 레코드는 부모가 쓰므로 자식이 다시 쓰지 않는다).
+    global _LOCK, _listener
+    _LOCK = threading.Lock()
+    if _listener is None or _handler is None:
+        return
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _handler.queue = log_queue
+    _listener = QueueListener(log_queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    with _LOCK:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
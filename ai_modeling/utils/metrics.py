@@ -0,0 +1,334 @@
+"""In-process metrics registry with Prometheus text exposition.
+
+API 라우트, ReAct 루프/반복, 각 Tool, provider capability(llm/embedding/ocr/stt), 지오코더 호출이
+모두 같은 타이밍 API를 쓴다::
+
+    with timed("tool", "rag_search"):
+        ...
+
+    @timed("react", "run")
+    def run(...): ...
+
+``timed``는 ``ilowa_stage_duration_seconds{stage, name}`` 히스토그램에 기록하고, 예외가 나면
+``ilowa_stage_errors_total``도 올린다. 캐시는 ``record_cache(cache, hit)``로 적중률을 남긴다.
+외부 라이브러리 없이 동작하며, 백엔드의 ``GET /metrics``가 ``render_prometheus()`` 결과를 돌려준다.
+"""
+
+from __future__ import annotations
+
+import functools
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ai_modeling.utils.tracing import SpanHandle, end_span, start_span
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Incremented directly, or read at scrape time from ``collect`` for totals kept elsewhere.
+
+    ``collect``는 프로세스 시작 이후 단조 증가하는 누적치(label values -> value)만 돌려줘야 한다.
+    """
+
+    kind = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        if self._collect is not None:
+            try:
+                items = sorted(dict(self._collect()).items())
+            except Exception:
+                items = []
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items]
+
+
+class Gauge(_Metric):
+    """Set directly, or computed at scrape time from ``collect`` (label values -> value)."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._collect = collect
+
+    def set(self, value: float, **labels: Any) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = float(value)
+
+    def render(self) -> List[str]:
+        if self._collect is not None:
+            try:
+                values = dict(self._collect())
+            except Exception:
+                values = {}
+        else:
+            with self._lock:
+                values = dict(self._values)
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}"
+            for key, v in sorted(values.items())
+        ]
+
+
+class Histogram(_Metric):
+    """Observed directly, or read at scrape time from ``collect`` for histograms kept elsewhere.
+
+    ``collect``는 label values -> (버킷별 개수 [..., +Inf], 합계)를 돌려준다 (누적이 아닌 구간별 개수).
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        collect: Optional[Callable[[], Dict[LabelValues, Tuple[Sequence[int], float]]]] = None,
+    ) -> None:
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., +Inf count], sum
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._collect = collect
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            counts, total = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            else:
+                counts[-1] += 1
+            total[0] += value
+
+    def snapshot(self, **labels: Any) -> Tuple[int, float]:
+        """(count, sum) for one label set."""
+        with self._lock:
+            series = self._series.get(self._key(labels))
+            if series is None:
+                return 0, 0.0
+            return sum(series[0]), series[1][0]
+
+    def render(self) -> List[str]:
+        if self._collect is not None:
+            try:
+                items = sorted((key, (list(c), float(total))) for key, (c, total) in self._collect().items())
+            except Exception:
+                items = []
+        else:
+            with self._lock:
+                items = sorted((key, (list(c), s[0])) for key, (c, s) in self._series.items())
+        lines: List[str] = []
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = ("le", _format_value(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type, name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.kind}")
+            return metric
+
+    def counter(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> Counter:
+        return self._get_or_create(Counter, name, help_text, labelnames, collect=collect)
+
+    def gauge(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        collect: Optional[Callable[[], Dict[LabelValues, float]]] = None,
+    ) -> Gauge:
+        return self._get_or_create(Gauge, name, help_text, labelnames, collect=collect)
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        collect: Optional[Callable[[], Dict[LabelValues, Tuple[Sequence[int], float]]]] = None,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help_text, labelnames, buckets=buckets, collect=collect)
+
+    def metrics(self) -> Iterable[_Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self.metrics():
+            samples = metric.render()
+            if samples:
+                lines.extend(metric.header())
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+STAGE_DURATION = REGISTRY.histogram(
+    "ilowa_stage_duration_seconds",
+    "Latency of AI pipeline stages (react, tool, provider, geocoder, ...)",
+    ("stage", "name"),
+)
+STAGE_ERRORS = REGISTRY.counter(
+    "ilowa_stage_errors_total",
+    "Stages that raised an exception",
+    ("stage", "name"),
+)
+CACHE_REQUESTS = REGISTRY.counter(
+    "ilowa_cache_requests_total",
+    "Cache lookups by result (hit/miss)",
+    ("cache", "result"),
+)
+
+
+class timed:
+    """Context manager / decorator that records one stage duration.
+
+    ``stage``는 종류(react, tool, provider, geocoder...), ``name``은 그 안의 구분(tool 이름,
+    capability 등)이다. 라벨 조합 수가 늘지 않도록 name에는 고정된 값만 넘긴다.
+    요청 trace가 열려 있으면 ``<stage>.<name>`` 자식 span도 남긴다 (``ai_modeling.utils.tracing``).
+    """
+
+    __slots__ = ("stage", "name", "_started", "_span")
+
+    def __init__(self, stage: str, name: str = "") -> None:
+        self.stage = stage
+        self.name = name
+        self._started = 0.0
+        self._span: Optional[SpanHandle] = None
+
+    def __enter__(self) -> "timed":
+        self._span = start_span(f"{self.stage}.{self.name}" if self.name else self.stage)
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        STAGE_DURATION.observe(time.perf_counter() - self._started, stage=self.stage, name=self.name)
+        if exc_type is not None:
+            STAGE_ERRORS.inc(stage=self.stage, name=self.name)
+        end_span(self._span, exc)
+        self._span = None
+
+    def __call__(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        stage, name = self.stage, self.name
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with timed(stage, name):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def render_prometheus() -> str:
+    return REGISTRY.render()
+
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
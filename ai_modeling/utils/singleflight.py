@@ -0,0 +1,93 @@
+"""Single-flight request coalescing.
+
+같은 키의 호출이 동시에 여러 번 들어오면 첫 호출(leader)만 실제로 실행하고, 나머지는 그 결과
+(또는 예외)를 함께 받는다. 아침 시간대처럼 비슷한 프로필의 임베딩 요청이나 인기 시니어클럽
+주소의 지오코딩 요청이 몰릴 때 외부 API 호출을 한 번으로 줄인다. 결과를 저장하지는 않으므로
+캐시와 함께 쓴다 (캐시 miss가 동시에 여러 개 나는 경우를 막는 용도).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+_T = TypeVar("_T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[_T]):
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def do(self, key: Hashable, fn: Callable[[], _T]) -> _T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            with self._lock:
+                self.errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "executed": self.executed,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "in_flight": len(self._calls),
+            }
+
+
+_REGISTRY: Dict[str, SingleFlight[Any]] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_single_flight(name: str) -> SingleFlight[Any]:
+    """Process-wide named group so counters can be reported together."""
+    with _REGISTRY_LOCK:
+        group = _REGISTRY.get(name)
+        if group is None:
+            group = _REGISTRY[name] = SingleFlight(name)
+        return group
+
+
+def single_flight_stats() -> Dict[str, Dict[str, int]]:
+    with _REGISTRY_LOCK:
+        groups = list(_REGISTRY.values())
+    return {group.name: group.stats() for group in groups}
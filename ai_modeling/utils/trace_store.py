@@ -0,0 +1,73 @@
+"""Bounded in-memory store for full ReAct reasoning traces.
+
+``REACT_TRACE_LEVEL=full``이면 Tool 결과 전체가 담긴 추론 기록을 응답에 넣지 않고 여기에
+보관한 뒤 ``trace_id``만 돌려준다. 디버깅용 ``/recommend/session/{id}/reasoning``이 id로 꺼내 쓴다.
+항목 수(``REACT_TRACE_STORE_SIZE``)와 보관 시간(``REACT_TRACE_TTL_SECONDS``)을 넘으면 오래된 것부터 버린다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+
+class TraceStore:
+    """Thread-safe LRU of traces with a time-to-live."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600.0) -> None:
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, trace: Dict[str, Any]) -> str:
+        trace_id = uuid.uuid4().hex
+        now = time.monotonic()
+        with self._lock:
+            self._entries[trace_id] = (now, trace)
+            self._evict_locked(now)
+        return trace_id
+
+    def get(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(trace_id)
+            if entry is None:
+                return None
+            stored_at, trace = entry
+            if self.ttl_seconds > 0 and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[trace_id]
+                return None
+            return trace
+
+    def _evict_locked(self, now: float) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        if self.ttl_seconds <= 0:
+            return
+        # 삽입 순서 = 시간 순서이므로 앞에서부터 만료된 것만 걷어낸다.
+        while self._entries:
+            oldest_id, (stored_at, _) = next(iter(self._entries.items()))
+            if now - stored_at <= self.ttl_seconds:
+                break
+            del self._entries[oldest_id]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+
+@lru_cache(maxsize=1)
+def get_trace_store() -> TraceStore:
+    return TraceStore(
+        max_entries=int(os.getenv("REACT_TRACE_STORE_SIZE", "256")),
+        ttl_seconds=float(os.getenv("REACT_TRACE_TTL_SECONDS", "3600")),
+    )
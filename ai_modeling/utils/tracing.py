@@ -0,0 +1,269 @@
+"""Lightweight trace spans correlated by request id through contextvars.
+
+백엔드 라우트 → orchestrator → ReActAgent → Tool → provider HTTP 호출 → DB 쿼리까지 한 요청의
+구간을 같은 trace_id로 묶는다. 현재 span은 contextvar에 있으므로 같은 태스크와
+``run_in_threadpool``(컨텍스트 복사)로 넘어간 동기 코드에서도 그대로 보인다. 직접 만든
+``ThreadPoolExecutor``에 넘길 때는 ``contextvars.copy_context().run``으로 감싼다.
+
+- 루트 span은 백엔드 ``TracingMiddleware``가 연다 (``traceparent``/``x-request-id`` 헤더를 이어받음).
+- ``ai_modeling.utils.metrics.timed``는 열린 trace가 있을 때 자식 span도 함께 남긴다.
+- 끝난 span은 배경 스레드가 모아서 ``TRACE_EXPORTER``로 내보낸다:
+  ``jsonl`` (``TRACE_EXPORT_PATH``에 한 줄씩), ``http`` (``TRACE_EXPORT_URL``로 JSON 배치 POST,
+  OTLP/JSON과 같은 필드 이름), 비어 있으면 꺼짐 (span을 만들지 않음).
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import os
+import queue
+import re
+import secrets
+import threading
+import time
+from contextvars import ContextVar, Token
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_BATCH_SIZE = 256
+_FLUSH_INTERVAL = 1.0
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "attributes", "start", "end", "error")
+
+    def __init__(
+        self,
+        name: str,
+        trace_id: str,
+        parent_id: Optional[str] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+        start: Optional[float] = None,
+    ) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.attributes: Dict[str, Any] = dict(attributes or {})
+        self.start = time.time() if start is None else start
+        self.end: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        return ((self.end or time.time()) - self.start) * 1000
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "startTimeUnixNano": int(self.start * 1e9),
+            "endTimeUnixNano": int((self.end or self.start) * 1e9),
+            "durationMs": round(self.duration_ms, 3),
+            "attributes": self.attributes,
+            "status": {"code": "ERROR", "message": self.error} if self.error else {"code": "OK"},
+        }
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("ilowa_current_span", default=None)
+
+SpanHandle = Tuple[Span, Token]
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def current_request_id() -> Optional[str]:
+    """trace_id of the request being handled (used as the request id)."""
+    span = _current_span.get()
+    return span.trace_id if span is not None else None
+
+
+def start_span(name: str, *, root: bool = False, traceparent: Optional[str] = None, **attributes: Any) -> Optional[SpanHandle]:
+    """Open a span as the current one; returns ``None`` when there is nothing to attach to.
+
+    ``root=False`` (기본): 열린 trace가 있을 때만 자식 span을 만든다 (스크립트/워밍업 호출은 무시).
+    ``root=True``: 부모가 없으면 새 trace를 시작한다. ``traceparent``가 있으면 그 trace를 잇는다.
+    """
+    if get_exporter() is None:
+        return None
+    parent = _current_span.get()
+    if parent is not None:
+        span = Span(name, parent.trace_id, parent.span_id, attributes)
+    elif root:
+        match = _TRACEPARENT.match(traceparent or "")
+        if match:
+            span = Span(name, match.group(1), match.group(2), attributes)
+        else:
+            span = Span(name, secrets.token_hex(16), None, attributes)
+    else:
+        return None
+    return span, _current_span.set(span)
+
+
+def end_span(handle: Optional[SpanHandle], error: Optional[BaseException] = None) -> None:
+    if handle is None:
+        return
+    span, token = handle
+    span.end = time.time()
+    if error is not None:
+        span.error = f"{type(error).__name__}: {error}"
+    try:
+        _current_span.reset(token)
+    except ValueError:
+        # 다른 컨텍스트에서 닫히는 경우(제너레이터 등)에도 span은 내보낸다.
+        pass
+    exporter = get_exporter()
+    if exporter is not None:
+        exporter.export(span)
+
+
+class span:
+    """``with span("orchestrator.recommend", provider=name):`` — child span of the current trace."""
+
+    __slots__ = ("name", "attributes", "root", "_handle")
+
+    def __init__(self, name: str, root: bool = False, **attributes: Any) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.root = root
+        self._handle: Optional[SpanHandle] = None
+
+    def __enter__(self) -> Optional[Span]:
+        self._handle = start_span(self.name, root=self.root, **self.attributes)
+        return self._handle[0] if self._handle else None
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end_span(self._handle, exc)
+
+
+def record_span(name: str, duration_s: float, error: Optional[str] = None, **attributes: Any) -> None:
+    """Record an already-finished child span (e.g. a DB statement timed by cursor events)."""
+    parent = _current_span.get()
+    exporter = get_exporter()
+    if parent is None or exporter is None:
+        return
+    end = time.time()
+    child = Span(name, parent.trace_id, parent.span_id, attributes, start=end - duration_s)
+    child.end = end
+    child.error = error
+    exporter.export(child)
+
+
+# ---------- export ----------
+
+
+class SpanExporter:
+    """Batches finished spans on a daemon thread and writes them to a JSONL file or an HTTP collector."""
+
+    def __init__(self, path: Optional[Path] = None, url: Optional[str] = None, timeout: float = 2.0) -> None:
+        self.path = path
+        self.url = url
+        self.timeout = timeout
+        self.exported = 0
+        self.dropped = 0
+        self._queue: "queue.SimpleQueue[Optional[Span]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def export(self, span: Span) -> None:
+        self._queue.put(span)
+
+    def shutdown(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=self.timeout + 1)
+
+    def _run(self) -> None:
+        batch: List[Span] = []
+        deadline = time.monotonic() + _FLUSH_INTERVAL
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = False
+            if item is None:
+                self._flush(batch)
+                return
+            if item is not False:
+                batch.append(item)
+            if len(batch) >= _BATCH_SIZE or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + _FLUSH_INTERVAL
+
+    def _flush(self, batch: List[Span]) -> None:
+        if not batch:
+            return
+        rows = [item.to_dict() for item in batch]
+        try:
+            if self.path is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as fp:
+                    fp.writelines(json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows)
+            if self.url:
+                import urllib.request  # http exporter를 쓸 때만 로드
+
+                body = json.dumps({"spans": rows}, ensure_ascii=False, default=str).encode("utf-8")
+                request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+                urllib.request.urlopen(request, timeout=self.timeout).close()
+            self.exported += len(rows)
+        except Exception as exc:
+            self.dropped += len(rows)
+            logger.warning("Dropped %d spans: %s", len(rows), exc)
+
+
+_exporter_lock = threading.Lock()
+_exporter: Optional[SpanExporter] = None
+_configured = False
+
+
+def get_exporter() -> Optional[SpanExporter]:
+    """Exporter from ``TRACE_EXPORTER`` (jsonl / http), created once; ``None`` disables tracing."""
+    global _exporter, _configured
+    if _configured:
+        return _exporter
+    with _exporter_lock:
+        if not _configured:
+            kind = (os.getenv("TRACE_EXPORTER") or "").strip().lower()
+            if kind == "jsonl":
+                _exporter = SpanExporter(path=Path(os.getenv("TRACE_EXPORT_PATH", "traces.jsonl")))
+            elif kind == "http":
+                url = os.getenv("TRACE_EXPORT_URL", "").strip()
+                _exporter = SpanExporter(url=url) if url else None
+            elif kind:
+                logger.warning("Unknown TRACE_EXPORTER=%s, tracing disabled", kind)
+            if _exporter is not None:
+                atexit.register(_exporter.shutdown)
+            _configured = True
+    return _exporter
+
+
+def _reset_after_fork() -> None:
+    # 내보내기 스레드는 fork된 자식(gunicorn preload 워커)에 따라오지 않는다. 자식에서 처음 쓸 때 새로 만든다.
+    global _exporter_lock, _exporter, _configured
+    _exporter_lock = threading.Lock()
+    _exporter = None
+    _configured = False
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def tracing_enabled() -> bool:
+    return get_exporter() is not None
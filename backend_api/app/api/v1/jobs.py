@@ -10,12 +10,12 @@ import pathlib
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select, or_
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from sqlalchemy import func, select, or_, text
 from sqlmodel import Session
 
 from backend_api.app.core.security import get_current_user_id
-from backend_api.app.db.database import get_db
+from backend_api.app.db.database import engine, get_db
 from backend_api.app.db.models import (
     ApplicationStatus,
     JobApplication,
@@ -29,6 +29,7 @@ from backend_api.app.services.naver_geocoder import NaverGeocoder
 from backend_api.app.services.google_geocoder import GoogleGeocoder
 from backend_api.app.services.job_seeder import seed_jobs_from_csv
 from backend_api.app.services.ai_pipeline import get_pipeline
+from backend_api.app.services import media_worker
 from backend_api.app.schemas.jobs import (
     ApplicantMatchInfo,
     JobAiCreate,
@@ -47,6 +48,21 @@ from ai_modeling.schemas.recommendation import UserProfile
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 logger = logging.getLogger(__name__)
 DEFAULT_COORDS = (37.5665, 126.9780)
+_REGION_COORDS = {
+    "성동": (37.5636, 127.0364),
+    "강남": (37.5172, 127.0473),
+    "서초": (37.4836, 127.0327),
+    "마포": (37.5568, 126.9101),
+    "송파": (37.5145, 127.1056),
+    "은평": (37.6176, 126.9227),
+    "부산": (35.1796, 129.0756),
+    "대구": (35.8714, 128.6014),
+    "광주": (35.1595, 126.8526),
+    "대전": (36.3504, 127.3845),
+}
+# deferred: 요청 경로에서는 캐시/지역 사전 좌표만 쓰고 정밀 지오코딩은 응답 후 백그라운드에서 갱신
+# sync: 요청 안에서 Naver → Google 순으로 바로 조회 (이전 동작)
+JOB_GEOCODE_MODE = os.getenv("JOB_GEOCODE_MODE", "deferred").strip().lower()
 DEFAULT_SEED_CSV = pathlib.Path(
     os.getenv(
         "SEED_JOBS_JSON",
@@ -129,58 +145,99 @@ def _build_user_profile(user: User) -> UserProfile:
     )
 
 
-def _guess_coordinates(*candidates: Optional[str]) -> tuple[Optional[float], Optional[float]]:
-    texts = [text.strip() for text in candidates if text and text.strip()]
-    if not texts:
-        return DEFAULT_COORDS
-
-    geocoder = _get_naver_geocoder()
-    if geocoder:
-        # Try individual candidates first, then the combined text for better accuracy.
-        queries = texts + [" ".join(texts)]
+def _geocoder_lookup(
+    texts: list[str], *, cached_only: bool
+) -> Optional[tuple[float, float]]:
+    # Try individual candidates first, then the combined text for better accuracy.
+    queries = _unique(texts + [" ".join(texts)])
+    for label, getter in (("Naver", _get_naver_geocoder), ("Google", _get_google_geocoder)):
+        geocoder = getter()
+        if not geocoder:
+            continue
         for query in queries:
-            if not query:
-                continue
             try:
-                coords = geocoder.geocode(query)
+                if cached_only:
+                    coords = geocoder.lookup_cached(query)
+                else:
+                    coords = geocoder.geocode(query)
             except Exception as exc:  # pragma: no cover - network issues
-                logger.warning("Naver geocode failed for '%s': %s", query, exc)
+                logger.warning("%s geocode failed for '%s': %s", label, query, exc)
                 coords = None
             if coords:
                 return coords
+    return None
 
-    google = _get_google_geocoder()
-    if google:
-        for query in texts + [" ".join(texts)]:
-            if not query:
-                continue
-            try:
-                coords = google.geocode(query)
-            except Exception as exc:
-                logger.warning("Google geocode failed for '%s': %s", query, exc)
-                coords = None
-            if coords:
-                return coords
 
-    mapping = {
-        "성동": (37.5636, 127.0364),
-        "강남": (37.5172, 127.0473),
-        "서초": (37.4836, 127.0327),
-        "마포": (37.5568, 126.9101),
-        "송파": (37.5145, 127.1056),
-        "은평": (37.6176, 126.9227),
-        "부산": (35.1796, 129.0756),
-        "대구": (35.8714, 128.6014),
-        "광주": (35.1595, 126.8526),
-        "대전": (36.3504, 127.3845),
-    }
+def _resolve_coordinates(
+    *candidates: Optional[str], cached_only: bool = False
+) -> tuple[tuple[float, float], bool]:
+    """좌표와 함께 지오코더(정밀) 결과인지 여부를 돌려준다.
+
+    cached_only=True이면 지오코더 디스크 캐시만 보고 네트워크 호출은 하지 않는다.
+    """
+    texts = [text.strip() for text in candidates if text and text.strip()]
+    if not texts:
+        return DEFAULT_COORDS, False
+
+    coords = _geocoder_lookup(texts, cached_only=cached_only)
+    if coords:
+        return coords, True
 
     for query in texts:
-        for key, coords in mapping.items():
+        for key, region_coords in _REGION_COORDS.items():
             if key in query:
-                return coords
+                return region_coords, False
+
+    return DEFAULT_COORDS, False
+
+
+def _initial_coordinates(*candidates: Optional[str]) -> tuple[tuple[float, float], bool]:
+    """요청 경로에서 쓸 좌표와 백그라운드 정밀 지오코딩 필요 여부를 돌려준다."""
+    if JOB_GEOCODE_MODE == "sync":
+        coords, _ = _resolve_coordinates(*candidates)
+        return coords, False
+    coords, precise = _resolve_coordinates(*candidates, cached_only=True)
+    has_text = any(text and text.strip() for text in candidates)
+    return coords, has_text and not precise
+
+
+def _refine_job_coordinates(
+    job_id: UUID,
+    candidates: tuple[Optional[str], ...],
+    provisional: tuple[float, float],
+) -> None:
+    """응답 이후 정밀 지오코딩 결과로 lat/lng/geom을 갱신한다 (BackgroundTasks)."""
+    coords, precise = _resolve_coordinates(*candidates)
+    if not precise:
+        return
+
+    lat, lng = coords
+    with Session(engine) as session:
+        job = session.get(JobPost, job_id)
+        if not job:
+            return
+        # 그사이 좌표가 바뀌었다면(수동 수정 등) 덮어쓰지 않는다.
+        if (job.lat, job.lng) != provisional:
+            return
+        job.lat = lat
+        job.lng = lng
+        session.add(job)
+        session.commit()
+
+        try:
+            session.exec(
+                text(
+                    "UPDATE job_post "
+                    "SET geom = ST_SetSRID(ST_MakePoint(lng, lat), 4326) "
+                    "WHERE id = :job_id"
+                ).bindparams(job_id=job_id)
+            )
+            session.commit()
+        except Exception as exc:  # pragma: no cover - optional if PostGIS not present
+            session.rollback()
+            logger.debug("PostGIS geom refresh skipped for job %s: %s", job_id, exc)
 
-    return DEFAULT_COORDS
+    logger.info("Refined coordinates for job %s -> (%s, %s)", job_id, lat, lng)
 
 
 def _coerce_float(value: Any) -> Optional[float]:
@@ -388,11 +445,15 @@ def _fetch_match_info(db: Session, applicant_ids: List[UUID]) -> Dict[UUID, Appl
     return info
 
 
-def _collect_media_from_uploads(upload_ids: list[UUID], db: Session) -> tuple[list[str], list[str]]:
+def _collect_media_from_uploads(
+    upload_ids: list[UUID], db: Session
+) -> tuple[list[str], list[str], list[UUID]]:
+    """(raw_media, images, 변환이 끝나지 않은 PDF 업로드 id)."""
     raw_files: list[str] = []
     images: list[str] = []
+    converting: list[UUID] = []
     if not upload_ids:
-        return raw_files, images
+        return raw_files, images, converting
 
     for upload_id in upload_ids:
         upload = db.get(MediaUpload, upload_id)
@@ -401,14 +462,20 @@ def _collect_media_from_uploads(upload_ids: list[UUID], db: Session) -> tuple[li
         extra = upload.extra or {}
         raw_url = extra.get("raw_url") or _public_media_url(upload.file_path)
         converted = extra.get("converted_urls") or []
+        conversion_status = extra.get("conversion_status")
         if raw_url:
             raw_files.append(str(raw_url))
         if converted:
             images.extend([str(url) for url in converted if url])
+        elif conversion_status in ("pending", "failed"):
+            # PDF 원본은 이미지로 쓸 수 없다. pending이면 변환이 끝난 뒤
+            # media_worker.attach_converted_images가 페이지 이미지를 채운다.
+            if conversion_status == "pending":
+                converting.append(upload.id)
         elif raw_url:
             images.append(str(raw_url))
 
-    return raw_files, images
+    return raw_files, images, converting
 
 
 @router.get("", response_model=JobListResponse)
@@ -484,6 +551,8 @@ def list_recommended_jobs(
         user_profile=profile.dict(),
         intent=intent or "",
         previous_recommendations=[],
+        # 이 엔드포인트는 추천 목록만 쓰므로 추론 기록을 만들지 않는다.
+        trace_level="none",
     )
     recs = result.get("recommendations") or []
     formatted: List[Dict[str, Any]] = []
@@ -571,6 +640,7 @@ def seed_jobs_from_csv_endpoint(
 @router.post("", response_model=JobRead, status_code=status.HTTP_201_CREATED)
 def create_job(
     payload: JobCreate,
+    background_tasks: BackgroundTasks,
     current_user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
@@ -578,13 +648,16 @@ def create_job(
     if not owner:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다.")
 
-    lat, lng = _guess_coordinates(payload.address, payload.place)
+    geo_candidates = (payload.address, payload.place)
+    (lat, lng), needs_refine = _initial_coordinates(*geo_candidates)
     lat_override = _coerce_float(payload.lat)
     lng_override = _coerce_float(payload.lng)
     if lat_override is not None:
         lat = lat_override
     if lng_override is not None:
         lng = lng_override
+    if lat_override is not None or lng_override is not None:
+        needs_refine = False
 
     job = JobPost(
         owner_id=current_user_id,
@@ -614,12 +687,16 @@ def create_job(
     db.commit()
     db.refresh(job)
 
+    if needs_refine:
+        background_tasks.add_task(_refine_job_coordinates, job.id, geo_candidates, (lat, lng))
+
     return _to_job_read(job, owner)
 
 
 @router.post("/from-image", response_model=dict, status_code=status.HTTP_201_CREATED)
 def create_from_ai(
     payload: JobAiCreate,
+    background_tasks: BackgroundTasks,
     current_user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
@@ -628,13 +705,16 @@ def create_from_ai(
     title = str(fields.get("title") or "AI 생성 공고")
     description = str(fields.get("description") or "AI가 생성한 공고 내용을 확인해주세요.")
     location_text = fields.get("location") or fields.get("place")
-    lat, lng = _guess_coordinates(fields.get("address"), location_text)
+    geo_candidates = (fields.get("address"), location_text)
+    (lat, lng), needs_refine = _initial_coordinates(*geo_candidates)
     lat_override = _coerce_float(fields.get("lat") or fields.get("latitude"))
     lng_override = _coerce_float(fields.get("lng") or fields.get("longitude"))
     if lat_override is not None:
         lat = lat_override
     if lng_override is not None:
         lng = lng_override
+    if lat_override is not None or lng_override is not None:
+        needs_refine = False
 
     hourly = None
     wage_field = fields.get("wage") or fields.get("pay")
@@ -649,7 +729,7 @@ def create_from_ai(
     provided_raw_media = _coerce_str_list(fields.get("raw_media") or fields.get("source_files"))
     upload_ids = list(payload.upload_ids or [])
     upload_ids.extend(_coerce_uuid_list(fields.get("upload_ids")))
-    raw_from_uploads, images_from_uploads = _collect_media_from_uploads(upload_ids, db)
+    raw_from_uploads, images_from_uploads, converting_uploads = _collect_media_from_uploads(upload_ids, db)
     job_images = _unique(provided_images + images_from_uploads)
     job_raw_media = _unique(provided_raw_media + raw_from_uploads)
 
@@ -682,6 +762,14 @@ def create_from_ai(
     db.commit()
     db.refresh(job)
 
+    for upload_id in converting_uploads:
+        media_worker.attach_converted_images(upload_id, job.id)
+    if converting_uploads:
+        db.refresh(job)
+
+    if needs_refine:
+        background_tasks.add_task(_refine_job_coordinates, job.id, geo_candidates, (lat, lng))
+
     owner = db.get(User, current_user_id)
 
     return {
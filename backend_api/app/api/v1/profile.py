@@ -5,21 +5,21 @@ import uuid
 from typing import Annotated, Dict, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend_api.app.core.security import get_current_user_id
-from backend_api.app.db.database import get_db
+from backend_api.app.db.database import get_async_db
 from backend_api.app.db.models.auth import User
 from backend_api.app.schemas import profile as profile_schemas
 
 router = APIRouter(tags=["Profile - 온보딩"])
 
 CurrentUserIdDep = Annotated[uuid.UUID, Depends(get_current_user_id)]
-DbSessionDep = Annotated[Session, Depends(get_db)]
+DbSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 
 
-def _get_user_or_404(db: Session, user_id: uuid.UUID) -> User:
-    user = db.get(User, user_id)
+async def _get_user_or_404(db: AsyncSession, user_id: uuid.UUID) -> User:
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -46,7 +46,7 @@ async def update_account_profile(
 ):
     """Update nickname/location basics coming from the onboarding nickname screen."""
 
-    user = _get_user_or_404(db, current_user_id)
+    user = await _get_user_or_404(db, current_user_id)
 
     data = req.model_dump(exclude_unset=True)
     if "nickname" in data:
@@ -55,8 +55,8 @@ async def update_account_profile(
         user.location = data["location"]
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return await get_profile_summary(current_user_id, db)  # type: ignore[misc]
 
@@ -70,7 +70,7 @@ async def save_location_preferences(
 ):
     """Persist preferred working location and update the primary location string."""
 
-    user = _get_user_or_404(db, current_user_id)
+    user = await _get_user_or_404(db, current_user_id)
 
     prefs = _merge_preferences(
         user,
@@ -87,8 +87,8 @@ async def save_location_preferences(
         user.location = req.regions[0]
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return await get_profile_summary(current_user_id, db)  # type: ignore[misc]
 
@@ -102,7 +102,7 @@ async def save_time_preferences(
 ):
     """Save preferred days and time slots."""
 
-    user = _get_user_or_404(db, current_user_id)
+    user = await _get_user_or_404(db, current_user_id)
 
     _merge_preferences(
         user,
@@ -113,8 +113,8 @@ async def save_time_preferences(
     )
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return await get_profile_summary(current_user_id, db)  # type: ignore[misc]
 
@@ -128,7 +128,7 @@ async def save_history_preferences(
 ):
     """Persist past job experiences information."""
 
-    user = _get_user_or_404(db, current_user_id)
+    user = await _get_user_or_404(db, current_user_id)
 
     experiences = req.experiences or []
     _merge_preferences(
@@ -140,8 +140,8 @@ async def save_history_preferences(
     )
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return await get_profile_summary(current_user_id, db)  # type: ignore[misc]
 
@@ -155,7 +155,7 @@ async def save_capability_preferences(
 ):
     """Save preferred physical workload intensity."""
 
-    user = _get_user_or_404(db, current_user_id)
+    user = await _get_user_or_404(db, current_user_id)
 
     capability_payload = {
         "physical_level": req.physical_level,
@@ -171,8 +171,8 @@ async def save_capability_preferences(
     )
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return await get_profile_summary(current_user_id, db)  # type: ignore[misc]
 
@@ -185,7 +185,7 @@ async def get_profile_summary(
 ):
     """Return the merged summary data consumed by the onboarding summary screen."""
 
-    user = _get_user_or_404(db, current_user_id)
+    user = await _get_user_or_404(db, current_user_id)
 
     phone_number = user.phone_number
     location = user.location
@@ -250,12 +250,12 @@ async def finalize_profile(
 ):
     """Mark onboarding flow as completed."""
 
-    user = _get_user_or_404(db, current_user_id)
+    user = await _get_user_or_404(db, current_user_id)
     user.is_onboarding_complete = True
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     return profile_schemas.ProfileSaveResponse(
         user_id=user.user_id,
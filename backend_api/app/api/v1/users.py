@@ -4,9 +4,9 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, status, HTTPException
-from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from backend_api.app.db.database import get_db
+from backend_api.app.db.database import get_async_db
 from backend_api.app.db.models.auth import User  # 통합된 User 모델
 from backend_api.app.schemas.auth import UserProfileUpdateRequest
 from backend_api.app.schemas import profile as profile_schemas
@@ -19,7 +19,7 @@ router = APIRouter(
 
 # 의존성 타입
 CurrentUserIdDep = Annotated[uuid.UUID, Depends(get_current_user_id)]
-DbSessionDep = Annotated[Session, Depends(get_db)]
+DbSessionDep = Annotated[AsyncSession, Depends(get_async_db)]
 
 
 @router.get(
@@ -37,7 +37,7 @@ async def get_my_profile(
     통합된 User 모델에서 닉네임/지역/온보딩 상태를 반환합니다.
     """
     # PK가 user_id인 모델이라고 가정합니다.
-    user = db.get(User, current_user_id)
+    user = await db.get(User, current_user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다."
@@ -72,7 +72,7 @@ async def update_my_profile(
     """
     현재 인증된 사용자의 닉네임/지역 등을 업데이트합니다.
     """
-    user = db.get(User, current_user_id)
+    user = await db.get(User, current_user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다."
@@ -87,8 +87,8 @@ async def update_my_profile(
         user.location = update_data["location"]
 
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
 
     account = profile_schemas.ProfileAccountSummary(
         nickname=user.nickname,
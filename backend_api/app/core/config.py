@@ -7,6 +7,11 @@ from datetime import timedelta
 import random,os
 from urllib.parse import quote_plus
 
+from ai_modeling.utils.env import load_env_once
+
+# Settings 밖에서 os.getenv로 읽는 값들도 .env를 따르도록 먼저 로드한다 (스크립트/bootstrap 포함).
+load_env_once()
+
 # 0. OTP 더미 코드 생성 
 
 def generate_otp_code(length: int = 6) -> str:
@@ -24,6 +29,9 @@ class Settings(BaseSettings):
     USE_DUMMY_SMS: bool = False
     DUMMY_OTP_CODE: str = "0000"
     AI_PROVIDER: str = "naver"
+    # 시작 시 orchestrator(CSV/임베딩/provider)를 백그라운드에서 미리 만든다. GET /ready가 완료 여부를 알려준다.
+    AI_WARMUP_ENABLED: bool = False
+    AI_WARMUP_PROVIDERS: Optional[str] = None
     # 환경 변수 파일을 사용함을 명시 (.env 파일 사용 시)
     model_config = SettingsConfigDict(env_file='.env', extra='ignore')
 
@@ -35,6 +43,15 @@ class Settings(BaseSettings):
     POSTGRES_DB: Optional[str] = None
     POSTGRES_HOST: str = "db"
     POSTGRES_PORT: int = 5432
+    # async 핸들러용 엔진 URL. 비우면 DATABASE_URL의 드라이버만 asyncpg/aiosqlite로 바꿔 쓴다.
+    ASYNC_DATABASE_URL: Optional[str] = None
+    # SQL 로그: 모든 문장 출력(echo)은 개발용으로만 켜고, 운영에서는 느린 쿼리만 경고로 남긴다.
+    SQL_ECHO: bool = False
+    SQL_SLOW_QUERY_MS: float = 200.0
+    # 이벤트 루프 지연 샘플러/blocking watchdog (core/loop_monitor.py). 통계: /health/loop, /metrics
+    LOOP_MONITOR_ENABLED: bool = False
+    LOOP_MONITOR_INTERVAL_MS: float = 100.0
+    LOOP_BLOCK_THRESHOLD_MS: float = 250.0
 
     # B. JWT 보안 설정
     SECRET_KEY: str = "YOUR_HIGHLY_SECURE_SECRET_KEY_HERE"
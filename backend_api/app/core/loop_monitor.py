@@ -0,0 +1,231 @@
+"""Event-loop lag sampler and blocking-callback watchdog.
+
+``async def`` 핸들러 안의 동기 호출(DB, 파일 I/O, STT, ReAct 실행 등)은 그동안 같은 워커의
+모든 요청을 멈춘다. ``LOOP_MONITOR_ENABLED=true``이면
+
+- 루프 안의 샘플러가 ``LOOP_MONITOR_INTERVAL_MS`` 간격으로 깨어나며 예정보다 늦어진 시간(lag)을 기록하고,
+- 별도 watchdog 스레드가 샘플러가 ``LOOP_BLOCK_THRESHOLD_MS`` 이상 깨어나지 못하면 그 순간 루프 스레드의
+  스택을 떠서 어떤 라우트의 어떤 코드가 막고 있는지 경고 로그로 남긴다.
+
+통계는 ``GET /health/loop``로 본다. 샘플링 간격마다 코루틴 한 번 깨우는 비용뿐이라 운영에서도 켜 둘 수 있다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from backend_api.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+LAG_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+_STACK_LIMIT = 25
+_RECENT_STALLS = 20
+
+
+def loop_monitor_enabled() -> bool:
+    return settings.LOOP_MONITOR_ENABLED
+
+
+class LoopMonitorMiddleware:
+    """Pure ASGI middleware whose frame marks which request a blocked stack belongs to.
+
+    요청 처리 코루틴이 실행 중일 때는 이 ``__call__`` 프레임도 루프 스레드 스택에 있으므로,
+    watchdog이 스택을 거슬러 올라가 ``scope``에서 라우트를 읽는다.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        await self.app(scope, receive, send)
+
+
+_MIDDLEWARE_CODE = LoopMonitorMiddleware.__call__.__code__
+
+
+def _route_for(frame: Any) -> str:
+    while frame is not None:
+        if frame.f_code is _MIDDLEWARE_CODE:
+            scope = frame.f_locals.get("scope") or {}
+            route = scope.get("route")
+            path = getattr(route, "path", None) or scope.get("path") or "?"
+            return f"{scope.get('method', scope.get('type', ''))} {path}".strip()
+        frame = frame.f_back
+    return "<no request>"
+
+
+class LoopMonitor:
+    def __init__(self, interval: float = 0.1, threshold: float = 0.25) -> None:
+        self.interval = max(0.01, interval)
+        self.threshold = max(self.interval, threshold)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = 0.0
+        self._reported_heartbeat = -1.0
+
+        self.samples = 0
+        self.lag_sum_ms = 0.0
+        self.lag_max_ms = 0.0
+        self.last_lag_ms = 0.0
+        self.bucket_counts = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.stalls = 0
+        self.stalls_by_route: Dict[str, int] = {}
+        self.recent_stalls: Deque[Dict[str, Any]] = deque(maxlen=_RECENT_STALLS)
+
+    # ---------- lifecycle ----------
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._task = loop.create_task(self._sample())
+        self._thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(
+            "Loop monitor started (interval=%.0fms, block threshold=%.0fms)",
+            self.interval * 1000,
+            self.threshold * 1000,
+        )
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    # ---------- sampler (event loop) ----------
+    async def _sample(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self._record_lag(max(0.0, now - expected) * 1000)
+            self._heartbeat = now
+
+    def _record_lag(self, lag_ms: float) -> None:
+        index = len(LAG_BUCKETS_MS)
+        for i, bound in enumerate(LAG_BUCKETS_MS):
+            if lag_ms <= bound:
+                index = i
+                break
+        with self._lock:
+            self.samples += 1
+            self.lag_sum_ms += lag_ms
+            self.last_lag_ms = lag_ms
+            self.lag_max_ms = max(self.lag_max_ms, lag_ms)
+            self.bucket_counts[index] += 1
+
+    # ---------- watchdog (thread) ----------
+    def _watch(self) -> None:
+        check_every = min(self.interval, self.threshold / 2)
+        while not self._stop.wait(check_every):
+            heartbeat = self._heartbeat
+            blocked_for = time.monotonic() - heartbeat - self.interval
+            # 한 번 멈춘 구간은 한 번만 보고한다 (샘플러가 다시 깨어나면 heartbeat가 바뀜).
+            if blocked_for < self.threshold or heartbeat == self._reported_heartbeat:
+                continue
+            self._reported_heartbeat = heartbeat
+            self._report_stall(blocked_for)
+
+    def _report_stall(self, blocked_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id) if self._loop_thread_id else None
+        if frame is None:
+            return
+        route = _route_for(frame)
+        stack = traceback.format_stack(frame, limit=_STACK_LIMIT)
+        del frame
+        blocked_ms = blocked_for * 1000
+        logger.warning(
+            "Event loop blocked for %.0f ms (still running) in %s\n%s",
+            blocked_ms,
+            route,
+            "".join(stack),
+        )
+        with self._lock:
+            self.stalls += 1
+            self.stalls_by_route[route] = self.stalls_by_route.get(route, 0) + 1
+            self.recent_stalls.append(
+                {
+                    "route": route,
+                    "blocked_ms": round(blocked_ms, 1),
+                    "at": time.time(),
+                    "stack": [line.strip() for line in stack[-6:]],
+                }
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets: List[Dict[str, Any]] = []
+            cumulative = 0
+            for bound, count in zip(list(LAG_BUCKETS_MS) + ["+Inf"], self.bucket_counts):
+                cumulative += count
+                buckets.append({"le_ms": bound, "count": cumulative})
+            return {
+                "enabled": True,
+                "interval_ms": self.interval * 1000,
+                "block_threshold_ms": self.threshold * 1000,
+                "samples": self.samples,
+                "lag_ms": {
+                    "last": round(self.last_lag_ms, 2),
+                    "max": round(self.lag_max_ms, 2),
+                    "mean": round(self.lag_sum_ms / self.samples, 2) if self.samples else 0.0,
+                    "sum": round(self.lag_sum_ms, 2),
+                    "buckets": buckets,
+                },
+                "stalls": self.stalls,
+                "stalls_by_route": dict(self.stalls_by_route),
+                "recent_stalls": list(self.recent_stalls),
+            }
+
+
+_monitor: Optional[LoopMonitor] = None
+
+
+def get_loop_monitor() -> Optional[LoopMonitor]:
+    return _monitor
+
+
+def start_loop_monitor() -> Optional[LoopMonitor]:
+    """Start sampling on the running loop when enabled (call from the app lifespan)."""
+    global _monitor
+    if not loop_monitor_enabled():
+        return None
+    if _monitor is None:
+        _monitor = LoopMonitor(
+            interval=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+            threshold=settings.LOOP_BLOCK_THRESHOLD_MS / 1000,
+        )
+        _monitor.start()
+    return _monitor
+
+
+async def stop_loop_monitor() -> None:
+    global _monitor
+    if _monitor is not None:
+        await _monitor.stop()
+        _monitor = None
+
+
+def loop_monitor_stats() -> Dict[str, Any]:
+    monitor = _monitor
+    if monitor is None:
+        return {"enabled": False}
+    return monitor.stats()
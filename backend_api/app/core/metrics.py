@@ -0,0 +1,138 @@
+"""HTTP latency histograms and runtime gauges/counters for ``GET /metrics``.
+
+AI 쪽 단계(ReAct, Tool, provider, 지오코더, 캐시)는 ``ai_modeling.utils.metrics``의 같은 레지스트리에
+기록되므로, 여기서는 HTTP 라우트 지연과 스크레이프 시점에 읽는 상태 값(circuit/bulkhead,
+single-flight, SQL 누적치, 이벤트 루프 지연/정지)만 더한다.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict
+
+from ai_modeling.services.resilience import guard_status
+from ai_modeling.utils.metrics import REGISTRY
+from ai_modeling.utils.singleflight import single_flight_stats
+
+from backend_api.app.core.loop_monitor import LAG_BUCKETS_MS, loop_monitor_stats
+from backend_api.app.db.instrumentation import sql_stats
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "ilowa_http_request_duration_seconds",
+    "HTTP request latency by matched route template",
+    ("method", "route", "status"),
+)
+
+
+def _route_of(scope: Dict[str, Any]) -> str:
+    # 매칭된 라우트 템플릿만 라벨로 쓴다 (404 경로를 그대로 쓰면 시계열이 끝없이 늘어남).
+    return getattr(scope.get("route"), "path", None) or "<unmatched>"
+
+
+class HttpMetricsMiddleware:
+    """Pure ASGI middleware recording one histogram sample per HTTP request."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = {"code": 500}
+
+        async def send_with_status(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", ""),
+                route=_route_of(scope),
+                status=status["code"],
+            )
+
+
+def _guard_values(key: str) -> Dict[tuple, float]:
+    return {(capability,): float(row[key]) for capability, row in guard_status().items()}
+
+
+def _circuit_open() -> Dict[tuple, float]:
+    return {(capability,): 1.0 if row["state"] == "open" else 0.0 for capability, row in guard_status().items()}
+
+
+def _single_flight(key: str) -> Dict[tuple, float]:
+    return {(group,): float(row[key]) for group, row in single_flight_stats().items()}
+
+
+def _loop_lag() -> Dict[tuple, tuple]:
+    # /health/loop의 누적 버킷(ms)을 구간별 개수로 되돌려 초 단위 히스토그램으로 내보낸다.
+    stats = loop_monitor_stats()
+    if not stats.get("enabled"):
+        return {}
+    lag = stats["lag_ms"]
+    counts, previous = [], 0
+    for bucket in lag["buckets"]:
+        counts.append(bucket["count"] - previous)
+        previous = bucket["count"]
+    return {(): (counts, lag["sum"] / 1000)}
+
+
+def _loop_stalls() -> Dict[tuple, float]:
+    stats = loop_monitor_stats()
+    return {(route,): float(count) for route, count in stats.get("stalls_by_route", {}).items()}
+
+
+def _sql_totals() -> Dict[tuple, float]:
+    stats = sql_stats()
+    return {("statements",): stats["statements"], ("slow",): stats["slow"]}
+
+
+REGISTRY.gauge(
+    "ilowa_provider_in_flight",
+    "Provider calls currently holding a bulkhead slot",
+    ("capability",),
+    collect=lambda: _guard_values("in_flight"),
+)
+REGISTRY.counter(
+    "ilowa_provider_rejected_total",
+    "Provider calls rejected by the bulkhead since start",
+    ("capability",),
+    collect=lambda: _guard_values("rejected"),
+)
+REGISTRY.gauge(
+    "ilowa_provider_circuit_open",
+    "1 while the capability's circuit breaker is open",
+    ("capability",),
+    collect=_circuit_open,
+)
+REGISTRY.counter(
+    "ilowa_singleflight_coalesced_total",
+    "Calls served by an identical in-flight call since start",
+    ("group",),
+    collect=lambda: _single_flight("coalesced"),
+)
+REGISTRY.counter(
+    "ilowa_db_statements_total",
+    "SQL statements executed since start (all / slow)",
+    ("kind",),
+    collect=_sql_totals,
+)
+REGISTRY.histogram(
+    "ilowa_event_loop_lag_seconds",
+    "Event-loop wake-up lag sampled by the loop monitor (LOOP_MONITOR_ENABLED)",
+    buckets=[bound / 1000 for bound in LAG_BUCKETS_MS],
+    collect=_loop_lag,
+)
+REGISTRY.counter(
+    "ilowa_loop_stalls_total",
+    "Times the event loop was blocked longer than LOOP_BLOCK_THRESHOLD_MS, by route",
+    ("route",),
+    collect=_loop_stalls,
+)
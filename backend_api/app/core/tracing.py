@@ -0,0 +1,64 @@
+"""Root request span for ``ai_modeling.utils.tracing``.
+
+요청마다 루트 span을 열어 contextvar에 두므로, 그 아래 orchestrator/ReAct/Tool/provider 단계
+(``timed``)와 SQL 문장(``db.query``)이 같은 trace_id로 묶인다. 들어온 ``traceparent``가 있으면 그
+trace를 잇고, 응답에는 ``x-request-id``(= trace_id)와 ``traceparent``를 돌려준다.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from ai_modeling.utils.tracing import end_span, start_span, tracing_enabled
+
+
+def _header(scope: Dict[str, Any], name: bytes) -> str:
+    for key, value in scope.get("headers") or ():
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+class TracingMiddleware:
+    """Pure ASGI middleware; a no-op unless ``TRACE_EXPORTER`` is set."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http" or not tracing_enabled():
+            await self.app(scope, receive, send)
+            return
+
+        method = scope.get("method", "")
+        handle = start_span(
+            f"HTTP {method}",
+            root=True,
+            traceparent=_header(scope, b"traceparent"),
+            **{"http.method": method, "http.target": scope.get("path", "")},
+        )
+        root = handle[0]
+        request_id = _header(scope, b"x-request-id")
+        if request_id:
+            root.set_attribute("request_id", request_id)
+
+        async def send_with_ids(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                root.set_attribute("http.status_code", message["status"])
+                headers = list(message.get("headers") or [])
+                headers.append((b"x-request-id", (request_id or root.trace_id).encode("latin-1")))
+                headers.append((b"traceparent", root.traceparent.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        error = None
+        try:
+            await self.app(scope, receive, send_with_ids)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            route = getattr(scope.get("route"), "path", None) or "<unmatched>"
+            root.name = f"{method} {route}"
+            root.set_attribute("http.route", route)
+            end_span(handle, error)
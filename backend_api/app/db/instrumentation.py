@@ -0,0 +1,211 @@
+"""Per-request SQL statement counting, timing and slow-query logging.
+
+``echo=True`` 대신 SQLAlchemy cursor 이벤트로 문장 수와 DB 시간을 잰다.
+
+- ``QueryStatsMiddleware``가 요청마다 ``QueryStats``를 contextvar에 넣고, 응답 헤더에
+  ``Server-Timing: db;dur=<ms>;desc="<n> queries"``를 붙인 뒤 라우트별 누적치에 더한다.
+- ``SQL_SLOW_QUERY_MS``보다 오래 걸린 문장은 라우트와 함께 경고 로그로 남긴다.
+- ``assert_max_queries(n)``는 테스트/스크립트에서 블록 안 쿼리 수 상한(N+1 회귀)을 검사한다
+  (블록이 열려 있는 동안 프로세스의 모든 쿼리를 센다).
+
+contextvar에는 가변 객체를 넣으므로 threadpool에서 도는 동기 라우트의 쿼리도 같은 요청에 집계된다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from ai_modeling.utils.tracing import current_span, record_span
+
+from backend_api.app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+_START_KEY = "ilowa_query_start"
+_STATEMENT_PREVIEW = 500
+
+
+class QueryStats:
+    """Statements issued while handling one request (or one ``assert_max_queries`` block)."""
+
+    __slots__ = ("count", "total_ms", "slow", "statements", "scope")
+
+    def __init__(self, scope: Optional[Dict[str, Any]] = None, capture: bool = False) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.slow = 0
+        self.statements: Optional[List[str]] = [] if capture else None
+        self.scope = scope
+
+    @property
+    def route(self) -> str:
+        scope = self.scope
+        if not scope:
+            return "<no request>"
+        # 매칭된 라우트 템플릿만 쓴다 (404 경로까지 키로 쓰면 라우트별 통계가 끝없이 늘어남).
+        path = getattr(scope.get("route"), "path", None) or "<unmatched>"
+        return f"{scope.get('method', '')} {path}".strip()
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+_current: ContextVar[Optional[QueryStats]] = ContextVar("ilowa_query_stats", default=None)
+
+_totals_lock = threading.Lock()
+_totals: Dict[str, float] = {"statements": 0, "db_ms": 0.0, "slow": 0}
+_route_totals: Dict[str, Dict[str, float]] = {}
+# assert_max_queries 블록: TestClient처럼 앱이 다른 스레드/컨텍스트에서 돌아도 잡히도록 프로세스 전역으로 센다.
+_captures: List[QueryStats] = []
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def _add(stats: QueryStats, statement: str, elapsed_ms: float, slow: bool) -> None:
+    stats.count += 1
+    stats.total_ms += elapsed_ms
+    if slow:
+        stats.slow += 1
+    if stats.statements is not None:
+        stats.statements.append(statement)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_START_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    starts = conn.info.get(_START_KEY)
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    slow = elapsed_ms >= settings.SQL_SLOW_QUERY_MS
+
+    stats = _current.get()
+    if stats is not None:
+        _add(stats, statement, elapsed_ms, slow)
+    # 요청 trace가 열려 있을 때만 문장별 db.query span을 남긴다 (TRACE_EXPORTER가 없으면 열리지 않음).
+    if current_span() is not None:
+        record_span("db.query", elapsed_ms / 1000, statement=" ".join(statement.split())[:200])
+
+    with _totals_lock:
+        for capture in _captures:
+            _add(capture, statement, elapsed_ms, slow)
+        _totals["statements"] += 1
+        _totals["db_ms"] += elapsed_ms
+        if slow:
+            _totals["slow"] += 1
+
+    if slow:
+        logger.warning(
+            "Slow query %.1f ms [%s]: %s",
+            elapsed_ms,
+            stats.route if stats is not None else "<no request>",
+            " ".join(statement.split())[:_STATEMENT_PREVIEW],
+        )
+
+
+def _handle_error(context) -> None:
+    # 실패한 문장은 after_cursor_execute가 오지 않으므로 시작 시각만 걷어낸다.
+    connection = getattr(context, "connection", None)
+    starts = connection.info.get(_START_KEY) if connection is not None else None
+    if starts:
+        starts.pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach the timing hooks (pass ``async_engine.sync_engine`` for async engines)."""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def _record_request(stats: QueryStats) -> None:
+    route = stats.route
+    with _totals_lock:
+        row = _route_totals.setdefault(
+            route, {"requests": 0, "statements": 0, "db_ms": 0.0, "max_statements": 0}
+        )
+        row["requests"] += 1
+        row["statements"] += stats.count
+        row["db_ms"] += stats.total_ms
+        row["max_statements"] = max(row["max_statements"], stats.count)
+
+
+def sql_stats() -> Dict[str, Any]:
+    with _totals_lock:
+        routes = {
+            route: {
+                **row,
+                "db_ms": round(row["db_ms"], 1),
+                "avg_statements": round(row["statements"] / row["requests"], 2) if row["requests"] else 0.0,
+            }
+            for route, row in _route_totals.items()
+        }
+        return {
+            "slow_query_ms": settings.SQL_SLOW_QUERY_MS,
+            "statements": int(_totals["statements"]),
+            "db_ms": round(_totals["db_ms"], 1),
+            "slow": int(_totals["slow"]),
+            "routes": routes,
+        }
+
+
+class QueryStatsMiddleware:
+    """Pure ASGI middleware: per-request stats + ``Server-Timing`` response header."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = _current.set(stats)
+
+        async def send_with_timing(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers") or [])
+                headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            _record_request(stats)
+
+
+@contextmanager
+def assert_max_queries(limit: int) -> Iterator[QueryStats]:
+    """Fail if the block issues more than ``limit`` statements.
+
+        with assert_max_queries(3):
+            client.get("/api/v1/jobs/recommended")
+    """
+    stats = QueryStats(capture=True)
+    with _totals_lock:
+        _captures.append(stats)
+    try:
+        yield stats
+    finally:
+        with _totals_lock:
+            _captures.remove(stats)
+    if stats.count > limit:
+        listing = "\n".join(f"  {i}. {' '.join(s.split())[:200]}" for i, s in enumerate(stats.statements or [], 1))
+        raise AssertionError(f"Expected at most {limit} queries, got {stats.count}:\n{listing}")
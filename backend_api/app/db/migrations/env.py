@@ -8,7 +8,8 @@ from sqlmodel import SQLModel
 
 # ---- Alembic 기본 설정 로드 ----
 config = context.config
-if config.config_file_name is not None:
+# bootstrap처럼 이미 로깅을 설정한 프로세스에서 부르면 configure_logger=False로 건너뛴다.
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
     fileConfig(config.config_file_name)
 
 # ---- 메타데이터(autogenerate용) 로드 ----
@@ -32,6 +33,11 @@ if url:
     config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
 
 # ---- 마이그레이션 실행 함수 ----
+def _include_name(name, type_, parent_names) -> bool:
+    # bootstrap 상태 테이블은 모델에 없으므로 autogenerate가 drop하지 않게 제외한다.
+    return not (type_ == "table" and name == "app_bootstrap_state")
+
+
 def run_migrations_offline() -> None:
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
@@ -39,11 +45,25 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         compare_type=True,
+        include_name=_include_name,
     )
     with context.begin_transaction():
         context.run_migrations()
 
 def run_migrations_online() -> None:
+    # backend_api.bootstrap이 자기 엔진의 연결을 넘겨주면 새 엔진을 만들지 않고 그대로 쓴다.
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=True,
+            include_name=_include_name,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -54,6 +74,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_name=_include_name,
         )
         with context.begin_transaction():
             context.run_migrations()
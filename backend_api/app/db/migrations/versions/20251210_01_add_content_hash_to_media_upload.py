@@ -0,0 +1,36 @@
+"""add content_hash column to media_upload
+
+Revision ID: 20251210_01
+Revises: 20251203_01
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251210_01"
+down_revision = "20251203_01"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # create_all로 먼저 만들어진 DB를 stamp한 경우에도 안전하도록 IF NOT EXISTS 사용
+    op.execute(
+        """
+        ALTER TABLE media_upload
+        ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+        """
+    )
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_media_upload_content_hash
+        ON media_upload (content_hash);
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_media_upload_content_hash;")
+    op.execute("ALTER TABLE media_upload DROP COLUMN IF EXISTS content_hash;")
@@ -178,6 +178,12 @@ class MediaUpload(SQLModel, table=True):
     media_type: str = Field(nullable=False, max_length=20)
     original_name: str = Field(nullable=False, max_length=255)
     file_path: str = Field(nullable=False, max_length=500)
+    content_hash: Optional[str] = Field(
+        default=None,
+        max_length=64,
+        index=True,
+        description="SHA-256 of the stored blob (content-addressed file name)",
+    )
     extra: Dict[str, Any] = Field(
         default_factory=dict,
         sa_column=Column(JSON, nullable=False, server_default="{}"),
@@ -1,12 +1,33 @@
+# .env는 다른 모듈이 import 시점에 os.getenv를 읽기 전에 한 번 로드한다 (로컬 uvicorn 실행용; 컨테이너는 env 주입).
+from ai_modeling.utils.env import load_env_once
+
+load_env_once()
+
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from ai_modeling.services.resilience import ProviderUnavailableError, guard_status
+from ai_modeling.utils.logging_setup import configure_logging
+from ai_modeling.utils.metrics import PROMETHEUS_CONTENT_TYPE, render_prometheus
+from ai_modeling.utils.singleflight import single_flight_stats
+
 from backend_api.app.core.config import settings
+from backend_api.app.core.loop_monitor import (
+    LoopMonitorMiddleware,
+    loop_monitor_enabled,
+    loop_monitor_stats,
+    start_loop_monitor,
+    stop_loop_monitor,
+)
+from backend_api.app.core.metrics import HttpMetricsMiddleware
+from backend_api.app.core.tracing import TracingMiddleware
 from backend_api.app.db import database
+from backend_api.app.db.instrumentation import QueryStatsMiddleware, sql_stats
 from backend_api.app.api.v1 import (
     admin,
     applications,
@@ -18,6 +39,10 @@ from backend_api.app.api.v1 import (
     notifications,
 )
 from backend_api.app.routes import ai, uploads
+from backend_api.app.services import media_worker, warmup
+
+# LOG_LEVEL / LOG_FORMAT / LOG_SAMPLE_RATE: 포맷과 stdout 쓰기는 별도 스레드에서 한다.
+configure_logging()
 
 # ----------------------------------------------------
 # 1. 라이프사이클 이벤트 (DB 초기화)
@@ -33,11 +58,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # User, OTPVerificationRequest 테이블 등이 생성됩니다.
     database.create_db_and_tables()
     print("[APP STARTUP] Database initialized successfully.")
+    # LOOP_MONITOR_ENABLED=true일 때만 이벤트 루프 지연 샘플러/watchdog을 띄운다.
+    start_loop_monitor()
+    # AI_WARMUP_ENABLED=true면 orchestrator를 백그라운드에서 미리 만든다 (완료 전까지 /ready는 503).
+    warmup.start_warmup()
     
     # yield: 이 시점부터 FastAPI가 요청 처리를 시작합니다.
     yield
     
     # 서버 종료 시 (shutdown) 필요한 정리 작업은 여기에 추가합니다.
+    await stop_loop_monitor()
+    media_worker.shutdown()
+    await database.dispose_async_engine()
     print("[APP SHUTDOWN] Application shutdown complete.")
 
 
@@ -60,6 +92,47 @@ def health_check():
     return {"status": "ok"}
 
 
+@app.get("/ready")
+def readiness_check():
+    """Readiness for rolling deploys: 503 while the AI warm-up runs; a failed warm-up reports "degraded" with 200."""
+    state = warmup.warmup_state()
+    return JSONResponse(status_code=200 if warmup.is_ready() else 503, content=state)
+
+
+@app.get("/health/ai")
+def ai_health_check():
+    """Circuit breaker / bulkhead state per AI capability plus single-flight counters."""
+    return {**guard_status(), "coalescing": single_flight_stats()}
+
+
+@app.get("/health/loop")
+def loop_health_check():
+    """Event-loop lag histogram and blocking-callback reports (LOOP_MONITOR_ENABLED)."""
+    return loop_monitor_stats()
+
+
+@app.get("/health/db")
+def db_health_check():
+    """Statement counts, DB time and slow queries per route (Server-Timing의 누적치)."""
+    return sql_stats()
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus text format: HTTP routes, AI stages (react/tool/provider/geocoder), caches."""
+    return Response(content=render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@app.exception_handler(ProviderUnavailableError)
+async def provider_unavailable_handler(request: Request, exc: ProviderUnavailableError):
+    # 라우트에서 따로 처리하지 않은 AI 호출 차단은 500 대신 503으로 돌려준다.
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "AI 서비스가 일시적으로 혼잡합니다. 잠시 후 다시 시도해주세요."},
+        headers={"Retry-After": str(max(1, int(exc.retry_after + 0.5)))},
+    )
+
+
 # ----------------------------------------------------
 # 3. 미들웨어 설정 (CORS)
 # ----------------------------------------------------
@@ -80,6 +153,19 @@ app.add_middleware(
     allow_headers=["*"], # 모든 HTTP 헤더 허용 (Authorization 포함)
 )
 
+# 요청별 SQL 문장 수/DB 시간 집계 + Server-Timing 헤더
+app.add_middleware(QueryStatsMiddleware)
+
+# 라우트별 지연 히스토그램 (GET /metrics)
+app.add_middleware(HttpMetricsMiddleware)
+
+# 요청 루트 span + x-request-id (TRACE_EXPORTER가 설정된 경우에만 동작)
+app.add_middleware(TracingMiddleware)
+
+# 루프를 막은 스택을 요청 라우트와 연결하기 위한 표식 미들웨어 (활성화 시에만)
+if loop_monitor_enabled():
+    app.add_middleware(LoopMonitorMiddleware)
+
 
 # ----------------------------------------------------
 # 4. 라우터 등록 및 버전 관리
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import contextvars
 import logging
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from ai_modeling.schemas.recommendation import RecommendationRequest
+from ai_modeling.services.resilience import ProviderUnavailableError
 
 from backend_api.app.core.security import get_current_user_id
 from backend_api.app.db.database import get_db
@@ -24,6 +29,7 @@ from backend_api.app.schemas.jobs import (
     MappingValidateResponse,
     OcrParseRequest,
     OcrParseResponse,
+    ParseItemError,
     VoicePostRequest,
     VoicePostResponse,
 )
@@ -44,12 +50,29 @@ _GOOGLE_GEOCODER_DISABLED = False
 _GOOGLE_GEOCODER_CACHE = Path(
     os.getenv("AI_ROUTES_GOOGLE_GEOCODER_CACHE", ".google_geocode_cache_ai.json")
 )
+# 여러 장 업로드 시 OCR/STT 호출을 동시에 보내는 최대 개수
+AI_PARSE_CONCURRENCY = max(1, int(os.getenv("AI_PARSE_CONCURRENCY", "4")))
+
+_T = TypeVar("_T")
+
+
+def _provider_unavailable(exc: ProviderUnavailableError) -> HTTPException:
+    """503 + Retry-After when the AI provider's circuit is open or its bulkhead is full."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="AI 서비스가 일시적으로 혼잡합니다. 잠시 후 다시 시도해주세요.",
+        headers={"Retry-After": str(max(1, int(exc.retry_after + 0.5)))},
+    )
 
 
 def _fetch_uploads(db: Session, ids: List[UUID]) -> List[MediaUpload]:
+    if not ids:
+        return []
+    rows = db.exec(select(MediaUpload).where(MediaUpload.id.in_(set(ids)))).all()
+    by_id = {upload.id: upload for upload in rows}
     uploads = []
     for upload_id in ids:
-        upload = db.get(MediaUpload, upload_id)
+        upload = by_id.get(upload_id)
         if not upload:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -59,7 +82,47 @@ def _fetch_uploads(db: Session, ids: List[UUID]) -> List[MediaUpload]:
     return uploads
 
 
-def _read_upload(upload: MediaUpload) -> tuple[bytes, Path]:
+def _map_uploads(
+    uploads: List[MediaUpload],
+    handler: Callable[[MediaUpload], _T],
+) -> tuple[List[Optional[_T]], List[ParseItemError]]:
+    """업로드별 handler를 제한된 동시성으로 실행하고 업로드 순서대로 결과를 돌려준다.
+
+    한 건의 실패가 배치 전체를 실패시키지 않도록 HTTPException은 항목별 오류로 모은다.
+    모든 항목이 실패하면 첫 번째 오류를 그대로 올린다.
+    """
+
+    def run(upload: MediaUpload) -> tuple[Optional[_T], Optional[HTTPException]]:
+        try:
+            return handler(upload), None
+        except HTTPException as exc:
+            return None, exc
+
+    if len(uploads) == 1:
+        outcomes = [run(uploads[0])]
+    else:
+        workers = min(AI_PARSE_CONCURRENCY, len(uploads))
+        # 워커 스레드에서도 요청 trace/contextvar가 이어지도록 항목마다 컨텍스트를 복사해 넘긴다.
+        contexts = [contextvars.copy_context() for _ in uploads]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ai-parse") as pool:
+            outcomes = list(pool.map(lambda ctx, upload: ctx.run(run, upload), contexts, uploads))
+
+    results: List[Optional[_T]] = []
+    errors: List[ParseItemError] = []
+    for upload, (result, exc) in zip(uploads, outcomes):
+        results.append(result)
+        if exc is not None:
+            errors.append(
+                ParseItemError(upload_id=upload.id, status_code=exc.status_code, detail=str(exc.detail))
+            )
+
+    if errors and len(errors) == len(uploads):
+        first = next(exc for _, exc in outcomes if exc is not None)
+        raise first
+    return results, errors
+
+
+def _upload_path(upload: MediaUpload) -> Path:
     candidate = upload.extra.get("raw_path") or upload.file_path
     path = Path(candidate)
     if not path.exists():
@@ -67,7 +130,15 @@ def _read_upload(upload: MediaUpload) -> tuple[bytes, Path]:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"업로드 파일을 찾을 수 없습니다: {upload.id}",
         )
-    return path.read_bytes(), path
+    return path
+
+
+@contextmanager
+def _open_upload(upload: MediaUpload) -> Iterator[mmap.mmap]:
+    """Yield a read-only memory map of the upload instead of a full bytes copy."""
+    path = _upload_path(upload)
+    with path.open("rb") as fp, mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        yield view
 
 
 def _post_to_cells(post: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -227,12 +298,17 @@ def recommend_jobs(
         default=None,
         description="사용할 AI Provider (예: naver, local)",
     ),
+    trace: Optional[str] = Query(
+        default=None,
+        description="추론 기록 수준 (none, summary, full). full이면 reason.trace_id로 저장된다.",
+    ),
 ):
     orchestrator = get_pipeline(provider)
     result = orchestrator.recommend(
         user_profile=payload.user_profile.dict(),
         intent=payload.intent or "",
         previous_recommendations=payload.previous_recommendations or [],
+        trace_level=trace,
     )
     result["provider"] = orchestrator.provider_name
     return result
@@ -249,15 +325,17 @@ def parse_ocr(
         raise HTTPException(status_code=400, detail="이미지를 먼저 업로드해주세요.")
 
     orchestrator = get_pipeline(provider)
-    raw_segments: List[str] = []
-    cells: List[Dict[str, str]] = []
 
-    for upload in uploads:
-        content, _ = _read_upload(upload)
+    def extract(upload: MediaUpload) -> Dict[str, Any]:
         try:
-            result = orchestrator.create_post_from_image_bytes(content)
+            with _open_upload(upload) as content:
+                result = orchestrator.create_post_from_image_bytes(
+                    content, content_hash=upload.content_hash
+                )
         except HTTPException:
             raise
+        except ProviderUnavailableError as exc:
+            raise _provider_unavailable(exc) from exc
         except ValueError as exc:
             logger.warning("OCR pipeline returned invalid response for %s: %s", upload.id, exc)
             raise HTTPException(
@@ -276,7 +354,14 @@ def parse_ocr(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=result.get("message", "이미지에서 텍스트를 추출하지 못했습니다."),
             )
-        post = result.get("post", {})
+        return result.get("post", {})
+
+    posts, errors = _map_uploads(uploads, extract)
+    raw_segments: List[str] = []
+    cells: List[Dict[str, str]] = []
+    for post in posts:
+        if post is None:
+            continue
         raw_segments.append(
             (post.get("raw_text") or post.get("description") or "").strip()
         )
@@ -285,6 +370,7 @@ def parse_ocr(
     return OcrParseResponse(
         raw_text=_combine_text(raw_segments, "텍스트 추출 결과가 비어 있습니다."),
         cells=cells,
+        errors=errors,
     )
 
 
@@ -299,24 +385,31 @@ def parse_asr(
         raise HTTPException(status_code=400, detail="음성 파일을 업로드해주세요.")
 
     orchestrator = get_pipeline(provider)
-    transcripts: List[str] = []
-    for upload in uploads:
-        _, path = _read_upload(upload)
+
+    def transcribe(upload: MediaUpload) -> str:
+        path = _upload_path(upload)
         try:
-            stt = orchestrator.transcribe_audio_file(str(path))
+            stt = orchestrator.transcribe_audio_file(str(path), content_hash=upload.content_hash)
         except HTTPException:
             raise
+        except ProviderUnavailableError as exc:
+            raise _provider_unavailable(exc) from exc
         except Exception as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"음성 인식 실패: {exc}",
             ) from exc
+        return (stt or {}).get("text", "").strip()
 
-        transcripts.append((stt or {}).get("text", "").strip())
+    transcripts, errors = _map_uploads(uploads, transcribe)
 
     return OcrParseResponse(
-        raw_text=_combine_text(transcripts, "음성에서 텍스트를 추출하지 못했습니다."),
+        raw_text=_combine_text(
+            [text for text in transcripts if text],
+            "음성에서 텍스트를 추출하지 못했습니다.",
+        ),
         cells=[],
+        errors=errors,
     )
 
 
@@ -331,15 +424,21 @@ def create_post_from_voice(
     has_existing = bool(existing_post)
     post_state: Dict[str, Any] = dict(existing_post) if has_existing else {}
     transcript_parts: List[str] = []
+    # 통합 음성 추출이 돌려준 검증 결과 (초안/추가 설명과 합쳐지면 다시 검증해야 한다)
+    voice_validation: Optional[Dict[str, Any]] = None
 
     if payload.upload_id:
         uploads = _fetch_uploads(db, [payload.upload_id])
         upload = uploads[0]
-        content, _ = _read_upload(upload)
+        path = _upload_path(upload)
         try:
-            voice_result = orchestrator.create_post_from_voice_bytes(content)
+            voice_result = orchestrator.create_post_from_voice_file(
+                str(path), content_hash=upload.content_hash
+            )
         except HTTPException:
             raise
+        except ProviderUnavailableError as exc:
+            raise _provider_unavailable(exc) from exc
         except Exception as exc:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -363,6 +462,7 @@ def create_post_from_voice(
             post_state = _merge_structured_posts(post_state, structured_post)
         else:
             post_state = structured_post
+            voice_validation = voice_result.get("validation")
 
         transcript_value = (voice_result.get("transcript") or "").strip()
         if transcript_value:
@@ -384,6 +484,7 @@ def create_post_from_voice(
     manual_text = (payload.clarification_text or "").strip()
     if manual_text:
         transcript_parts.append(manual_text)
+        voice_validation = None
 
     transcript_text = "\n".join([segment for segment in transcript_parts if segment]).strip()
 
@@ -401,7 +502,8 @@ def create_post_from_voice(
 
     _maybe_refine_address(orchestrator, post_state)
 
-    validation = orchestrator.validate_post(post_state)
+    # 주소 보정은 필수 필드를 바꾸지 않으므로 통합 추출의 검증 결과를 그대로 쓸 수 있다.
+    validation = voice_validation or orchestrator.validate_post(post_state)
     missing = validation.get("missing_fields") or validation.get("missing") or []
     questions = validation.get("questions") or []
     needs_clarification = validation.get("needs_clarification")
@@ -434,6 +536,8 @@ def map_headers(
         result = orchestrator.create_post_from_text(text)
     except HTTPException:
         raise
+    except ProviderUnavailableError as exc:
+        raise _provider_unavailable(exc) from exc
     except ValueError as exc:
         logger.warning("Header mapping failed: %s", exc)
         raise HTTPException(
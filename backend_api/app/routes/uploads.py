@@ -2,119 +2,180 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import pathlib
 from typing import List
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from backend_api.app.core.security import get_current_user_id
-from backend_api.app.db.database import get_db
+from backend_api.app.db.database import get_async_db, get_db
 from backend_api.app.db.models import MediaUpload
-from backend_api.app.schemas.jobs import UploadResponse
-
-
-try:  # Optional import guard for PDF conversion
-    import fitz  # type: ignore
-except Exception:  # pragma: no cover - import failure handled at runtime
-    fitz = None
+from backend_api.app.schemas.jobs import UploadResponse, UploadStatusResponse
+from backend_api.app.services import media_worker
 
 
 UPLOAD_DIR = pathlib.Path(os.getenv("MEDIA_UPLOAD_DIR", "backend_api/app/storage"))
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+MAX_UPLOAD_BYTES = int(float(os.getenv("MEDIA_MAX_UPLOAD_MB", "25")) * 1024 * 1024)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 router = APIRouter(prefix="/uploads", tags=["Uploads"])
 
 
-def _convert_pdf_to_images(pdf_path: pathlib.Path) -> list[pathlib.Path]:
-    """Convert the first page of a PDF into a JPEG image for preview purposes."""
-
-    if fitz is None:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="PDF 변환 라이브러리가 설치되지 않았습니다. (PyMuPDF)",
-        )
-
-    images: list[pathlib.Path] = []
-    with fitz.open(pdf_path) as doc:  # type: ignore[attr-defined]
-        if doc.page_count == 0:
-            return images
-
-        page = doc.load_page(0)
-        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2))  # type: ignore[attr-defined]
-        output = pdf_path.with_name(f"{pdf_path.stem}_page1.jpg")
-        pix.save(output)  # type: ignore[attr-defined]
-        images.append(output)
-
-    return images
-
+def _store_blob(file: UploadFile, suffix: str) -> tuple[pathlib.Path, str]:
+    """Stream the upload to disk in fixed-size chunks, hashing as we go.
+
+    MAX_UPLOAD_BYTES를 넘는 순간 중단하고 413을 돌려준다. 결과는 ``<sha256><suffix>``
+    이름의 blob으로 옮기며, 같은 내용이 이미 있으면 임시 파일만 지운다.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    tmp_path = UPLOAD_DIR / f".{uuid4()}.part"
+    try:
+        with tmp_path.open("wb") as buffer:
+            while chunk := file.file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"파일이 너무 큽니다. (최대 {MAX_UPLOAD_BYTES // (1024 * 1024)}MB)",
+                    )
+                digest.update(chunk)
+                buffer.write(chunk)
+        if size == 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="빈 파일은 업로드할 수 없습니다.")
 
-def _save_file(file: UploadFile, media_type: str, db: Session) -> tuple[UUID, str]:
+        content_hash = digest.hexdigest()
+        destination = UPLOAD_DIR / f"{content_hash}{suffix}"
+        if destination.exists():
+            tmp_path.unlink()
+        else:
+            os.replace(tmp_path, destination)
+        return destination, content_hash
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+async def _save_file(file: UploadFile, media_type: str, db: AsyncSession) -> tuple[MediaUpload, str]:
+    """Store the upload as a content-addressed blob (``<sha256><suffix>``).
+
+    같은 파일을 다시 올리면 기존 blob을 그대로 쓰고, MediaUpload 행만 새로 만든다.
+    디스크 I/O와 해시 계산은 이벤트 루프 밖(threadpool)에서 수행한다.
+    PDF는 conversion_status="pending"으로 저장하고 변환은 media_worker가 맡는다.
+    """
     upload_id = uuid4()
-    suffix = pathlib.Path(file.filename or "").suffix or (".jpg" if media_type == "image" else ".dat")
-    filename = f"{upload_id}{suffix}"
-    destination = UPLOAD_DIR / filename
+    suffix = pathlib.Path(file.filename or "").suffix.lower() or (".jpg" if media_type == "image" else ".dat")
 
-    with destination.open("wb") as buffer:
-        contents = file.file.read()
-        if not contents:
-            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="빈 파일은 업로드할 수 없습니다.")
-        buffer.write(contents)
+    destination, content_hash = await run_in_threadpool(_store_blob, file, suffix)
+    filename = destination.name
 
     raw_url = f"/media/{filename}"
-    extra: dict[str, list[str] | str] = {"raw_path": str(destination), "raw_url": raw_url}
-
-    converted_urls: list[str] = []
-    if suffix.lower() == ".pdf":
-        converted_paths = _convert_pdf_to_images(destination)
-        if converted_paths:
-            converted_urls = [f"/media/{path.name}" for path in converted_paths]
-            extra["converted_files"] = [str(path) for path in converted_paths]
-            extra["converted_urls"] = converted_urls
+    extra: dict[str, list[str] | str] = {
+        "raw_path": str(destination),
+        "raw_url": raw_url,
+        "content_hash": content_hash,
+    }
+    if suffix == ".pdf":
+        extra["conversion_status"] = "pending"
 
     record = MediaUpload(
         id=upload_id,
         media_type=media_type,
         original_name=file.filename or filename,
         file_path=str(destination),
+        content_hash=content_hash,
         extra=extra,
     )
     db.add(record)
-    primary_url = converted_urls[0] if converted_urls else raw_url
-    return upload_id, primary_url
+    return record, raw_url
+
+
+def _conversion_status(extra: dict) -> str:
+    return str(extra.get("conversion_status") or "ready")
+
+
+def _pending_conversions(records: list[MediaUpload]) -> list[tuple[UUID, str]]:
+    # commit 후에는 속성이 만료되므로 commit 전에 필요한 값만 뽑아 둔다.
+    return [
+        (record.id, record.file_path)
+        for record in records
+        if _conversion_status(record.extra) == "pending"
+    ]
+
+
+def _schedule_conversions(background_tasks: BackgroundTasks, pending: list[tuple[UUID, str]]) -> None:
+    for upload_id, pdf_path in pending:
+        background_tasks.add_task(media_worker.convert_pdf_upload, upload_id, pdf_path)
 
 
 @router.post("/images", response_model=UploadResponse)
 async def upload_images(
+    background_tasks: BackgroundTasks,
     files: List[UploadFile] = File(...),
     current_user_id=Depends(get_current_user_id),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     del current_user_id  # 토큰 확인용으로만 사용
     if not files:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="업로드할 파일이 없습니다.")
 
-    upload_ids: list[UUID] = []
+    records: list[MediaUpload] = []
     urls: list[str] = []
     for file in files:
-        upload_id, preview_url = _save_file(file, "image", db)
-        upload_ids.append(upload_id)
+        record, preview_url = await _save_file(file, "image", db)
+        records.append(record)
         urls.append(preview_url)
 
-    db.commit()
-    return UploadResponse(upload_ids=upload_ids, urls=urls)
+    upload_ids = [record.id for record in records]
+    statuses = [_conversion_status(record.extra) for record in records]
+    pending = _pending_conversions(records)
+    await db.commit()
+    _schedule_conversions(background_tasks, pending)
+    return UploadResponse(upload_ids=upload_ids, urls=urls, statuses=statuses)
 
 
 @router.post("/audio", response_model=UploadResponse)
 async def upload_audio(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user_id=Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_async_db),
+):
+    del current_user_id
+    record, preview_url = await _save_file(file, "audio", db)
+    upload_id = record.id
+    upload_status = _conversion_status(record.extra)
+    pending = _pending_conversions([record])
+    await db.commit()
+    _schedule_conversions(background_tasks, pending)
+    return UploadResponse(upload_ids=[upload_id], urls=[preview_url], statuses=[upload_status])
+
+
+@router.get("/{upload_id}", response_model=UploadStatusResponse)
+def get_upload_status(
+    upload_id: UUID,
+    current_user_id=Depends(get_current_user_id),
     db: Session = Depends(get_db),
 ):
+    """PDF 변환 진행 상태와 변환된 이미지/썸네일 URL을 돌려준다."""
     del current_user_id
-    upload_id, preview_url = _save_file(file, "audio", db)
-    db.commit()
-    return UploadResponse(upload_ids=[upload_id], urls=[preview_url])
+    upload = db.get(MediaUpload, upload_id)
+    if not upload:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="업로드를 찾을 수 없습니다.")
+    extra = upload.extra or {}
+    return UploadStatusResponse(
+        upload_id=upload.id,
+        status=_conversion_status(extra),
+        raw_url=extra.get("raw_url"),
+        converted_urls=extra.get("converted_urls") or [],
+        thumbnail_urls=extra.get("thumbnail_urls") or [],
+        error=extra.get("conversion_error"),
+    )
@@ -219,15 +219,33 @@ JobApplicantRead.model_rebuild()
 class UploadResponse(BaseModel):
     upload_ids: List[UUID]
     urls: List[str]
+    # ready | pending (PDF 변환 대기) — GET /uploads/{id} 로 진행 상태 확인
+    statuses: List[str] = Field(default_factory=list)
+
+
+class UploadStatusResponse(BaseModel):
+    upload_id: UUID
+    status: str
+    raw_url: Optional[str] = None
+    converted_urls: List[str] = Field(default_factory=list)
+    thumbnail_urls: List[str] = Field(default_factory=list)
+    error: Optional[str] = None
 
 
 class OcrParseRequest(BaseModel):
     upload_ids: List[UUID]
 
 
+class ParseItemError(BaseModel):
+    upload_id: UUID
+    status_code: int
+    detail: str
+
+
 class OcrParseResponse(BaseModel):
     raw_text: str
     cells: List[Dict[str, Any]] = Field(default_factory=list)
+    errors: List[ParseItemError] = Field(default_factory=list)
 
 
 class AsrParseRequest(BaseModel):
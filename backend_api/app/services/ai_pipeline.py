@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import threading
 from functools import lru_cache
-from typing import Optional
-
-from ai_modeling.orchestration import AIModelingOrchestrator, get_orchestrator
+from typing import TYPE_CHECKING, Optional
 
 from backend_api.app.core.config import settings
 
+if TYPE_CHECKING:  # 실제 import는 첫 orchestrator 생성 때 (numpy/pandas/provider 모듈이 API 기동에 끼지 않도록)
+    from ai_modeling.orchestration import AIModelingOrchestrator
+
 
 def _normalize_provider(name: Optional[str]) -> str:
     """Normalize provider names to align with ai_modeling conventions."""
@@ -17,10 +19,16 @@ def _normalize_provider(name: Optional[str]) -> str:
     return value.strip().lower().replace("-", "_")
 
 
+# lru_cache는 동시에 처음 호출되면 둘 다 생성하므로, 워밍업 스레드가 만드는 중이면 요청은 기다렸다 같은 인스턴스를 쓴다.
+_BUILD_LOCK = threading.Lock()
+
+
 @lru_cache(maxsize=4)
 def _cached_orchestrator(provider_name: str) -> AIModelingOrchestrator:
     """Cache orchestrator instances per provider to avoid reloading CSV/LLM state."""
 
+    from ai_modeling.orchestration import get_orchestrator
+
     return get_orchestrator(provider_name)
 
 
@@ -28,4 +36,5 @@ def get_pipeline(provider: Optional[str] = None) -> AIModelingOrchestrator:
     """Public accessor for routes/services."""
 
     normalized = _normalize_provider(provider)
-    return _cached_orchestrator(normalized)
+    with _BUILD_LOCK:
+        return _cached_orchestrator(normalized)
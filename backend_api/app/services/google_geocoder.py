@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Optional, Tuple, Union
 
-import requests
+from ai_modeling.utils.metrics import record_cache, timed
+from ai_modeling.utils.singleflight import get_single_flight
+
+# 같은 주소를 동시에 조회하면 한 번만 API를 호출하고 결과를 나눠 쓴다.
+_GEOCODE_FLIGHT = get_single_flight("geocode.google")
 
 
 class GoogleGeocoder:
@@ -19,6 +24,7 @@ class GoogleGeocoder:
         api_key: Optional[str] = None,
         cache_path: Optional[Path] = None,
         rate_limit_sleep: float = 0.1,
+        timeout: float = 5.0,
     ) -> None:
         self.api_key = (
             api_key
@@ -28,10 +34,14 @@ class GoogleGeocoder:
         if not self.api_key:
             raise RuntimeError("GOOGLE_GEOCODING_API_KEY (or GOOGLE_GEOCODING) must be set")
 
+        import requests  # 지오코딩을 쓰는 요청에서만 로드 (API 기동 시간 절약)
+
         self.session = requests.Session()
         self.cache_path = cache_path or Path(".google_geocode_cache.json")
         self.rate_limit_sleep = rate_limit_sleep
+        self.timeout = timeout
         self.cache: Dict[str, Tuple[float, float]] = {}
+        self._cache_lock = threading.Lock()
         self._load_cache()
 
     def _load_cache(self) -> None:
@@ -45,11 +55,20 @@ class GoogleGeocoder:
 
     def _save_cache(self) -> None:
         try:
-            with self.cache_path.open("w", encoding="utf-8") as fp:
-                json.dump(self.cache, fp, ensure_ascii=False)
+            with self._cache_lock:
+                snapshot = dict(self.cache)
+                with self.cache_path.open("w", encoding="utf-8") as fp:
+                    json.dump(snapshot, fp, ensure_ascii=False)
         except Exception:
             pass
 
+    def lookup_cached(self, query: str) -> Optional[Tuple[float, float]]:
+        """Return cached coordinates without touching the network."""
+        normalized = (query or "").strip()
+        if not normalized:
+            return None
+        return self.cache.get(normalized)
+
     def geocode(
         self,
         query: str,
@@ -59,13 +78,25 @@ class GoogleGeocoder:
         normalized = query.strip()
         if not normalized:
             return None
-        if normalized in self.cache:
+        cached = normalized in self.cache
+        record_cache("geocode.google", cached)
+        if cached:
             coords = self.cache[normalized]
             if return_details:
                 lat, lng = coords
                 return lat, lng, None
             return coords
 
+        with timed("geocoder", "google"):
+            result = _GEOCODE_FLIGHT.do(normalized, lambda: self._fetch(normalized))
+        if result is None:
+            return None
+        lat, lng, formatted = result
+        if return_details:
+            return lat, lng, formatted
+        return lat, lng
+
+    def _fetch(self, normalized: str) -> Optional[Tuple[float, float, Optional[str]]]:
         resp = self.session.get(
             self.API_URL,
             params={
@@ -73,6 +104,7 @@ class GoogleGeocoder:
                 "key": self.api_key,
                 "language": "ko",
             },
+            timeout=self.timeout,
         )
         if resp.status_code != 200:
             print(f"[GoogleGeocoder] HTTP {resp.status_code}: {resp.text}")
@@ -98,7 +130,5 @@ class GoogleGeocoder:
         self.cache[normalized] = (lat, lng)
         self._save_cache()
         time.sleep(self.rate_limit_sleep)
-        if return_details:
-            formatted = (top.get("formatted_address") or "").strip() or None
-            return lat, lng, formatted
-        return lat, lng
+        formatted = (top.get("formatted_address") or "").strip() or None
+        return lat, lng, formatted
@@ -0,0 +1,227 @@
+"""Background media conversion (PDF rasterization + preview thumbnails).
+
+PDF 렌더링은 CPU 작업이라 업로드 요청 안에서 돌리지 않고 프로세스 풀로 넘긴다.
+업로드 응답은 ``conversion_status="pending"``으로 바로 돌아가고, 모든 페이지가
+렌더링되면 ``MediaUpload.extra``의 converted_urls/thumbnail_urls가 채워진다.
+
+이 모듈은 spawn된 워커 프로세스에서도 import되므로 최상위에서는 DB/앱 모듈을
+불러오지 않는다.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _fitz() -> Any:
+    """PyMuPDF, imported on first PDF (API 프로세스 기동 시간에 포함되지 않도록). 없으면 None."""
+    try:
+        import fitz  # type: ignore
+    except Exception:  # pragma: no cover - import failure handled at runtime
+        return None
+    return fitz
+
+
+@lru_cache(maxsize=1)
+def _pil_image() -> Any:
+    """Optional: WebP thumbnails need Pillow, otherwise JPEG thumbnails are written."""
+    try:
+        from PIL import Image  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    return Image
+
+
+RENDER_SCALE = float(os.getenv("MEDIA_PDF_RENDER_SCALE", "2.0"))
+THUMBNAIL_WIDTH = int(os.getenv("MEDIA_THUMBNAIL_WIDTH", "320"))
+MEDIA_WORKER_PROCESSES = int(
+    os.getenv("MEDIA_WORKER_PROCESSES", str(min(4, os.cpu_count() or 1)))
+)
+
+_POOL: Optional[ProcessPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _atomic_save(save, destination: Path) -> None:
+    tmp = destination.with_name(f".{os.getpid()}-{destination.name}")
+    save(tmp)
+    os.replace(tmp, destination)
+
+
+def render_pdf_page(
+    pdf_path: str,
+    page_index: int,
+    scale: float = RENDER_SCALE,
+    thumb_width: int = THUMBNAIL_WIDTH,
+) -> Dict[str, str]:
+    """Render one PDF page to JPEG plus a downscaled thumbnail (runs in a worker process).
+
+    파일 이름은 content-addressed PDF 이름을 따르므로 이미 있으면 다시 그리지 않는다.
+    """
+    fitz = _fitz()
+    Image = _pil_image()
+    if fitz is None:
+        raise RuntimeError("PDF 변환 라이브러리가 설치되지 않았습니다. (PyMuPDF)")
+
+    source = Path(pdf_path)
+    page_no = page_index + 1
+    image_path = source.with_name(f"{source.stem}_page{page_no}.jpg")
+    thumb_suffix = ".webp" if Image is not None else ".jpg"
+    thumb_path = source.with_name(f"{source.stem}_page{page_no}_thumb{thumb_suffix}")
+
+    if image_path.exists() and thumb_path.exists():
+        return {"image": str(image_path), "thumbnail": str(thumb_path)}
+
+    with fitz.open(source) as doc:  # type: ignore[attr-defined]
+        page = doc.load_page(page_index)
+        if not image_path.exists():
+            pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale))  # type: ignore[attr-defined]
+            _atomic_save(lambda tmp: pix.save(str(tmp), output="jpg"), image_path)
+
+        if not thumb_path.exists():
+            thumb_scale = min(1.0, thumb_width / max(page.rect.width, 1))
+            thumb = page.get_pixmap(matrix=fitz.Matrix(thumb_scale, thumb_scale))  # type: ignore[attr-defined]
+            if Image is not None:
+                mode = "RGBA" if thumb.alpha else "RGB"
+                img = Image.frombytes(mode, (thumb.width, thumb.height), thumb.samples)
+                _atomic_save(lambda tmp: img.save(tmp, format="WEBP", quality=80), thumb_path)
+            else:
+                _atomic_save(lambda tmp: thumb.save(str(tmp), output="jpg"), thumb_path)
+
+    return {"image": str(image_path), "thumbnail": str(thumb_path)}
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # uvicorn 프로세스는 스레드를 쓰므로 fork 대신 spawn으로 워커를 띄운다.
+            _POOL = ProcessPoolExecutor(
+                max_workers=max(1, MEDIA_WORKER_PROCESSES),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _POOL
+
+
+def shutdown() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is not None:
+            _POOL.shutdown(wait=False, cancel_futures=True)
+            _POOL = None
+
+
+def _public_url(path: str) -> str:
+    return f"/media/{Path(path).name}"
+
+
+def _render_all_pages(pdf_path: Path) -> List[Dict[str, str]]:
+    fitz = _fitz()
+    if fitz is None:
+        raise RuntimeError("PDF 변환 라이브러리가 설치되지 않았습니다. (PyMuPDF)")
+    with fitz.open(pdf_path) as doc:  # type: ignore[attr-defined]
+        page_count = doc.page_count
+    if page_count == 0:
+        return []
+
+    pool = _get_pool()
+    futures = [pool.submit(render_pdf_page, str(pdf_path), index) for index in range(page_count)]
+    return [future.result() for future in futures]
+
+
+def _update_upload_extra(upload_id: UUID, changes: Dict[str, Any]) -> None:
+    from sqlmodel import Session
+
+    from backend_api.app.db.database import engine
+    from backend_api.app.db.models import MediaUpload
+
+    with Session(engine) as session:
+        # extra는 공고 연결(attach_converted_images)과 함께 read-modify-write하므로 행을 잠근다.
+        upload = session.get(MediaUpload, upload_id, with_for_update=True)
+        if not upload:
+            return
+        # JSON 컬럼은 새 dict를 할당해야 변경이 감지된다.
+        upload.extra = {**(upload.extra or {}), **changes}
+        session.add(upload)
+        session.commit()
+
+
+def attach_converted_images(upload_id: UUID, job_id: Optional[UUID] = None) -> None:
+    """Add a PDF upload's page images to the jobs created while it was still converting.
+
+    ``job_id``가 주어지면 먼저 ``extra["pending_job_ids"]``에 등록한다. 변환이 끝났으면(done)
+    등록된 공고들의 ``images``에 converted_urls를 채우고 목록을 비운다. 업로드 행을 잠근 채
+    처리하므로 공고 생성과 변환 완료가 동시에 일어나도 어느 한쪽에서 반드시 채워진다.
+    """
+    from sqlmodel import Session
+
+    from backend_api.app.db.database import engine
+    from backend_api.app.db.models import JobPost, MediaUpload
+
+    with Session(engine) as session:
+        upload = session.get(MediaUpload, upload_id, with_for_update=True)
+        if not upload:
+            return
+        extra = dict(upload.extra or {})
+        pending = [str(value) for value in extra.get("pending_job_ids") or []]
+        if job_id is not None and str(job_id) not in pending:
+            pending.append(str(job_id))
+
+        if extra.get("conversion_status") == "done":
+            converted = [str(url) for url in extra.get("converted_urls") or [] if url]
+            for pending_id in pending:
+                job = session.get(JobPost, UUID(pending_id))
+                if not job:
+                    continue
+                images = list(job.images or [])
+                missing = [url for url in converted if url not in images]
+                if missing:
+                    job.images = images + missing
+                    session.add(job)
+            pending = []
+
+        if pending != (extra.get("pending_job_ids") or []):
+            if pending:
+                extra["pending_job_ids"] = pending
+            else:
+                extra.pop("pending_job_ids", None)
+            upload.extra = extra
+            session.add(upload)
+        session.commit()
+
+
+def convert_pdf_upload(upload_id: UUID, pdf_path: str) -> None:
+    """Render every page of an uploaded PDF and record the results (BackgroundTasks)."""
+    try:
+        pages = _render_all_pages(Path(pdf_path))
+    except Exception as exc:
+        logger.warning("PDF conversion failed for upload %s: %s", upload_id, exc)
+        _update_upload_extra(
+            upload_id,
+            {"conversion_status": "failed", "conversion_error": str(exc)},
+        )
+        return
+
+    _update_upload_extra(
+        upload_id,
+        {
+            "conversion_status": "done",
+            "converted_files": [page["image"] for page in pages],
+            "converted_urls": [_public_url(page["image"]) for page in pages],
+            "thumbnail_urls": [_public_url(page["thumbnail"]) for page in pages],
+        },
+    )
+    # 변환 중에 만들어진 공고는 원본 PDF 대신 페이지 이미지로 채운다.
+    attach_converted_images(upload_id)
+    logger.info("Converted %d PDF page(s) for upload %s", len(pages), upload_id)
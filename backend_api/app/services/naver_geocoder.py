@@ -2,11 +2,16 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-import requests
+from ai_modeling.utils.metrics import record_cache, timed
+from ai_modeling.utils.singleflight import get_single_flight
+
+# 같은 주소를 동시에 조회하면 한 번만 API를 호출하고 결과를 나눠 쓴다.
+_GEOCODE_FLIGHT = get_single_flight("geocode.naver")
 
 
 class NaverGeocoder:
@@ -20,12 +25,15 @@ class NaverGeocoder:
         client_secret: Optional[str] = None,
         cache_path: Optional[Path] = None,
         rate_limit_sleep: float = 0.15,
+        timeout: float = 5.0,
     ) -> None:
         self.client_id = client_id or os.getenv("NAVER_MAPS_CLIENT_ID")
         self.client_secret = client_secret or os.getenv("NAVER_MAPS_CLIENT_SECRET")
         if not self.client_id or not self.client_secret:
             raise RuntimeError("NAVER_MAPS_CLIENT_ID/SECRET must be set")
 
+        import requests  # 지오코딩을 쓰는 요청에서만 로드 (API 기동 시간 절약)
+
         self.session = requests.Session()
         self.session.headers.update(
             {
@@ -35,7 +43,9 @@ class NaverGeocoder:
         )
         self.cache_path = cache_path or Path(".naver_geocode_cache.json")
         self.rate_limit_sleep = rate_limit_sleep
+        self.timeout = timeout
         self.cache: Dict[str, Tuple[float, float]] = {}
+        self._cache_lock = threading.Lock()
         self._load_cache()
 
     def _load_cache(self) -> None:
@@ -49,19 +59,37 @@ class NaverGeocoder:
 
     def _save_cache(self) -> None:
         try:
-            with self.cache_path.open("w", encoding="utf-8") as fp:
-                json.dump(self.cache, fp, ensure_ascii=False)
+            with self._cache_lock:
+                snapshot = dict(self.cache)
+                with self.cache_path.open("w", encoding="utf-8") as fp:
+                    json.dump(snapshot, fp, ensure_ascii=False)
         except Exception:
             pass
 
+    def lookup_cached(self, query: str) -> Optional[Tuple[float, float]]:
+        """Return cached coordinates without touching the network."""
+        normalized = (query or "").strip()
+        if not normalized:
+            return None
+        return self.cache.get(normalized)
+
     def geocode(self, query: str) -> Optional[Tuple[float, float]]:
         normalized = query.strip()
         if not normalized:
             return None
-        if normalized in self.cache:
+        cached = normalized in self.cache
+        record_cache("geocode.naver", cached)
+        if cached:
             return self.cache[normalized]
+        with timed("geocoder", "naver"):
+            return _GEOCODE_FLIGHT.do(normalized, lambda: self._fetch(normalized))
 
-        resp = self.session.get(self.API_URL, params={"query": normalized})
+    def _fetch(self, normalized: str) -> Optional[Tuple[float, float]]:
+        resp = self.session.get(
+            self.API_URL,
+            params={"query": normalized},
+            timeout=self.timeout,
+        )
         if resp.status_code != 200:
             print(f"[Geocoder] HTTP {resp.status_code}: {resp.text}")
             return None
@@ -0,0 +1,109 @@
+"""Background warm-up of AI orchestrators so the first request does not pay the cold start.
+
+orchestrator 생성에는 CSV 읽기, 임베딩 문자열 파싱/정규화 행렬 생성, provider 구성이 들어간다.
+``AI_WARMUP_ENABLED=true``이면 lifespan에서 데몬 스레드로 ``AI_WARMUP_PROVIDERS``(쉼표 구분,
+비우면 ``AI_PROVIDER``)의 ``get_pipeline``을 미리 호출한다. 외부 API는 호출하지 않는다.
+
+``GET /ready``는 워밍업이 끝나기 전까지 503을 돌려주므로 롤링 배포에서 트래픽 투입 기준으로 쓴다.
+``/health``는 프로세스 생존 여부만 본다.
+
+``SERVE_MODE=prod``(gunicorn ``preload_app``)에서는 마스터가 fork 전에 ``preload_corpus``로
+공고 CSV와 임베딩 행렬을 읽어 두고, 워커의 워밍업은 그 공유 corpus 위에 provider만 구성한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from backend_api.app.core.config import settings
+from backend_api.app.services.ai_pipeline import get_pipeline
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+_state: Dict[str, Any] = {
+    "status": "disabled",
+    "started_at": None,
+    "finished_at": None,
+    "providers": {},
+}
+
+
+def warmup_providers() -> List[str]:
+    raw = settings.AI_WARMUP_PROVIDERS or settings.AI_PROVIDER or "naver"
+    return [name.strip() for name in raw.split(",") if name.strip()]
+
+
+def _run(providers: List[str]) -> None:
+    failed = False
+    for name in providers:
+        started = time.perf_counter()
+        try:
+            pipeline = get_pipeline(name)
+            row: Dict[str, Any] = {"status": "ready", **pipeline.describe()}
+        except Exception as exc:
+            failed = True
+            logger.exception("AI warm-up failed for provider %s", name)
+            row = {"status": "failed", "error": f"{type(exc).__name__}: {exc}"}
+        row["seconds"] = round(time.perf_counter() - started, 2)
+        with _lock:
+            _state["providers"][name] = row
+        logger.info("AI warm-up %s: %s in %.2fs", name, row["status"], row["seconds"])
+
+    # 실패해도 get_pipeline은 다음 요청에서 다시 만들어 보므로 503에 묶어 두지 않는다.
+    # "degraded"도 ready로 보고, 실패한 provider와 에러는 /ready 본문에 남긴다.
+    with _lock:
+        _state["status"] = "degraded" if failed else "ready"
+        _state["finished_at"] = time.time()
+
+
+def start_warmup() -> None:
+    """Kick off warm-up once per process when enabled (call from the app lifespan)."""
+    global _thread
+    if not settings.AI_WARMUP_ENABLED:
+        return
+    with _lock:
+        if _thread is not None:
+            return
+        providers = warmup_providers()
+        _state.update(
+            status="warming",
+            started_at=time.time(),
+            finished_at=None,
+            providers={name: {"status": "pending"} for name in providers},
+        )
+        _thread = threading.Thread(target=_run, args=(providers,), name="ai-warmup", daemon=True)
+        _thread.start()
+
+
+def warmup_state() -> Dict[str, Any]:
+    with _lock:
+        return {**_state, "providers": {name: dict(row) for name, row in _state["providers"].items()}}
+
+
+def is_ready() -> bool:
+    """Ready once warm-up has finished (even degraded), or when it is disabled (orchestrators build lazily)."""
+    with _lock:
+        return _state["status"] in ("ready", "degraded", "disabled")
+
+
+def preload_corpus() -> Optional[str]:
+    """Load the shared RAG corpus in this process (gunicorn master, before fork); returns the CSV path."""
+    # ai_pipeline처럼 AI 모듈은 여기서만 import한다 (API 기동 경로에는 pandas를 끌어오지 않음).
+    from ai_modeling.agents.tools.csv_rag_tool import load_corpus
+    from ai_modeling.orchestration.pipeline import default_csv_path
+
+    started = time.perf_counter()
+    corpus = load_corpus(default_csv_path())
+    logger.info(
+        "Preloaded RAG corpus %s: %d rows x %s dims in %.2fs",
+        corpus.csv_path,
+        len(corpus.records),
+        corpus.embedding_dim,
+        time.perf_counter() - started,
+    )
+    return str(corpus.csv_path)
@@ -0,0 +1,413 @@
+"""Container bootstrap: every pre-start step in one interpreter with one engine.
+
+entrypoint.sh가 단계마다 ``python -``/``python -m``을 새로 띄우던 것(매번 SQLAlchemy import +
+엔진 생성)을 하나로 합쳤다. 모든 단계가 ``backend_api.app.db.database.engine`` 하나를 공유하고,
+끝나면 단계별 소요 시간을 표로 출력한다.
+
+1. DB 대기 (``select 1``, 지수 백오프)
+2. Alembic (버전 테이블 없이 job_post만 있으면 stamp 후 ``upgrade head``)
+3. PostGIS/pgvector extension 확인 (없으면 exit 1)
+4. ``user.last_login`` DDL, SQLModel ``create_all``
+5. ``job_post.work_days`` → JSON (``ALTER ... TYPE json USING``으로 한 문장에 변환)
+6. 관리자 계정 보장 (``AUTO_ADMIN_ENABLED``)
+7. 데모 공고 시드 + 임베딩. 시드 파일/임베딩 CSV/옵션의 fingerprint가 지난번 성공 때와 같고
+   ai_seed 공고가 남아 있으면 건너뛴다 (``app_bootstrap_state`` 테이블에 저장).
+
+1~3은 실패하면 중단하고, 나머지는 경고만 남기고 계속한다 (기존 entrypoint와 동일).
+
+    python -m backend_api.bootstrap
+    python -m backend_api.bootstrap --force-seed      # fingerprint가 같아도 다시 시드
+    python -m backend_api.bootstrap --skip-seed
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from backend_api.app.db.database import create_db_and_tables, engine
+
+
+ROOT = Path(__file__).resolve().parents[1]
+ALEMBIC_INI = ROOT / "backend_api" / "alembic.ini"
+ALEMBIC_SCRIPTS = ROOT / "backend_api" / "app" / "db" / "migrations"
+# alembic 도입 이전에 create_all로 만든 DB를 stamp할 리비전
+ALEMBIC_HEAD_REV = "20251203_01"
+REQUIRED_EXTENSIONS = ("postgis", "vector")
+
+DEFAULT_ADMIN_PHONE = "01000000000"
+DEFAULT_ADMIN_PIN = "0000"
+DEFAULT_SEED_PATH = "ai_modeling/data_samples/demo_jobs_50.json"
+DEFAULT_EMBEDDING_PATH = "ai_modeling/data_samples/demo_jobs_50_with_embeddings.csv"
+NAVER_GEOCODE_CACHE = Path(".naver_geocode_cache.json")
+SEED_STATE_KEY = "seed_jobs_fingerprint"
+
+
+def _log(message: str, *, err: bool = False) -> None:
+    print(f"[bootstrap] {message}", file=sys.stderr if err else sys.stdout, flush=True)
+
+
+def _bool_env(name: str, default: bool) -> bool:
+    raw = (os.getenv(name) or "").strip()
+    if not raw:
+        return default
+    return raw.lower() in ("true", "1", "yes")
+
+
+def _is_postgres(db_engine: Engine) -> bool:
+    return db_engine.url.get_backend_name() == "postgresql"
+
+
+class StepTimer:
+    """Runs bootstrap steps, records (name, status, seconds) and prints the summary table."""
+
+    def __init__(self) -> None:
+        self.rows: List[Tuple[str, str, float]] = []
+
+    def run(self, name: str, fn: Callable[[], Optional[str]], *, required: bool = False) -> Optional[str]:
+        start = time.perf_counter()
+        try:
+            status = fn() or "ok"
+        except (Exception, SystemExit) as exc:
+            elapsed = time.perf_counter() - start
+            self.rows.append((name, "failed" if required else "warn", elapsed))
+            if required:
+                _log(f"{name} failed: {exc}", err=True)
+                self.report()
+                raise
+            _log(f"[WARN] {name} failed (continuing): {exc}", err=True)
+            return None
+        elapsed = time.perf_counter() - start
+        self.rows.append((name, status, elapsed))
+        _log(f"{name}: {status} ({elapsed * 1000:.0f}ms)")
+        return status
+
+    def report(self) -> None:
+        width = max([len(name) for name, _, _ in self.rows] + [4])
+        _log(f"{'step':<{width}}  {'ms':>8}  status")
+        for name, status, elapsed in self.rows:
+            _log(f"{name:<{width}}  {elapsed * 1000:>8.0f}  {status}")
+        total = sum(elapsed for _, _, elapsed in self.rows)
+        _log(f"{'total':<{width}}  {total * 1000:>8.0f}")
+
+
+# ---------- steps ----------
+
+
+def wait_for_db(db_engine: Engine, attempts: int = 12) -> str:
+    for attempt in range(attempts):
+        try:
+            with db_engine.connect() as conn:
+                conn.execute(text("select 1"))
+            return "ok" if attempt == 0 else f"ok after {attempt + 1} tries"
+        except Exception as exc:
+            if attempt == attempts - 1:
+                raise SystemExit(f"DB not ready (timeout): {exc}")
+            _log(f"wait {attempt + 1}: not ready: {exc}")
+            time.sleep(min(2**attempt, 10))
+    return "ok"
+
+
+def run_migrations(db_engine: Engine) -> str:
+    # alembic은 이 단계에서만 필요하다. env.py는 넘겨준 연결을 그대로 쓴다.
+    from alembic import command
+    from alembic.config import Config
+
+    cfg = Config(str(ALEMBIC_INI))
+    cfg.set_main_option("script_location", str(ALEMBIC_SCRIPTS))
+    cfg.attributes["configure_logger"] = False
+
+    status = "ok"
+    with db_engine.begin() as conn:
+        cfg.attributes["connection"] = conn
+        if _is_postgres(db_engine):
+            has_version = conn.execute(text("SELECT to_regclass('public.alembic_version')")).scalar()
+            has_job_post = conn.execute(text("SELECT to_regclass('public.job_post')")).scalar()
+            if not has_version and has_job_post:
+                _log(f"alembic_version missing but job_post exists; stamping {ALEMBIC_HEAD_REV}")
+                command.stamp(cfg, ALEMBIC_HEAD_REV)
+                status = f"stamped {ALEMBIC_HEAD_REV}"
+        command.upgrade(cfg, "head")
+    return status
+
+
+def check_extensions(db_engine: Engine) -> str:
+    if not _is_postgres(db_engine):
+        return "skipped (not postgres)"
+    with db_engine.connect() as conn:
+        rows = conn.execute(
+            text("SELECT extname FROM pg_extension WHERE extname IN ('postgis','vector')")
+        ).fetchall()
+    exts = {row[0] for row in rows}
+    missing = [name for name in REQUIRED_EXTENSIONS if name not in exts]
+    if missing:
+        _log("Missing extensions: " + ", ".join(missing), err=True)
+        _log(
+            "PostGIS/pgvector extension missing. "
+            "DB 이미지를 --build로 다시 올리세요 (docker/postgres.Dockerfile 확인).",
+            err=True,
+        )
+        raise SystemExit(1)
+    return ", ".join(sorted(exts))
+
+
+_LAST_LOGIN_DDL = """
+DO $$
+BEGIN
+   IF to_regclass('public.user') IS NOT NULL THEN
+      ALTER TABLE "user" ADD COLUMN IF NOT EXISTS last_login timestamp without time zone;
+      ALTER TABLE "user" ALTER COLUMN last_login DROP NOT NULL;
+      ALTER TABLE "user" ALTER COLUMN last_login SET DEFAULT NOW();
+   END IF;
+END $$;
+"""
+
+
+def ensure_last_login(db_engine: Engine) -> str:
+    if not _is_postgres(db_engine):
+        return "skipped (not postgres)"
+    with db_engine.begin() as conn:
+        conn.exec_driver_sql(_LAST_LOGIN_DDL)
+    return "ok"
+
+
+def ensure_tables() -> str:
+    create_db_and_tables()
+    return "ok"
+
+
+# 과거 VARCHAR work_days 값 → JSON 배열. 예전 Python 루프와 같은 규칙:
+# 비었으면 [], JSON 배열이면 빈 값을 뺀 요소들, JSON이지만 배열이 아니면 [], JSON이 아니면 쉼표로 분리.
+_WORK_DAYS_FN = """
+CREATE OR REPLACE FUNCTION pg_temp.ilowa_work_days_json(raw text) RETURNS json
+LANGUAGE plpgsql IMMUTABLE AS $$
+DECLARE
+    parsed json;
+BEGIN
+    IF raw IS NULL OR btrim(raw) = '' THEN
+        RETURN '[]'::json;
+    END IF;
+    BEGIN
+        parsed := btrim(raw)::json;
+    EXCEPTION WHEN others THEN
+        RETURN coalesce(
+            (SELECT json_agg(btrim(seg) ORDER BY n)
+               FROM unnest(string_to_array(raw, ',')) WITH ORDINALITY AS t(seg, n)
+              WHERE btrim(seg) <> ''),
+            '[]'::json);
+    END;
+    IF json_typeof(parsed) <> 'array' THEN
+        RETURN '[]'::json;
+    END IF;
+    RETURN coalesce(
+        (SELECT json_agg(elem ORDER BY n)
+           FROM json_array_elements_text(parsed) WITH ORDINALITY AS t(elem, n)
+          WHERE coalesce(elem, '') <> ''),
+        '[]'::json);
+END $$;
+"""
+
+
+def migrate_work_days(db_engine: Engine) -> str:
+    """job_post.work_days를 JSON으로 강제 (과거 VARCHAR(10) 호환). 행 단위 UPDATE 없이 한 문장으로 변환."""
+    if not _is_postgres(db_engine):
+        return "skipped (not postgres)"
+    with db_engine.begin() as conn:
+        data_type = conn.execute(
+            text(
+                """
+                SELECT data_type
+                FROM information_schema.columns
+                WHERE table_name = 'job_post'
+                  AND column_name = 'work_days'
+                """
+            )
+        ).scalar()
+        if not data_type:
+            return "skipped (column missing)"
+        if data_type.lower() in ("json", "jsonb"):
+            return "already json"
+
+        raw_expr = "array_to_string(work_days, ',')" if data_type.upper() == "ARRAY" else "work_days::text"
+        _log(f"Migrating job_post.work_days from {data_type} to JSON")
+        conn.exec_driver_sql(_WORK_DAYS_FN)
+        conn.exec_driver_sql("ALTER TABLE job_post ALTER COLUMN work_days DROP DEFAULT")
+        conn.exec_driver_sql(
+            "ALTER TABLE job_post ALTER COLUMN work_days TYPE json "
+            f"USING pg_temp.ilowa_work_days_json({raw_expr})"
+        )
+        conn.exec_driver_sql("ALTER TABLE job_post ALTER COLUMN work_days SET DEFAULT '[]'::json")
+        conn.exec_driver_sql("ALTER TABLE job_post ALTER COLUMN work_days SET NOT NULL")
+        conn.exec_driver_sql("DROP FUNCTION IF EXISTS pg_temp.ilowa_work_days_json(text)")
+    return f"migrated {data_type} -> json"
+
+
+def ensure_admin_user(id_file: Optional[Path]) -> str:
+    from backend_api.scripts.ensure_admin import ensure_admin
+
+    phone = (os.getenv("ADMIN_PHONE") or DEFAULT_ADMIN_PHONE).strip()
+    pin = (os.getenv("ADMIN_PIN") or DEFAULT_ADMIN_PIN).strip()
+    admin_id = ensure_admin(phone, pin)
+    # 시드 단계의 owner 폴백 (import_ai_jobs도 ADMIN_USER_ID를 본다)
+    os.environ["ADMIN_USER_ID"] = str(admin_id)
+    if id_file is not None:
+        id_file.write_text(str(admin_id), encoding="utf-8")
+    return f"admin_id={admin_id}"
+
+
+# ---------- seeding ----------
+
+
+_STATE_DDL = """
+CREATE TABLE IF NOT EXISTS app_bootstrap_state (
+    key VARCHAR(64) PRIMARY KEY,
+    value TEXT NOT NULL,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def _file_digest(path: Path) -> str:
+    if not path.is_file():
+        return "missing"
+    digest = hashlib.sha256()
+    with path.open("rb") as fp:
+        for chunk in iter(lambda: fp.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def seed_fingerprint(seed_path: Path, embedding_path: Path, options: dict) -> str:
+    payload = {
+        "seed": _file_digest(seed_path),
+        "embeddings": _file_digest(embedding_path),
+        "options": options,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _read_state(db_engine: Engine, key: str) -> Optional[str]:
+    with db_engine.begin() as conn:
+        conn.execute(text(_STATE_DDL))
+        return conn.execute(
+            text("SELECT value FROM app_bootstrap_state WHERE key = :key"), {"key": key}
+        ).scalar()
+
+
+def _write_state(db_engine: Engine, key: str, value: str) -> None:
+    with db_engine.begin() as conn:
+        conn.execute(text("DELETE FROM app_bootstrap_state WHERE key = :key"), {"key": key})
+        conn.execute(
+            text("INSERT INTO app_bootstrap_state (key, value) VALUES (:key, :value)"),
+            {"key": key, "value": value},
+        )
+
+
+def _has_seeded_jobs(db_engine: Engine) -> bool:
+    with db_engine.connect() as conn:
+        return conn.execute(text("SELECT 1 FROM job_post WHERE source = 'ai_seed' LIMIT 1")).first() is not None
+
+
+def seed_jobs(db_engine: Engine, *, force: bool) -> str:
+    owner = (os.getenv("SEED_JOBS_OWNER_ID") or os.getenv("ADMIN_USER_ID") or "").strip()
+    if not owner:
+        return "skipped (no owner)"
+
+    seed_path = Path(os.getenv("SEED_JOBS_JSON") or os.getenv("SEED_JOBS_CSV") or DEFAULT_SEED_PATH)
+    if not seed_path.is_file():
+        _log(f"⚠️  SEED owner configured but CSV not found at {seed_path}", err=True)
+        return "skipped (seed file missing)"
+    embedding_path = Path(os.getenv("SEED_JOBS_EMBEDDINGS_CSV") or DEFAULT_EMBEDDING_PATH)
+
+    clear = _bool_env("SEED_JOBS_CLEAR", True)
+    limit_raw = (os.getenv("SEED_JOBS_LIMIT") or "").strip()
+    limit = int(limit_raw) if limit_raw else None
+    naver = google = False
+    if _bool_env("SEED_JOBS_GEOCODE", True):
+        naver = bool(os.getenv("NAVER_MAPS_CLIENT_ID") and os.getenv("NAVER_MAPS_CLIENT_SECRET"))
+        google = bool(os.getenv("GOOGLE_GEOCODING_API_KEY") or os.getenv("GOOGLE_GEOCODING"))
+        if not (naver or google):
+            _log("⚠️  Geocode requested but no NAVER or GOOGLE keys available; skipping.")
+
+    fingerprint = seed_fingerprint(
+        seed_path,
+        embedding_path,
+        {"owner": owner, "clear": clear, "limit": limit, "naver": naver, "google": google},
+    )
+    if not force and _read_state(db_engine, SEED_STATE_KEY) == fingerprint and _has_seeded_jobs(db_engine):
+        return "skipped (fingerprint unchanged)"
+
+    from backend_api.scripts.import_ai_jobs import import_jobs
+
+    _log(f"Seeding AI jobs from {seed_path} (owner={owner})")
+    inserted = import_jobs(
+        csv_path=seed_path,
+        owner=owner,
+        limit=limit,
+        clear=clear,
+        geocode=naver,
+        google_geocode=google,
+        cache=NAVER_GEOCODE_CACHE,
+    )
+    status = f"inserted {inserted}"
+
+    if embedding_path.is_file():
+        from backend_api.scripts.import_ai_job_embeddings import update_embeddings
+
+        updated, skipped, _ = update_embeddings(embedding_path)
+        status += f", embeddings {updated} (skipped={skipped})"
+    else:
+        _log(f"⚠️  Embedding CSV not found at {embedding_path}", err=True)
+
+    # 시드와 임베딩이 모두 끝난 뒤에만 기록한다. 중간에 실패하면 다음 기동 때 다시 시드한다.
+    _write_state(db_engine, SEED_STATE_KEY, fingerprint)
+    return status
+
+
+# ---------- entry ----------
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run container bootstrap steps in one process")
+    parser.add_argument("--skip-seed", action="store_true", help="Skip demo job seeding")
+    parser.add_argument(
+        "--force-seed",
+        action="store_true",
+        default=_bool_env("SEED_JOBS_FORCE", False),
+        help="Seed even if the seed fingerprint is unchanged (env: SEED_JOBS_FORCE)",
+    )
+    parser.add_argument("--admin-id-file", type=Path, help="Write the admin UUID to this file")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    _log(f"database={engine.url.render_as_string(hide_password=True)}")
+
+    timer = StepTimer()
+    timer.run("wait_db", lambda: wait_for_db(engine), required=True)
+    timer.run("migrations", lambda: run_migrations(engine), required=True)
+    timer.run("extensions", lambda: check_extensions(engine), required=True)
+    timer.run("last_login_ddl", lambda: ensure_last_login(engine))
+    timer.run("create_tables", ensure_tables)
+    timer.run("work_days_json", lambda: migrate_work_days(engine))
+    if _bool_env("AUTO_ADMIN_ENABLED", True):
+        timer.run("ensure_admin", lambda: ensure_admin_user(args.admin_id_file))
+    if not args.skip_seed:
+        timer.run("seed_jobs", lambda: seed_jobs(engine, force=args.force_seed))
+    timer.report()
+    engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Gunicorn settings for ``SERVE_MODE=prod`` (entrypoint.sh).
+
+    gunicorn -c backend_api/gunicorn.conf.py backend_api.app.main:app
+
+uvicorn 워커(``UvicornWorker``)를 ``WEB_CONCURRENCY``개 prefork한다. ``GUNICORN_PRELOAD=true``(기본)면
+마스터가 앱을 import하고 ``when_ready``에서 공고 CSV/임베딩 행렬(``RAGCorpus``)까지 읽은 뒤 fork하므로
+워커들은 그 메모리를 copy-on-write로 공유한다. 워커별 RSS/PSS는
+``backend_api/scripts/bench_worker_memory.py``로 잰다.
+"""
+
+import gc
+import os
+
+
+def _bool_env(name: str, default: bool) -> bool:
+    raw = (os.getenv(name) or "").strip().lower()
+    if not raw:
+        return default
+    return raw in ("1", "true", "yes")
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+# 워커마다 provider 동시 호출 한도(AI_*_CONCURRENCY)와 DB 풀을 따로 가진다. 기본은 CPU 수(최대 4).
+workers = int(os.getenv("WEB_CONCURRENCY") or min(os.cpu_count() or 1, 4))
+preload_app = _bool_env("GUNICORN_PRELOAD", True)
+# LLM/OCR 호출이 길 수 있어 워커 heartbeat 타임아웃을 넉넉하게 둔다.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+accesslog = None
+errorlog = "-"
+loglevel = os.getenv("LOG_LEVEL", "info").lower()
+
+
+def when_ready(server):
+    """Master, after preloading the app and before the first fork."""
+    if not preload_app:
+        return
+    if _bool_env("AI_PRELOAD_CORPUS", True):
+        from backend_api.app.services.warmup import preload_corpus
+
+        try:
+            preload_corpus()
+        except Exception as exc:
+            # 워커 워밍업/첫 요청에서 다시 시도하므로 기동은 막지 않는다.
+            server.log.warning("RAG corpus preload failed: %s", exc)
+    # 지금까지 만든 객체를 GC 추적에서 빼서, 워커의 GC가 공유 페이지를 건드려 복사하지 않게 한다.
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # 마스터에서 만든 엔진의 커넥션 풀을 워커가 이어 쓰지 않게 비운다 (소켓 공유 방지).
+    if preload_app:
+        from backend_api.app.db.database import engine
+
+        engine.dispose(close=False)
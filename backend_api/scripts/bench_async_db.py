@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""Mixed-load benchmark: sync Session vs AsyncSession inside ``async def`` handlers.
+
+같은 이벤트 루프에서 DB 요청(사용자 PK 조회 + 선택적 지연)과 DB를 쓰지 않는 가벼운 요청
+(health check 같은)을 동시에 돌린다.
+
+- sync  : async 핸들러가 ``Session(engine)``을 그대로 호출하던 이전 방식 (루프가 DB 왕복 동안 멈춤)
+- async : ``get_async_db``와 같은 ``AsyncSession(get_async_engine())`` 사용
+
+DB 요청 처리량과 가벼운 요청의 지연(p50/p95)을 비교한다. Postgres에서는 ``--db-latency-ms``로
+``pg_sleep``을 섞어 네트워크/쿼리 지연을 흉내 낼 수 있다.
+
+    python backend_api/scripts/bench_async_db.py --requests 400 --concurrency 32 --db-latency-ms 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sqlalchemy import text  # noqa: E402
+from sqlmodel import Session  # noqa: E402
+from sqlmodel.ext.asyncio.session import AsyncSession  # noqa: E402
+
+from backend_api.app.db.database import (  # noqa: E402
+    dispose_async_engine,
+    engine,
+    get_async_engine,
+)
+from backend_api.app.db.models.auth import User  # noqa: E402
+
+MODES = ("sync", "async")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async DB sessions under mixed load")
+    parser.add_argument("--requests", type=int, default=400, help="DB requests per mode")
+    parser.add_argument("--concurrency", type=int, default=32, help="Concurrent DB requests")
+    parser.add_argument("--light-interval-ms", type=float, default=5.0, help="Gap between light (non-DB) requests")
+    parser.add_argument("--db-latency-ms", type=float, default=0.0, help="Extra pg_sleep per DB request (Postgres only)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    return parser.parse_args()
+
+
+def _latency_sql(latency_ms: float):
+    if latency_ms <= 0 or engine.url.get_backend_name() != "postgresql":
+        return None
+    return text(f"SELECT pg_sleep({latency_ms / 1000.0:.4f})")
+
+
+async def _sync_request(user_id: uuid.UUID, latency_sql) -> None:
+    # 이전 핸들러와 동일: async def 안에서 동기 세션 호출
+    with Session(engine) as session:
+        if latency_sql is not None:
+            session.connection().execute(latency_sql)
+        session.get(User, user_id)
+
+
+async def _async_request(user_id: uuid.UUID, latency_sql) -> None:
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        if latency_sql is not None:
+            connection = await session.connection()
+            await connection.execute(latency_sql)
+        await session.get(User, user_id)
+
+
+async def _light_requests(stop: asyncio.Event, interval: float, latencies: List[float]) -> None:
+    """DB를 쓰지 않는 요청을 일정 간격으로 예약하고, 예약 시각보다 얼마나 늦게 실행됐는지 기록한다."""
+    scheduled = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+        scheduled += interval
+
+
+async def _run_mode(mode: str, args: argparse.Namespace) -> Dict[str, float]:
+    handler = _sync_request if mode == "sync" else _async_request
+    latency_sql = _latency_sql(args.db_latency_ms)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def _one() -> None:
+        async with semaphore:
+            await handler(uuid.uuid4(), latency_sql)
+
+    # 커넥션 풀 워밍업
+    await handler(uuid.uuid4(), None)
+
+    light: List[float] = []
+    stop = asyncio.Event()
+    light_task = asyncio.create_task(_light_requests(stop, args.light_interval_ms / 1000.0, light))
+    started = time.perf_counter()
+    await asyncio.gather(*(_one() for _ in range(args.requests)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await light_task
+
+    light.sort()
+    p95 = light[min(len(light) - 1, int(len(light) * 0.95))] if light else 0.0
+    return {
+        "db_rps": args.requests / elapsed if elapsed else 0.0,
+        "elapsed_s": elapsed,
+        "light_count": float(len(light)),
+        "light_p50_ms": statistics.median(light) if light else 0.0,
+        "light_p95_ms": p95,
+    }
+
+
+async def _main(args: argparse.Namespace) -> None:
+    print(f"[bench_async_db] backend={engine.url.get_backend_name()} requests={args.requests} "
+          f"concurrency={args.concurrency} db_latency_ms={args.db_latency_ms}")
+    results: Dict[str, Dict[str, float]] = {}
+    try:
+        for mode in args.modes:
+            results[mode] = await _run_mode(mode, args)
+    finally:
+        await dispose_async_engine()
+
+    print(f"{'mode':<6} {'db req/s':>10} {'elapsed s':>10} {'light n':>8} {'light p50 ms':>13} {'light p95 ms':>13}")
+    for mode, row in results.items():
+        print(
+            f"{mode:<6} {row['db_rps']:>10.1f} {row['elapsed_s']:>10.2f} {int(row['light_count']):>8} "
+            f"{row['light_p50_ms']:>13.2f} {row['light_p95_ms']:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(_parse_args()))
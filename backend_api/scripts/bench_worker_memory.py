@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+"""RSS/PSS per worker vs worker count for ``SERVE_MODE=prod`` (gunicorn + UvicornWorker).
+
+워커 수(``--workers``)와 preload 여부(``--modes``)별로 gunicorn을 띄우고, 모든 워커의 AI 워밍업이
+끝날 때까지 ``/ready``를 확인한 뒤 ``/proc/<pid>/smaps_rollup``에서 메모리를 읽는다.
+
+- RSS: 공유 페이지를 워커마다 중복해서 센 값 (워커 수만큼 더하면 과대 계산)
+- PSS: 공유 페이지를 나눠 가진 몫. 프로세스 합계가 실제 사용량에 가깝다.
+- USS: 그 워커만 가진 페이지 (Private_Clean + Private_Dirty) — 워커 하나를 늘릴 때 드는 비용
+
+preload에서는 공고 CSV/임베딩 행렬이 마스터에서 한 번 만들어져 공유되므로, 워커 수가 늘 때
+합계 PSS 증가폭(≈ 워커당 USS)이 no-preload보다 작아야 한다. Linux 전용(/proc).
+
+    python backend_api/scripts/bench_worker_memory.py --workers 1 2 4
+    python backend_api/scripts/bench_worker_memory.py --workers 2 4 8 --modes preload
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ROOT = Path(__file__).resolve().parents[2]
+GUNICORN_CONF = ROOT / "backend_api" / "gunicorn.conf.py"
+MODES = ("preload", "no-preload")
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure per-worker memory of the prod server")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to try")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES), help="Preload on/off")
+    parser.add_argument("--port", type=int, default=18080, help="Port to bind on 127.0.0.1")
+    parser.add_argument("--timeout", type=float, default=180.0, help="Seconds to wait for all workers to be ready")
+    parser.add_argument("--settle", type=float, default=2.0, help="Seconds to wait after ready before sampling")
+    return parser.parse_args()
+
+
+def _memory_kb(pid: int) -> Dict[str, int]:
+    """Rss/Pss/Uss in kB from smaps_rollup (Pss/Uss are 0 when the kernel does not expose it)."""
+    fields: Dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", encoding="utf-8") as fp:
+            for line in fp:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                    fields[parts[0][:-1]] = int(parts[1])
+    except OSError:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as fp:
+            for line in fp:
+                if line.startswith("VmRSS:"):
+                    fields["Rss"] = int(line.split()[1])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    }
+
+
+def _children(parent: int) -> List[int]:
+    pids: List[int] = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as fp:
+                # pid (comm) state ppid ... — comm에 공백이 있을 수 있어 마지막 ')' 뒤를 자른다.
+                ppid = int(fp.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == parent:
+            pids.append(int(entry))
+    return sorted(pids)
+
+
+def _ready(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=3) as resp:
+            return resp.status == 200
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+def _wait_ready(proc: subprocess.Popen, url: str, workers: int, timeout: float) -> None:
+    # /ready는 아무 워커나 받으므로 연속 성공이 워커 수의 3배가 될 때까지 본다.
+    deadline = time.monotonic() + timeout
+    streak = 0
+    while streak < workers * 3:
+        if proc.poll() is not None:
+            raise SystemExit(f"[bench_worker_memory] gunicorn exited early (code {proc.returncode})")
+        if time.monotonic() > deadline:
+            raise SystemExit(f"[bench_worker_memory] workers not ready within {timeout:.0f}s")
+        if _ready(url):
+            streak += 1
+        else:
+            streak = 0
+            time.sleep(0.5)
+
+
+def _measure(mode: str, workers: int, args: argparse.Namespace) -> Optional[Dict[str, float]]:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])),
+        "GUNICORN_PRELOAD": "true" if mode == "preload" else "false",
+        "AI_WARMUP_ENABLED": "true",
+    }
+    cmd = [
+        sys.executable, "-m", "gunicorn",
+        "-c", str(GUNICORN_CONF),
+        "--bind", f"127.0.0.1:{args.port}",
+        "--workers", str(workers),
+        "backend_api.app.main:app",
+    ]
+    proc = subprocess.Popen(cmd, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_ready(proc, f"http://127.0.0.1:{args.port}/ready", workers, args.timeout)
+        time.sleep(args.settle)
+        master = _memory_kb(proc.pid)
+        worker_pids = _children(proc.pid)
+        if not worker_pids:
+            print(f"[bench_worker_memory] {mode} x{workers}: no worker processes found")
+            return None
+        per_worker = [_memory_kb(pid) for pid in worker_pids]
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        try:
+            proc.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    n = len(per_worker)
+    return {
+        "workers": n,
+        "master_rss": master["rss"] / 1024,
+        "worker_rss": sum(m["rss"] for m in per_worker) / n / 1024,
+        "worker_pss": sum(m["pss"] for m in per_worker) / n / 1024,
+        "worker_uss": sum(m["uss"] for m in per_worker) / n / 1024,
+        "total_rss": (master["rss"] + sum(m["rss"] for m in per_worker)) / 1024,
+        "total_pss": (master["pss"] + sum(m["pss"] for m in per_worker)) / 1024,
+    }
+
+
+def main() -> int:
+    args = _parse_args()
+    if not Path("/proc/self/stat").exists():
+        raise SystemExit("[bench_worker_memory] /proc is required (Linux only)")
+
+    print(
+        f"{'mode':<11} {'workers':>7} {'master RSS':>11} {'worker RSS':>11} {'worker PSS':>11} "
+        f"{'worker USS':>11} {'total RSS':>10} {'total PSS':>10}  (MB, worker = avg)"
+    )
+    for mode in args.modes:
+        for workers in args.workers:
+            row = _measure(mode, workers, args)
+            if row is None:
+                continue
+            print(
+                f"{mode:<11} {row['workers']:>7d} {row['master_rss']:>11.1f} {row['worker_rss']:>11.1f} "
+                f"{row['worker_pss']:>11.1f} {row['worker_uss']:>11.1f} {row['total_rss']:>10.1f} "
+                f"{row['total_pss']:>10.1f}",
+                flush=True,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""Import-time / RSS budget check for the API process (``python -X importtime``).
+
+새 인터프리터에서 ``backend_api.app.main``(또는 ``--module``)을 import하고
+
+- 전체 import 시간과 누적 시간이 큰 모듈 상위 N개,
+- import 직후 최대 RSS,
+- 기동 시 로드되면 안 되는 무거운 모듈(pandas, scikit-learn, PyMuPDF 등)이 끌려왔는지
+
+를 출력한다. 예산(``--max-ms``/``--max-rss-mb``)을 넘거나 금지 모듈이 로드되면 exit 1이므로
+CI/배포 전 점검에 그대로 쓴다.
+
+    python backend_api/scripts/check_import_time.py --max-ms 1500 --max-rss-mb 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[2]
+
+# AI 요청/업로드 처리 때 처음 필요해지는 모듈 (API 기동에는 필요 없음)
+DEFAULT_FORBIDDEN = (
+    "pandas",
+    "sklearn",
+    "scipy",
+    "bs4",
+    "fitz",
+    "PIL",
+    "ai_modeling.orchestration",
+    "ai_modeling.agents",
+)
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+_CHILD = """
+import resource, sys, importlib
+importlib.import_module(sys.argv[1])
+print("RSS_KB", resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+print("MODULES", " ".join(sorted(sys.modules)))
+"""
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check API import time, RSS and heavy imports")
+    parser.add_argument("--module", default="backend_api.app.main", help="Module to import")
+    parser.add_argument("--top", type=int, default=15, help="Show the N slowest modules (cumulative)")
+    parser.add_argument("--max-ms", type=float, default=0.0, help="Fail above this total import time (0 = no budget)")
+    parser.add_argument("--max-rss-mb", type=float, default=0.0, help="Fail above this max RSS after import (0 = no budget)")
+    parser.add_argument("--forbid", nargs="*", default=list(DEFAULT_FORBIDDEN), help="Modules that must not be imported")
+    return parser.parse_args()
+
+
+def _run(module: str) -> Tuple[List[Tuple[int, int, int, str]], int, List[str]]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, module],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        sys.stderr.write(proc.stderr[-4000:])
+        raise SystemExit(f"[check_import_time] importing {module} failed (exit {proc.returncode})")
+
+    rows: List[Tuple[int, int, int, str]] = []
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((int(self_us), int(cumulative_us), len(indent), name))
+
+    rss_kb = 0
+    modules: List[str] = []
+    for line in proc.stdout.splitlines():
+        if line.startswith("RSS_KB "):
+            rss_kb = int(line.split()[1])
+        elif line.startswith("MODULES "):
+            modules = line.split()[1:]
+    return rows, rss_kb, modules
+
+
+def main() -> int:
+    args = _parse_args()
+    rows, rss_kb, modules = _run(args.module)
+
+    # 들여쓰기가 가장 얕은 항목들이 최상위 import이고, 그 누적 시간의 합이 전체 import 시간이다.
+    min_indent = min((indent for _, _, indent, _ in rows), default=0)
+    total_ms = sum(cumulative for _, cumulative, indent, _ in rows if indent == min_indent) / 1000
+    rss_mb = rss_kb / 1024
+
+    print(f"[check_import_time] module={args.module} total={total_ms:.0f}ms max_rss={rss_mb:.1f}MB modules={len(modules)}")
+    print(f"{'cumulative ms':>14} {'self ms':>9}  module")
+    slowest = sorted(rows, key=lambda row: row[1], reverse=True)[: args.top]
+    for self_us, cumulative_us, _, name in slowest:
+        print(f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {name}")
+
+    loaded = set(modules)
+    forbidden: Dict[str, List[str]] = {}
+    for name in args.forbid:
+        hits = [m for m in loaded if m == name or m.startswith(name + ".")]
+        if hits:
+            forbidden[name] = hits
+
+    failed = False
+    if forbidden:
+        failed = True
+        for name, hits in sorted(forbidden.items()):
+            print(f"[check_import_time] FAIL: {name} imported at startup ({len(hits)} modules)")
+    if args.max_ms and total_ms > args.max_ms:
+        failed = True
+        print(f"[check_import_time] FAIL: import time {total_ms:.0f}ms > budget {args.max_ms:.0f}ms")
+    if args.max_rss_mb and rss_mb > args.max_rss_mb:
+        failed = True
+        print(f"[check_import_time] FAIL: max RSS {rss_mb:.1f}MB > budget {args.max_rss_mb:.1f}MB")
+    if not failed:
+        print("[check_import_time] OK")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
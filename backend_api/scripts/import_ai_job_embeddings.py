@@ -10,7 +10,7 @@ import json
 import re
 import sys
 from pathlib import Path
-from typing import Iterable, Optional, Sequence
+from typing import Iterable, Optional, Sequence, Tuple
 
 from sqlalchemy import text
 from sqlmodel import Session
@@ -65,14 +65,11 @@ def _vector_literal(values: Iterable[float]) -> str:
     return "[" + ", ".join(str(float(v)) for v in values) + "]"
 
 
-def main() -> None:
-    args = _parse_args()
-    csv_path = args.csv
+def update_embeddings(csv_path: Path, dim: int = DEFAULT_DIM) -> Tuple[int, int, int]:
+    """CSV의 임베딩으로 job_post.embedding을 갱신한다. (updated, skipped, missing_title)"""
     if not csv_path.exists():
         raise SystemExit(f"CSV not found: {csv_path}")
 
-    create_db_and_tables()
-
     with csv_path.open("r", encoding="utf-8-sig", newline="") as fp:
         reader = csv.DictReader(fp)
         if not reader.fieldnames:
@@ -105,7 +102,7 @@ def main() -> None:
                 if not vec:
                     skipped += 1
                     continue
-                if args.dim and len(vec) != args.dim:
+                if dim and len(vec) != dim:
                     skipped += 1
                     continue
                 vec_str = "[" + ",".join(map(str, vec)) + "]"
@@ -126,7 +123,13 @@ def main() -> None:
                 if batch_count % 50 == 0:
                     session.commit()
             session.commit()
+    return updated, skipped, missing_title
 
+
+def main() -> None:
+    args = _parse_args()
+    create_db_and_tables()
+    updated, skipped, missing_title = update_embeddings(args.csv, args.dim)
     print(
         f"[import_ai_job_embeddings] Updated {updated} embeddings "
         f"(skipped={skipped}, missing_title={missing_title})"
@@ -160,37 +160,67 @@ def _ensure_schema_ready(session: Session) -> None:
         )
 
 
-def main() -> None:
-    args = parse_args()
-    if args.ensure_schema:
+def import_jobs(
+    *,
+    csv_path: Path,
+    owner: Optional[str] = None,
+    owner_phone: Optional[str] = None,
+    admin_pin: Optional[str] = None,
+    allow_autocreate: bool = True,
+    limit: Optional[int] = None,
+    clear: bool = False,
+    ensure_schema: bool = False,
+    geocode: bool = False,
+    google_geocode: bool = False,
+    cache: Path = Path(".naver_geocode_cache.json"),
+) -> int:
+    """CLI와 ``backend_api.bootstrap``이 같이 쓰는 본체. 삽입한 공고 수를 돌려준다."""
+    if ensure_schema:
         create_db_and_tables()
 
     geocoders = []
-    if args.geocode:
-        geocoders.append(NaverGeocoder(cache_path=args.cache))
-    if args.google_geocode:
+    if geocode:
+        geocoders.append(NaverGeocoder(cache_path=cache))
+    if google_geocode:
         geocoders.append(GoogleGeocoder())
 
     with Session(engine) as session:
-        if not args.ensure_schema:
+        if not ensure_schema:
             _ensure_schema_ready(session)
         owner_id = _resolve_owner_uuid(
             session,
-            explicit_owner=args.owner,
-            owner_phone=args.owner_phone,
-            admin_pin=args.admin_pin,
-            allow_autocreate=not args.no_admin_autocreate,
+            explicit_owner=owner,
+            owner_phone=owner_phone,
+            admin_pin=admin_pin,
+            allow_autocreate=allow_autocreate,
         )
         print(f"[import_ai_jobs] owner={owner_id}")
-        inserted = seed_jobs_from_csv(
+        return seed_jobs_from_csv(
             session,
             owner_id=owner_id,
-            csv_path=args.csv,
-            limit=args.limit,
-            clear_existing=args.clear,
+            csv_path=csv_path,
+            limit=limit,
+            clear_existing=clear,
             geocoders=geocoders,
         )
-        print(f"Inserted {inserted} jobs")
+
+
+def main() -> None:
+    args = parse_args()
+    inserted = import_jobs(
+        csv_path=args.csv,
+        owner=args.owner,
+        owner_phone=args.owner_phone,
+        admin_pin=args.admin_pin,
+        allow_autocreate=not args.no_admin_autocreate,
+        limit=args.limit,
+        clear=args.clear,
+        ensure_schema=args.ensure_schema,
+        geocode=args.geocode,
+        google_geocode=args.google_geocode,
+        cache=args.cache,
+    )
+    print(f"Inserted {inserted} jobs")
 
 
 if __name__ == "__main__":
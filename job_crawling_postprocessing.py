@@ -73,7 +73,8 @@ def _call_llm_for_place(executor: CompletionExecutor, payload: Dict[str, str]) -
             {"role": "user", "content": prompt},
         ],
         "maxTokens": 200,
-        "temperature": 0.1,
+        # 결정적으로 두어 같은 공고를 다시 정제할 때 LLM 캐시를 탄다.
+        "temperature": 0.0,
         "topP": 0.9,
         "stream": False,
     }
@@ -346,7 +347,8 @@ def process_records(
     if fill_place:
         try:
             from ai_modeling.services.clova_llm import CompletionExecutor
-            executor = CompletionExecutor()
+            from ai_modeling.services.llm_cache import CachedCompletionExecutor
+            executor = CachedCompletionExecutor(CompletionExecutor())
         except ImportError:
             print("Warning: ai_modeling not found, skipping place filling.")
 